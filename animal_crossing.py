@@ -1,49 +1,249 @@
+import argparse
+import cProfile
+import re
+import time
 from pathlib import Path
+from typing import List, Optional
+from urllib.parse import unquote
+
 from loguru import logger
 
-from task2.data_manager import DataStructurer
-from task2.logger_config import LoggerConfigurator
+from task2.checkpoint import CrawlCheckpoint
+from task2.data_manager import CategoryAggregator, StreamingAggregator
+from task2.incremental import IncrementalAggregate
+from task2.logger_config import LOG_PROFILES, LoggerConfigurator
+from task2.metrics import MetricsHook, PipelineMetrics
 from task2.parser import WikiAnimalParser
-from task2.report_writer import CSVReportWriter
+from task2.pipeline import CrawlPipeline
+from task2.prefix_index import PrefixIndex, PrefixIndexBuilder
+from task2.report_writer import NAMING_SCHEMES, REPORT_FORMATS, ReportWriter
+
+DEFAULT_CATEGORY = "wiki/Категория:Животные_по_алфавиту"
 
 
-def main() -> None:
+def main(
+    argv: Optional[List[str]] = None, metrics_hook: Optional[MetricsHook] = None
+) -> None:
     """
     Main entry point for executing the Wikipedia animal parser pipeline.
 
+    The crawl is checkpointed; run with "--resume" to continue an interrupted crawl
+    from its last checkpoint instead of starting at the first page. With "--incremental",
+    the counts of the previous run are adjusted by the names of the changed pages only.
+    Several "--category" options, or "--subcategory-depth", crawl several categories
+    on one worker pool, with a combined report and a report per category.
+
     Pipeline steps:
         1. Configure logging system.
-        2. Initialize and run the Wikipedia Animal Parser.
-        3. Extract a list of animal names.
-        4. Group animal names by their first letter.
-        5. Save the summary to a CSV report.
+        2. Initialize and run the Wikipedia Animal Parser in a staged pipeline.
+        3. Extract animal names page by page while the next pages download.
+        4. Count unique animal names by their first letter as pages arrive.
+        5. Save the prefix index of the names and the summary CSV report.
+        6. Dump the per-stage metrics of the run to "task2/metrics/animal-crossing.json".
 
     Components:
         - LoggerConfigurator: Initializes file and console logging.
         - WikiAnimalParser: Scrapes data from Wikipedia.
-        - DataStructurer: Groups animal names by initial letter.
-        - CSVReportWriter: Writes the summary to a uniquely named CSV file.
+        - CrawlPipeline: Overlaps page downloads, extraction and aggregation.
+        - StreamingAggregator: Counts unique animal names by initial letter.
+        - PrefixIndex: Sorted names for count / list by prefix queries.
+        - ReportWriter: Streams the summary to a uniquely named CSV or JSON Lines file.
+        - PipelineMetrics: Per-page fetch, parse and aggregation metrics, write time.
+
+    With "--profile", the run is also profiled with cProfile, and the statistics are
+    saved next to the metrics for `python -m pstats`.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments, sys.argv if None.
+        metrics_hook (Optional[MetricsHook]): Called with the name and value of every
+            metric observation while the pipeline runs.
     """
+    argument_parser = argparse.ArgumentParser(description="Wikipedia animal parser")
+    argument_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the interrupted crawl from its last checkpoint.",
+    )
+    argument_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Update the counts of the previous run with the changed pages only.",
+    )
+    argument_parser.add_argument(
+        "--category",
+        dest="categories",
+        action="append",
+        metavar="RELATIVE_URL",
+        help=f"Start relative URL of a category to crawl, repeatable (default: {DEFAULT_CATEGORY}).",
+    )
+    argument_parser.add_argument(
+        "--subcategory-depth",
+        type=int,
+        default=0,
+        help="Levels of subcategories to crawl too.",
+    )
+    argument_parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Concurrent requests of a multi-category crawl.",
+    )
+    argument_parser.add_argument(
+        "--extract-processes",
+        type=int,
+        default=0,
+        help="Parse HTML in a pool of this many processes (threads if 0).",
+    )
+    argument_parser.add_argument(
+        "--report-format",
+        choices=REPORT_FORMATS,
+        default="csv",
+        help="Format of the summary report.",
+    )
+    argument_parser.add_argument(
+        "--report-naming",
+        choices=NAMING_SCHEMES,
+        default="index",
+        help='Unique report names: "beasts(N)" or timestamped.',
+    )
+    argument_parser.add_argument(
+        "--log-profile",
+        choices=LOG_PROFILES,
+        default="debug",
+        help='Logging profile: "production" logs INFO and up from a background thread.',
+    )
+    argument_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the run and save the cProfile statistics.",
+    )
+    args = argument_parser.parse_args(argv)
+    if args.resume and args.incremental:
+        argument_parser.error("--resume and --incremental cannot be combined")
+    categories = args.categories or [DEFAULT_CATEGORY]
+    multi_category = len(categories) > 1 or args.subcategory_depth > 0
+    if multi_category and (args.resume or args.incremental):
+        argument_parser.error(
+            "--resume and --incremental support a single category crawl only"
+        )
+
     # Setup logging
     log_file_path = Path(__file__).parent / "task2" / "logs" / "animal-crossing.log"
-    LoggerConfigurator(log_file=log_file_path).setup_logger()
+    LoggerConfigurator(log_file=log_file_path, profile=args.log_profile).setup_logger()
 
-    # Scrape data from Wikipedia
-    parser = WikiAnimalParser(base_url="https://ru.wikipedia.org/")
-    animal_names = parser.parse(relative_url="wiki/Категория:Животные_по_алфавиту")
+    metrics_dir = Path(__file__).parent / "task2" / "metrics"
+    metrics = PipelineMetrics(hook=metrics_hook)
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler is not None:
+        profiler.enable()
 
-    # Structure and group data
-    structurer = DataStructurer(data=animal_names)
-    grouped_animals = structurer.group_animals_by_first_letter()
+    # Scrape data from Wikipedia, revalidating the pages cached by the previous run
+    crawl_started = time.perf_counter()
+    with WikiAnimalParser(
+        base_url="https://ru.wikipedia.org/",
+        cache_dir=Path(__file__).parent / "task2" / "cache",
+        metrics=metrics,
+    ) as parser:
+        # Fetch, extract and aggregate pages in overlapped stages
+        pipeline = CrawlPipeline(parser, extract_processes=args.extract_processes)
+        category_letter_counts = {}
+        if multi_category:
+            # Crawl every category on one worker pool, deduplicating names across them
+            aggregator = CategoryAggregator(capitalize=False, metrics=metrics)
+            index_builder = PrefixIndexBuilder()
+            for category, page in parser.iter_category_pages(
+                categories,
+                max_workers=args.workers,
+                subcategory_depth=args.subcategory_depth,
+            ):
+                aggregator.add_page(category, page.page_names)
+                index_builder.add_many(page.page_names)
+            letter_counts = aggregator.combined.letter_counts
+            category_letter_counts = {
+                category: category_aggregator.letter_counts
+                for category, category_aggregator in aggregator.categories.items()
+            }
+            index = index_builder.build()
+        elif args.incremental:
+            # Update the counts of the previous run by the changed pages
+            aggregate = IncrementalAggregate(
+                Path(__file__).parent / "task2" / "state" / "beasts.json"
+            )
+            for page in pipeline.iter_page_records(relative_url=categories[0]):
+                with metrics.timer("aggregation_seconds"):
+                    aggregate.update_page(page.url, page.fingerprint, page.page_names)
+            aggregate.finish()
+            aggregate.save()
+            letter_counts = aggregate.letter_counts
+            index = PrefixIndex.from_names(
+                name for page in aggregate.pages.values() for name in page.names
+            )
+        else:
+            # Count unique names by first letter while the crawl runs
+            aggregator = StreamingAggregator(capitalize=False, metrics=metrics)
+            index_builder = PrefixIndexBuilder()
+            checkpoint = CrawlCheckpoint(
+                Path(__file__).parent / "task2" / "checkpoints"
+            )
+            for page_names in pipeline.iter_pages(
+                relative_url=categories[0],
+                checkpoint=checkpoint,
+                resume=args.resume,
+            ):
+                aggregator.add_many(page_names)
+                index_builder.add_many(page_names)
+            if args.resume:
+                # Names of the pages crawled before the interruption
+                aggregator.add_many(checkpoint.names())
+                index_builder.add_many(checkpoint.names())
+            letter_counts = aggregator.letter_counts
+            index = index_builder.build()
+        metrics.observe("crawl_seconds", time.perf_counter() - crawl_started)
+        metrics.set_info("scheduler", parser.scheduler.stats()._asdict())
+        metrics.set_info("parsed_pages_count", parser.parsed_pages_count)
+        metrics.set_info("extracted_names_count", parser.extracted_names_count)
 
-    # Write to CSV report
-    report_writer = CSVReportWriter(
-        report_dir=Path(__file__).parent / "task2" / "reports",
-        report_filename="beasts",
-    )
-    report_writer.write(df=grouped_animals)
+    # Save the prefix index for ad-hoc queries
+    index.save(Path(__file__).parent / "task2" / "state" / "beasts.index")
+
+    # Write the summary report, and one per category of a multi-category crawl
+    reports = [("beasts", letter_counts)] + [
+        (_category_report_name(category), counts)
+        for category, counts in category_letter_counts.items()
+    ]
+    for report_filename, counts in reports:
+        ReportWriter(
+            report_dir=Path(__file__).parent / "task2" / "reports",
+            report_filename=report_filename,
+            metrics=metrics,
+            report_format=args.report_format,
+            naming=args.report_naming,
+        ).write_rows(sorted(counts.items()), columns=["first_letter", "count"])
+
+    # Dump the metrics of the run
+    metrics.dump(metrics_dir / "animal-crossing.json")
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(metrics_dir / "animal-crossing.prof")
+    logger.info(f"Metrics saved to: {metrics_dir}")
 
     logger.success(f"Parsing completed successfully!")
+    # Flush the records still queued for the background sinks
+    logger.complete()
+
+
+def _category_report_name(category: str) -> str:
+    """
+    Names the report of a category after its title.
+
+    Args:
+        category (str): Start relative URL of the category, e.g. "wiki/Категория:Птицы".
+
+    Returns:
+        str: Report file name without extension, e.g. "beasts-Птицы".
+    """
+    title = unquote(category).rsplit(":", 1)[-1].rsplit("/", 1)[-1]
+    return "beasts-" + re.sub(r"\W+", "_", title).strip("_")
 
 
 if __name__ == "__main__":
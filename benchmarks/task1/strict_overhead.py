@@ -0,0 +1,210 @@
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from benchmarks.timing import (
+    environment,
+    find_regressions,
+    read_results,
+    time_statement,
+    write_results,
+)
+from task1.strict_modes import ModeLike, first_n, sample
+from task1.strict_types_decorator import strict
+
+BASELINE_FILE = Path(__file__).parent / "baselines" / "strict-overhead.json"
+RESULTS_FILE = Path(__file__).parents[1] / "results" / "strict-overhead.json"
+
+BATCH_SIZE = 10_000
+
+
+def _arity_1(a: int) -> int:
+    return a
+
+
+def _arity_2(a: int, b: int) -> int:
+    return a
+
+
+def _arity_4(a: int, b: int, c: int, d: int) -> int:
+    return a
+
+
+def _union(a: int | None) -> Optional[int]:
+    return a
+
+
+def _list(a: list[int]) -> list[int]:
+    return a
+
+
+def _dict(a: dict[str, float]) -> dict[str, float]:
+    return a
+
+
+def _tuple(a: tuple[int, ...]) -> tuple[int, ...]:
+    return a
+
+
+class OverheadCase(NamedTuple):
+    """
+    One measured call of a bare function and of its `strict` wrapper.
+
+    `statement` calls `func`, which is bound to the bare function or to the wrapper.
+    `rows` divides the timing of batch statements into per-row costs. `stats` wraps
+    with counters, to measure their cost.
+    """
+
+    name: str
+    func: Callable
+    statement: str
+    namespace: Dict[str, Any]
+    mode: ModeLike = "always"
+    bare_statement: Optional[str] = None
+    rows: int = 1
+    stats: bool = False
+
+
+def build_cases() -> List[OverheadCase]:
+    """
+    Lists the benchmark cases: arities, call styles, annotation kinds, modes and batches.
+
+    Returns:
+        List[OverheadCase]: The cases.
+    """
+    column = list(range(BATCH_SIZE))
+    return [
+        OverheadCase("arity-1/positional", _arity_1, "func(1)", {}),
+        OverheadCase("arity-2/positional", _arity_2, "func(1, 2)", {}),
+        OverheadCase("arity-2/keyword", _arity_2, "func(a=1, b=2)", {}),
+        OverheadCase("arity-4/positional", _arity_4, "func(1, 2, 3, 4)", {}),
+        OverheadCase("arity-4/keyword", _arity_4, "func(a=1, b=2, c=3, d=4)", {}),
+        OverheadCase("annotation/union", _union, "func(None)", {}),
+        OverheadCase("annotation/list-10", _list, "func(x)", {"x": list(range(10))}),
+        OverheadCase("annotation/list-1m", _list, "func(x)", {"x": list(range(10**6))}),
+        OverheadCase(
+            "annotation/dict-10",
+            _dict,
+            "func(x)",
+            {"x": {str(i): float(i) for i in range(10)}},
+        ),
+        OverheadCase("annotation/tuple-10", _tuple, "func(x)", {"x": tuple(range(10))}),
+        OverheadCase("mode/sample-1%", _arity_2, "func(1, 2)", {}, mode=sample(0.01)),
+        OverheadCase("mode/first_n-0", _arity_2, "func(1, 2)", {}, mode=first_n(0)),
+        OverheadCase("stats/always", _arity_2, "func(1, 2)", {}, stats=True),
+        OverheadCase(
+            "stats/sample-1%", _arity_2, "func(1, 2)", {}, mode=sample(0.01), stats=True
+        ),
+        OverheadCase(
+            "batch/map-10k",
+            _arity_2,
+            "func.map(x, x)",
+            {"x": column},
+            bare_statement="list(map(func, x, x))",
+            rows=BATCH_SIZE,
+        ),
+    ]
+
+
+def run(quick: bool = False) -> Dict[str, Any]:
+    """
+    Measures every case.
+
+    Args:
+        quick (bool): Fewer executions per case, for smoke runs.
+
+    Returns:
+        Dict[str, Any]: The environment and, per case, bare and strict ns per call,
+        the absolute overhead and the strict / bare ratio.
+    """
+    number, repeat = (10_000, 5) if quick else (50_000, 9)
+    cases: Dict[str, Dict[str, float]] = {}
+
+    for case in build_cases():
+        case_number = max(1, number // case.rows)
+        wrapped = strict(mode=case.mode, stats=case.stats)(case.func)
+
+        bare_namespace = dict(case.namespace, func=case.func)
+        strict_namespace = dict(case.namespace, func=wrapped)
+
+        # Interleaved runs, so that machine noise affects both sides alike.
+        bare_ns = strict_ns = float("inf")
+        for _ in range(repeat):
+            bare_ns = min(
+                bare_ns,
+                time_statement(
+                    case.bare_statement or case.statement,
+                    bare_namespace,
+                    case_number,
+                    repeat=1,
+                ),
+            )
+            strict_ns = min(
+                strict_ns,
+                time_statement(case.statement, strict_namespace, case_number, repeat=1),
+            )
+        bare_ns, strict_ns = bare_ns / case.rows, strict_ns / case.rows
+
+        cases[case.name] = {
+            "bare_ns": round(bare_ns, 2),
+            "strict_ns": round(strict_ns, 2),
+            "overhead_ns": round(strict_ns - bare_ns, 2),
+            "ratio": round(strict_ns / bare_ns, 3),
+        }
+
+    return {"environment": environment(), "cases": cases}
+
+
+def main() -> None:
+    """
+    Entry point of the `strict` overhead benchmark.
+
+    Writes the results as JSON and exits with code 1 if the strict / bare ratio of any
+    case regressed past the stored baseline by more than the tolerance.
+    """
+    argument_parser = argparse.ArgumentParser(description=main.__doc__)
+    argument_parser.add_argument("--output", type=Path, default=RESULTS_FILE)
+    argument_parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    argument_parser.add_argument("--tolerance", type=float, default=0.3)
+    argument_parser.add_argument("--quick", action="store_true")
+    argument_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of gating on it.",
+    )
+    args = argument_parser.parse_args()
+
+    results = run(quick=args.quick)
+    write_results(args.output, results)
+
+    for name, case in results["cases"].items():
+        print(
+            f"{name:<22} bare {case['bare_ns']:>10.1f} ns | strict {case['strict_ns']:>10.1f} ns"
+            f" | +{case['overhead_ns']:.1f} ns | x{case['ratio']:.2f}"
+        )
+    print(f"Results written to: {args.output}")
+
+    if args.update_baseline:
+        write_results(args.baseline, results)
+        print(f"Baseline updated: {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"No baseline found at {args.baseline}, nothing to compare")
+        return
+
+    regressions = find_regressions(
+        results["cases"],
+        read_results(args.baseline)["cases"],
+        metric="ratio",
+        tolerance=args.tolerance,
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
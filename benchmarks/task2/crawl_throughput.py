@@ -0,0 +1,301 @@
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Union
+
+from loguru import logger
+
+from benchmarks.timing import environment, find_regressions, read_results, write_results
+from task2.parser import DEFAULT_SHARD_PREFIXES, WikiAnimalParser
+from task2.pipeline import CrawlPipeline
+from tests.task2.corpus import RecordedCorpus
+from tests.task2.pages import CategoryFixture, synthetic_names
+from tests.task2.stand_in_server import StandInServer
+
+BASELINE_FILE = Path(__file__).parent / "baselines" / "crawl-throughput.json"
+RESULTS_FILE = Path(__file__).parents[1] / "results" / "crawl-throughput.json"
+
+MULTI_CATEGORIES = 4
+
+Source = Union[CategoryFixture, RecordedCorpus]
+
+
+class CrawlMode(NamedTuple):
+    """
+    One way to crawl a category with `WikiAnimalParser`.
+
+    `crawl` returns the names it collected. `synthetic_only` modes need synthetic
+    categories: the sharded crawl needs a server that answers "from=" start keys, and the
+    multi-category crawl needs the split categories, which recorded corpora do not have.
+    """
+
+    name: str
+    crawl: Callable[[WikiAnimalParser, Sequence[Source]], List[str]]
+    synthetic_only: bool = False
+
+
+def _crawl_sequential(parser: WikiAnimalParser, sources: Sequence[Source]) -> List[str]:
+    return parser.parse(relative_url=sources[0].start_path)
+
+
+def _crawl_sharded(parser: WikiAnimalParser, sources: Sequence[Source]) -> List[str]:
+    return parser.parse(
+        relative_url=sources[0].start_path,
+        shard_prefixes=DEFAULT_SHARD_PREFIXES,
+        max_workers=8,
+    )
+
+
+def _crawl_pipeline(parser: WikiAnimalParser, sources: Sequence[Source]) -> List[str]:
+    pipeline = CrawlPipeline(parser)
+    return [
+        name
+        for page_names in pipeline.iter_pages(sources[0].start_path)
+        for name in page_names
+    ]
+
+
+def _crawl_multi_category(
+    parser: WikiAnimalParser, sources: Sequence[Source]
+) -> List[str]:
+    return [
+        name
+        for _, page in parser.iter_category_pages(
+            [source.start_path for source in sources[1:]], max_workers=8
+        )
+        for name in page.page_names
+    ]
+
+
+MODES = [
+    CrawlMode("sequential", _crawl_sequential),
+    CrawlMode("sharded", _crawl_sharded, synthetic_only=True),
+    CrawlMode("pipeline", _crawl_pipeline),
+    CrawlMode("multi-category", _crawl_multi_category, synthetic_only=True),
+]
+
+
+def synthetic_sources(pages: int, page_size: int) -> List[CategoryFixture]:
+    """
+    Generates the crawled categories: one of `pages` pages, and the same names split
+    into `MULTI_CATEGORIES` categories for the multi-category mode.
+
+    Args:
+        pages (int): Number of listing pages of the main category.
+        page_size (int): Names per page.
+
+    Returns:
+        List[CategoryFixture]: The main category, then the split ones.
+    """
+    names = synthetic_names(pages * page_size)
+    category = CategoryFixture(names=names, page_size=page_size)
+    chunk = -(-len(category.names) // MULTI_CATEGORIES)
+    return [category] + [
+        CategoryFixture(
+            names=category.names[start : start + chunk],
+            page_size=page_size,
+            category=f"Категория:Часть_{index + 1}",
+        )
+        for index, start in enumerate(range(0, len(category.names), chunk))
+    ]
+
+
+def _expected_names(sources: Sequence[Source]) -> List[str]:
+    """Returns the names a complete crawl of the main category collects."""
+    source = sources[0]
+    if isinstance(source, RecordedCorpus):
+        return source.all_names
+    return source.names
+
+
+def measure(
+    mode: CrawlMode,
+    server: StandInServer,
+    sources: Sequence[Source],
+    repeat: int,
+    cached: bool = False,
+) -> Dict[str, float]:
+    """
+    Crawls with one mode and measures the best wall time.
+
+    Args:
+        mode (CrawlMode): The crawl mode.
+        server (StandInServer): The running stand-in server.
+        sources (Sequence[Source]): The served categories.
+        repeat (int): Number of crawls; the fastest one is kept.
+        cached (bool): Whether to measure revalidation crawls with a warm page cache.
+
+    Returns:
+        Dict[str, float]: Seconds, pages and names per second.
+
+    Raises:
+        AssertionError: If a crawl did not collect the expected names.
+    """
+    expected = sorted(_expected_names(sources))
+    best = float("inf")
+    pages = 0
+    with tempfile.TemporaryDirectory() as cache_dir:
+        if cached:
+            with WikiAnimalParser(server.base_url, cache_dir=cache_dir) as parser:
+                mode.crawl(parser, sources)
+
+        for _ in range(repeat):
+            with WikiAnimalParser(
+                server.base_url, cache_dir=cache_dir if cached else None
+            ) as parser:
+                started = time.perf_counter()
+                names = mode.crawl(parser, sources)
+                elapsed = time.perf_counter() - started
+
+            if sorted(names) != expected:
+                raise AssertionError(f"{mode.name} crawl collected other names")
+            best = min(best, elapsed)
+            pages = parser.parsed_pages_count
+
+    return {
+        "seconds": round(best, 4),
+        "pages_per_second": round(pages / best, 1),
+        "names_per_second": round(len(expected) / best, 1),
+    }
+
+
+def run(
+    quick: bool = False,
+    pages: int = 40,
+    page_size: int = 200,
+    latency: float = 0.01,
+    error_rate: float = 0.0,
+    corpus_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """
+    Measures the crawl throughput of every parser mode against a local stand-in server.
+
+    Args:
+        quick (bool): Fewer pages and crawls per mode, for smoke runs.
+        pages (int): Listing pages of the synthetic category.
+        page_size (int): Names per synthetic page.
+        latency (float): Server latency per response, in seconds.
+        error_rate (float): Share of responses the server fails with "503".
+        corpus_dir (Optional[Path]): Recorded corpus to crawl instead of synthetic
+            pages. Synthetic-only modes are skipped then.
+
+    Returns:
+        Dict[str, Any]: The environment, the scenario and, per mode, seconds, pages and
+        names per second and the speedup over the sequential crawl.
+    """
+    logger.remove()
+    repeat = 1 if quick else 3
+    if quick:
+        pages = min(pages, 10)
+
+    sources: List[Source]
+    if corpus_dir is not None:
+        sources = [RecordedCorpus.load(corpus_dir)]
+    else:
+        sources = synthetic_sources(pages, page_size)
+
+    cases: Dict[str, Dict[str, float]] = {}
+    with StandInServer(sources, latency=latency, error_rate=error_rate) as server:
+        for mode in MODES:
+            if mode.synthetic_only and corpus_dir is not None:
+                continue
+            cases[mode.name] = measure(mode, server, sources, repeat)
+        cases["sequential-cached"] = measure(
+            MODES[0], server, sources, repeat, cached=True
+        )
+
+    reference = cases["sequential"]["seconds"]
+    for case in cases.values():
+        case["speedup"] = round(reference / case["seconds"], 2)
+
+    scenario = {
+        "source": str(corpus_dir) if corpus_dir else "synthetic",
+        "pages": sources[0].pages_count,
+        "names": len(_expected_names(sources)),
+        "latency": latency,
+        "error_rate": error_rate,
+    }
+    return {"environment": environment(), "scenario": scenario, "cases": cases}
+
+
+def main() -> None:
+    """
+    Entry point of the offline crawl throughput benchmark.
+
+    Writes the results as JSON and exits with code 1 if the speedup of any mode over
+    the sequential crawl fell below the stored baseline by more than the tolerance.
+    """
+    argument_parser = argparse.ArgumentParser(description=main.__doc__)
+    argument_parser.add_argument("--output", type=Path, default=RESULTS_FILE)
+    argument_parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    argument_parser.add_argument("--tolerance", type=float, default=0.3)
+    argument_parser.add_argument("--quick", action="store_true")
+    argument_parser.add_argument("--pages", type=int, default=40)
+    argument_parser.add_argument("--page-size", type=int, default=200)
+    argument_parser.add_argument(
+        "--latency", type=float, default=0.01, help="Server latency, in seconds."
+    )
+    argument_parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Share of failed responses."
+    )
+    argument_parser.add_argument(
+        "--corpus",
+        type=Path,
+        default=None,
+        help="Recorded corpus directory to crawl instead of synthetic pages.",
+    )
+    argument_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of gating on it.",
+    )
+    args = argument_parser.parse_args()
+
+    results = run(
+        quick=args.quick,
+        pages=args.pages,
+        page_size=args.page_size,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        corpus_dir=args.corpus,
+    )
+    write_results(args.output, results)
+
+    for name, case in results["cases"].items():
+        print(
+            f"{name:<18} {case['pages_per_second']:>8.1f} pages/s"
+            f" | {case['names_per_second']:>10.1f} names/s | x{case['speedup']:.2f}"
+        )
+    print(f"Results written to: {args.output}")
+
+    if args.update_baseline:
+        write_results(args.baseline, results)
+        print(f"Baseline updated: {args.baseline}")
+        return
+
+    default_scenario = (
+        args.corpus is None
+        and (args.pages, args.page_size) == (40, 200)
+        and (args.latency, args.error_rate) == (0.01, 0.0)
+    )
+    if args.quick or not default_scenario or not args.baseline.exists():
+        print("No baseline for this scenario, nothing to compare")
+        return
+
+    regressions = find_regressions(
+        results["cases"],
+        read_results(args.baseline)["cases"],
+        metric="speedup",
+        tolerance=args.tolerance,
+        higher_is_better=True,
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
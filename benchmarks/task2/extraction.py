@@ -0,0 +1,150 @@
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from benchmarks.timing import (
+    environment,
+    find_regressions,
+    read_results,
+    time_statement,
+    write_results,
+)
+from task2.extractors import EXTRACTORS, SoupExtractor, get_extractor
+from tests.task2.pages import CategoryFixture, synthetic_names
+
+BASELINE_FILE = Path(__file__).parent / "baselines" / "extraction.json"
+RESULTS_FILE = Path(__file__).parents[1] / "results" / "extraction.json"
+
+
+def fixture_pages() -> Dict[str, str]:
+    """
+    Renders the default page set: listing pages of 200 names with navigation chrome.
+
+    Returns:
+        Dict[str, str]: Page HTML by page name.
+    """
+    category = CategoryFixture(
+        names=synthetic_names(1_000),
+        subcategories=["Категория:Птицы", "Категория:Рыбы"],
+    )
+    return {
+        "first-page": category.render(),
+        "middle-page": category.render(category.names[400]),
+        "last-page": category.render(category.names[800]),
+    }
+
+
+def saved_pages(pages_dir: Path) -> Dict[str, str]:
+    """
+    Reads saved HTML pages, e.g. category pages downloaded from Wikipedia.
+
+    Args:
+        pages_dir (Path): Directory of "*.html" files.
+
+    Returns:
+        Dict[str, str]: Page HTML by file name.
+    """
+    return {
+        path.stem: path.read_text(encoding="utf-8")
+        for path in sorted(pages_dir.glob("*.html"))
+    }
+
+
+def run(quick: bool = False, pages_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Measures every extractor backend on every page.
+
+    Args:
+        quick (bool): Fewer executions per case, for smoke runs.
+        pages_dir (Optional[Path]): Directory of saved pages; fixture pages if None.
+
+    Returns:
+        Dict[str, Any]: The environment and, per page and backend, ms per page
+        and the speedup over the full BeautifulSoup tree.
+    """
+    number, repeat = (3, 3) if quick else (10, 5)
+    pages = saved_pages(pages_dir) if pages_dir else fixture_pages()
+    cases: Dict[str, Dict[str, float]] = {}
+
+    for page_name, html in pages.items():
+        reference = SoupExtractor().extract(html)
+        timings: Dict[str, float] = {}
+        for backend in EXTRACTORS:
+            extractor = get_extractor(backend)
+            if extractor.extract(html) != reference:
+                raise AssertionError(f"{backend} disagrees with soup on {page_name}")
+            timings[backend] = time_statement(
+                "extractor.extract(html)",
+                {"extractor": extractor, "html": html},
+                number,
+                repeat,
+            )
+
+        for backend, ns in timings.items():
+            cases[f"{page_name}/{backend}"] = {
+                "ms_per_page": round(ns / 1e6, 3),
+                "speedup": round(timings[SoupExtractor.name] / ns, 2),
+            }
+
+    return {"environment": environment(), "cases": cases}
+
+
+def main() -> None:
+    """
+    Entry point of the page extraction benchmark.
+
+    Writes the results as JSON and exits with code 1 if the speedup of any backend
+    over the full BeautifulSoup tree fell below the stored baseline by more than the tolerance.
+    """
+    argument_parser = argparse.ArgumentParser(description=main.__doc__)
+    argument_parser.add_argument("--output", type=Path, default=RESULTS_FILE)
+    argument_parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    argument_parser.add_argument("--tolerance", type=float, default=0.3)
+    argument_parser.add_argument("--quick", action="store_true")
+    argument_parser.add_argument(
+        "--pages",
+        type=Path,
+        default=None,
+        help="Directory of saved *.html category pages to measure instead of fixtures.",
+    )
+    argument_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of gating on it.",
+    )
+    args = argument_parser.parse_args()
+
+    results = run(quick=args.quick, pages_dir=args.pages)
+    write_results(args.output, results)
+
+    for name, case in results["cases"].items():
+        print(
+            f"{name:<22} {case['ms_per_page']:>8.2f} ms/page | x{case['speedup']:.2f}"
+        )
+    print(f"Results written to: {args.output}")
+
+    if args.update_baseline:
+        write_results(args.baseline, results)
+        print(f"Baseline updated: {args.baseline}")
+        return
+
+    if args.pages is not None or not args.baseline.exists():
+        print("No baseline for these pages, nothing to compare")
+        return
+
+    regressions = find_regressions(
+        results["cases"],
+        read_results(args.baseline)["cases"],
+        metric="speedup",
+        tolerance=args.tolerance,
+        higher_is_better=True,
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+from loguru import logger
+
+from benchmarks.timing import (
+    environment,
+    find_regressions,
+    read_results,
+    time_statement,
+    write_results,
+)
+from task2.logger_config import LOG_PROFILES, LoggerConfigurator
+from task2.parser import WikiAnimalParser
+from tests.task2.pages import synthetic_names
+
+BASELINE_FILE = Path(__file__).parent / "baselines" / "logging-overhead.json"
+RESULTS_FILE = Path(__file__).parents[1] / "results" / "logging-overhead.json"
+
+PAGE_SIZE = 200
+
+
+def per_name_logging(titles: List[str]) -> List[str]:
+    """The former name extraction of the parser: one eager DEBUG record per name."""
+    page_names = []
+    for title in titles:
+        animal_name = title.capitalize()
+        logger.debug(f"Extracted animal: {animal_name}")
+        page_names.append(animal_name)
+    return page_names
+
+
+def run(quick: bool = False) -> Dict[str, Any]:
+    """
+    Measures the logging cost of extracting the names of one page in every profile.
+
+    Every profile logs to a temporary file and to an in-memory console. "no-sinks" has
+    no sink at all: its batched case is the cost of the extraction itself.
+
+    Args:
+        quick (bool): Fewer executions per case, for smoke runs.
+
+    Returns:
+        Dict[str, Any]: The environment and, per profile and logging style, ns per
+        extracted name and the ratio to the extraction without logging.
+    """
+    number, repeat = (5, 3) if quick else (20, 5)
+    titles = [name.lower() for name in synthetic_names(PAGE_SIZE)]
+    logger.remove()
+    parser = WikiAnimalParser(base_url="http://localhost/")
+    styles = {
+        "per-name": "per_name_logging(titles)",
+        "batched": "parser._extract_animal_names(titles)",
+    }
+    namespace = {
+        "titles": titles,
+        "parser": parser,
+        "per_name_logging": per_name_logging,
+    }
+    timings: Dict[str, float] = {}
+
+    try:
+        with tempfile.TemporaryDirectory() as log_dir:
+            for profile in ("no-sinks",) + LOG_PROFILES:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    if profile != "no-sinks":
+                        LoggerConfigurator(
+                            log_file=Path(log_dir) / f"{profile}.log", profile=profile
+                        ).setup_logger()
+                    for style, statement in styles.items():
+                        timings[f"{profile}/{style}"] = (
+                            time_statement(statement, namespace, number, repeat)
+                            / PAGE_SIZE
+                        )
+                    logger.complete()
+                    logger.remove()
+    finally:
+        parser.close()
+
+    reference = timings["no-sinks/batched"]
+    cases = {
+        name: {"ns_per_name": round(ns, 1), "ratio": round(ns / reference, 2)}
+        for name, ns in timings.items()
+    }
+    return {"environment": environment(), "cases": cases}
+
+
+def main() -> None:
+    """
+    Entry point of the logging overhead benchmark.
+
+    Writes the results as JSON and exits with code 1 if the logging cost of any case,
+    relative to the extraction without logging, grew past the baseline by more than the tolerance.
+    """
+    argument_parser = argparse.ArgumentParser(description=main.__doc__)
+    argument_parser.add_argument("--output", type=Path, default=RESULTS_FILE)
+    argument_parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    argument_parser.add_argument("--tolerance", type=float, default=0.5)
+    argument_parser.add_argument("--quick", action="store_true")
+    argument_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of gating on it.",
+    )
+    args = argument_parser.parse_args()
+
+    results = run(quick=args.quick)
+    write_results(args.output, results)
+
+    for name, case in results["cases"].items():
+        print(f"{name:<22} {case['ns_per_name']:>9.1f} ns/name | x{case['ratio']:.2f}")
+    print(f"Results written to: {args.output}")
+
+    if args.update_baseline:
+        write_results(args.baseline, results)
+        print(f"Baseline updated: {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print("No baseline, nothing to compare")
+        return
+
+    regressions = find_regressions(
+        results["cases"],
+        read_results(args.baseline)["cases"],
+        metric="ratio",
+        tolerance=args.tolerance,
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
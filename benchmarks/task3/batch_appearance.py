@@ -0,0 +1,129 @@
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+from benchmarks.timing import (
+    environment,
+    find_regressions,
+    read_results,
+    time_statement,
+    write_results,
+)
+from task3.batch import LessonBatch, batch_appearance
+from task3.solution import appearance
+from tests.task3.lessons import random_lessons
+
+BASELINE_FILE = Path(__file__).parent / "baselines" / "batch-appearance.json"
+RESULTS_FILE = Path(__file__).parents[1] / "results" / "batch-appearance.json"
+
+CASES = {
+    "loop-pairwise": "[appearance(lesson, engine='pairwise') for lesson in lessons]",
+    "loop-sweep": "[appearance(lesson) for lesson in lessons]",
+    "batch-with-packing": "batch_appearance(LessonBatch.from_lessons(lessons))",
+    "batch": "batch_appearance(batch)",
+}
+
+
+def run(quick: bool = False, lessons_count: int = 10_000) -> Dict[str, Any]:
+    """
+    Measures scoring many lessons with a per-lesson loop and with the batch API.
+
+    "batch-with-packing" includes packing the lessons into flat arrays; "batch" scores
+    lessons that are packed already, e.g. read from a columnar store.
+
+    Args:
+        quick (bool): Fewer lessons and executions per case, for smoke runs.
+        lessons_count (int): Number of scored lessons.
+
+    Returns:
+        Dict[str, Any]: The environment and, per case, ns per lesson and the speedup
+        over the per-lesson sweep loop.
+    """
+    number, repeat = (1, 3) if quick else (3, 5)
+    if quick:
+        lessons_count = min(lessons_count, 1_000)
+
+    lessons = random_lessons(lessons_count)
+    batch = LessonBatch.from_lessons(lessons)
+    expected = [appearance(lesson) for lesson in lessons]
+    if batch_appearance(batch).tolist() != expected:
+        raise AssertionError("Batch durations differ from per-lesson durations")
+
+    namespace = {
+        "appearance": appearance,
+        "batch_appearance": batch_appearance,
+        "LessonBatch": LessonBatch,
+        "lessons": lessons,
+        "batch": batch,
+    }
+    timings = {
+        name: time_statement(statement, namespace, number, repeat) / lessons_count
+        for name, statement in CASES.items()
+    }
+
+    reference = timings["loop-sweep"]
+    cases = {
+        name: {"ns_per_lesson": round(ns, 1), "speedup": round(reference / ns, 2)}
+        for name, ns in timings.items()
+    }
+    return {
+        "environment": environment(),
+        "lessons": lessons_count,
+        "cases": cases,
+    }
+
+
+def main() -> None:
+    """
+    Entry point of the batch appearance benchmark.
+
+    Writes the results as JSON and exits with code 1 if the speedup of any case over
+    the per-lesson loop fell below the stored baseline by more than the tolerance.
+    """
+    argument_parser = argparse.ArgumentParser(description=main.__doc__)
+    argument_parser.add_argument("--output", type=Path, default=RESULTS_FILE)
+    argument_parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    argument_parser.add_argument("--tolerance", type=float, default=0.3)
+    argument_parser.add_argument("--quick", action="store_true")
+    argument_parser.add_argument("--lessons", type=int, default=10_000)
+    argument_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of gating on it.",
+    )
+    args = argument_parser.parse_args()
+
+    results = run(quick=args.quick, lessons_count=args.lessons)
+    write_results(args.output, results)
+
+    for name, case in results["cases"].items():
+        print(
+            f"{name:<20} {case['ns_per_lesson']:>10.1f} ns/lesson | x{case['speedup']:.2f}"
+        )
+    print(f"Results written to: {args.output}")
+
+    if args.update_baseline:
+        write_results(args.baseline, results)
+        print(f"Baseline updated: {args.baseline}")
+        return
+
+    if args.quick or args.lessons != 10_000 or not args.baseline.exists():
+        print("No baseline for this scenario, nothing to compare")
+        return
+
+    regressions = find_regressions(
+        results["cases"],
+        read_results(args.baseline)["cases"],
+        metric="speedup",
+        tolerance=args.tolerance,
+        higher_is_better=True,
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
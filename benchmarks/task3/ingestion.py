@@ -0,0 +1,158 @@
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict
+
+from benchmarks.timing import (
+    environment,
+    find_regressions,
+    read_results,
+    time_statement,
+    write_results,
+)
+from task3.batch import LessonBatch, batch_appearance
+from task3.json_interaction import TestDataManager
+from task3.lesson_store import LessonStore, convert_json
+from tests.task3.lessons import random_lessons
+
+BASELINE_FILE = Path(__file__).parent / "baselines" / "ingestion.json"
+RESULTS_FILE = Path(__file__).parents[1] / "results" / "ingestion.json"
+
+BATCH_SIZE = 10_000
+CASES = {
+    "json-load": (
+        "batch_appearance(LessonBatch.from_lessons("
+        "TestDataManager(json_file).lessons_data))"
+    ),
+    "json-stream": (
+        "[batch_appearance(batch) for batch, _ in "
+        "TestDataManager(json_file).iter_batches(BATCH_SIZE)]"
+    ),
+    "store": "batch_appearance(LessonStore(store_path).batch)",
+}
+
+
+def run(quick: bool = False, lessons_count: int = 20_000) -> Dict[str, Any]:
+    """
+    Measures reading and scoring a lesson dataset from JSON and from a lesson store.
+
+    Every case starts from a file path: "json-load" loads the whole JSON array,
+    "json-stream" streams it in batches, and "store" maps a lesson store and scores
+    it. Opening a store takes the same time for any size, so it is reported apart
+    and not compared with the other cases.
+
+    Args:
+        quick (bool): Fewer lessons and executions per case, for smoke runs.
+        lessons_count (int): Number of lessons in the dataset.
+
+    Returns:
+        Dict[str, Any]: The environment, the dataset sizes, the store open time and,
+        per case, ns per lesson and the speedup over loading the whole JSON array.
+    """
+    number, repeat = (1, 3) if quick else (2, 5)
+    if quick:
+        lessons_count = min(lessons_count, 2_000)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        json_file = Path(data_dir) / "lessons.json"
+        test_cases = [
+            {"intervals": lesson, "answer": 0}
+            for lesson in random_lessons(lessons_count)
+        ]
+        json_file.write_text(json.dumps(test_cases), encoding="utf-8")
+        store_path = convert_json(json_file, Path(data_dir) / "lessons.lessons")
+
+        namespace = {
+            "batch_appearance": batch_appearance,
+            "LessonBatch": LessonBatch,
+            "LessonStore": LessonStore,
+            "TestDataManager": TestDataManager,
+            "BATCH_SIZE": BATCH_SIZE,
+            "json_file": json_file,
+            "store_path": store_path,
+        }
+        timings = {
+            name: time_statement(statement, namespace, number, repeat) / lessons_count
+            for name, statement in CASES.items()
+        }
+        sizes = {
+            "json_bytes": json_file.stat().st_size,
+            "store_bytes": store_path.stat().st_size,
+        }
+        store_open_us = (
+            time_statement("LessonStore(store_path)", namespace, 100, repeat) / 1e3
+        )
+
+    reference = timings["json-load"]
+    cases = {
+        name: {"ns_per_lesson": round(ns, 1), "speedup": round(reference / ns, 2)}
+        for name, ns in timings.items()
+    }
+    return {
+        "environment": environment(),
+        "lessons": lessons_count,
+        **sizes,
+        "store_open_us": round(store_open_us, 1),
+        "cases": cases,
+    }
+
+
+def main() -> None:
+    """
+    Entry point of the lesson ingestion benchmark.
+
+    Writes the results as JSON and exits with code 1 if the speedup of any case over
+    loading the whole JSON array fell below the stored baseline by more than the tolerance.
+    """
+    argument_parser = argparse.ArgumentParser(description=main.__doc__)
+    argument_parser.add_argument("--output", type=Path, default=RESULTS_FILE)
+    argument_parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    argument_parser.add_argument("--tolerance", type=float, default=0.3)
+    argument_parser.add_argument("--quick", action="store_true")
+    argument_parser.add_argument("--lessons", type=int, default=20_000)
+    argument_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of gating on it.",
+    )
+    args = argument_parser.parse_args()
+
+    results = run(quick=args.quick, lessons_count=args.lessons)
+    write_results(args.output, results)
+
+    for name, case in results["cases"].items():
+        print(
+            f"{name:<12} {case['ns_per_lesson']:>10.1f} ns/lesson | x{case['speedup']:.2f}"
+        )
+    print(
+        f"JSON: {results['json_bytes']} bytes | store: {results['store_bytes']} bytes"
+        f" | store opens in {results['store_open_us']:.1f} us"
+    )
+    print(f"Results written to: {args.output}")
+
+    if args.update_baseline:
+        write_results(args.baseline, results)
+        print(f"Baseline updated: {args.baseline}")
+        return
+
+    if args.quick or args.lessons != 20_000 or not args.baseline.exists():
+        print("No baseline for this scenario, nothing to compare")
+        return
+
+    regressions = find_regressions(
+        results["cases"],
+        read_results(args.baseline)["cases"],
+        metric="speedup",
+        tolerance=args.tolerance,
+        higher_is_better=True,
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from benchmarks.timing import (
+    environment,
+    find_regressions,
+    read_results,
+    time_statement,
+    write_results,
+)
+from task3.batch import LessonBatch, batch_appearance
+from task3.parallel import ParallelScorer
+from tests.task3.lessons import random_lessons
+
+BASELINE_FILE = Path(__file__).parent / "baselines" / "parallel-scoring.json"
+RESULTS_FILE = Path(__file__).parents[1] / "results" / "parallel-scoring.json"
+
+ENGINES = ("batch", "sweep")
+
+
+def default_worker_counts() -> List[int]:
+    """Powers of two up to the number of CPUs, and at least one pool of two workers."""
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= max(cpus, 2):
+        counts.append(counts[-1] * 2)
+    return counts
+
+
+def run(
+    quick: bool = False,
+    lessons_count: int = 50_000,
+    chunk_size: int = 5_000,
+    worker_counts: Optional[List[int]] = None,
+) -> Dict[str, Any]:
+    """
+    Measures the throughput of `ParallelScorer` per engine and worker count.
+
+    Lessons are packed once up front, so the cases time the scoring itself: copying
+    to shared memory, starting the pool, scoring the chunks and collecting the results.
+
+    Args:
+        quick (bool): Fewer lessons and executions per case, for smoke runs.
+        lessons_count (int): Number of scored lessons.
+        chunk_size (int): Lessons per task.
+        worker_counts (Optional[List[int]]): Pool sizes to measure; powers of two up
+            to the number of CPUs if None.
+
+    Returns:
+        Dict[str, Any]: The environment, the number of CPUs and, per engine and pool
+        size, lessons per second, the speedup over one worker and the efficiency per
+        worker.
+    """
+    repeat = 1 if quick else 3
+    if quick:
+        lessons_count = min(lessons_count, 5_000)
+        chunk_size = min(chunk_size, 1_000)
+    worker_counts = worker_counts or default_worker_counts()
+
+    batch = LessonBatch.from_lessons(random_lessons(lessons_count))
+    expected = batch_appearance(batch).tolist()
+    cases: Dict[str, Dict[str, float]] = {}
+
+    for engine in ENGINES:
+        for workers in worker_counts:
+            scorer = ParallelScorer(
+                workers=workers, chunk_size=chunk_size, engine=engine
+            )
+            if scorer.score_batch(batch).tolist() != expected:
+                raise AssertionError(f"{engine} x{workers} durations differ")
+
+            namespace = {"scorer": scorer, "batch": batch}
+            seconds = time_statement("scorer.score_batch(batch)", namespace, 1, repeat)
+            seconds /= 1e9
+            cases[f"{engine}/workers-{workers}"] = {
+                "lessons_per_second": round(lessons_count / seconds, 1)
+            }
+
+        reference = cases[f"{engine}/workers-{worker_counts[0]}"]["lessons_per_second"]
+        for workers in worker_counts:
+            case = cases[f"{engine}/workers-{workers}"]
+            case["speedup"] = round(case["lessons_per_second"] / reference, 2)
+            case["efficiency"] = round(case["speedup"] / workers, 2)
+
+    return {
+        "environment": environment(),
+        "cpus": os.cpu_count(),
+        "lessons": lessons_count,
+        "chunk_size": chunk_size,
+        "cases": cases,
+    }
+
+
+def main() -> None:
+    """
+    Entry point of the parallel scoring benchmark.
+
+    Writes the results as JSON and exits with code 1 if the speedup of any pool over
+    one worker fell below the stored baseline by more than the tolerance. Speedups
+    depend on the number of CPUs, so a baseline from another CPU count is not compared.
+    """
+    argument_parser = argparse.ArgumentParser(description=main.__doc__)
+    argument_parser.add_argument("--output", type=Path, default=RESULTS_FILE)
+    argument_parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    argument_parser.add_argument("--tolerance", type=float, default=0.3)
+    argument_parser.add_argument("--quick", action="store_true")
+    argument_parser.add_argument("--lessons", type=int, default=50_000)
+    argument_parser.add_argument("--chunk-size", type=int, default=5_000)
+    argument_parser.add_argument(
+        "--workers", type=int, nargs="+", default=None, help="Pool sizes to measure."
+    )
+    argument_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of gating on it.",
+    )
+    args = argument_parser.parse_args()
+
+    results = run(
+        quick=args.quick,
+        lessons_count=args.lessons,
+        chunk_size=args.chunk_size,
+        worker_counts=args.workers,
+    )
+    write_results(args.output, results)
+
+    for name, case in results["cases"].items():
+        print(
+            f"{name:<18} {case['lessons_per_second']:>12.1f} lessons/s"
+            f" | x{case['speedup']:.2f} | efficiency {case['efficiency']:.0%}"
+        )
+    print(f"Results written to: {args.output}")
+
+    if args.update_baseline:
+        write_results(args.baseline, results)
+        print(f"Baseline updated: {args.baseline}")
+        return
+
+    if args.quick or not args.baseline.exists():
+        print("No baseline for this scenario, nothing to compare")
+        return
+    baseline = read_results(args.baseline)
+    if baseline.get("cpus") != results["cpus"]:
+        print(
+            f"Baseline was measured on {baseline.get('cpus')} CPUs, nothing to compare"
+        )
+        return
+
+    regressions = find_regressions(
+        results["cases"],
+        baseline["cases"],
+        metric="speedup",
+        tolerance=args.tolerance,
+        higher_is_better=True,
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
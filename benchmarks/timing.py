@@ -0,0 +1,112 @@
+import json
+import platform
+import timeit
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+
+def time_statement(
+    statement: str, namespace: Dict[str, Any], number: int, repeat: int
+) -> float:
+    """
+    Measures the best time of a statement.
+
+    The statement is compiled by `timeit`, so no extra call layer is added to the measurement.
+
+    Args:
+        statement (str): The statement to time, e.g. "func(a, b)".
+        namespace (Dict[str, Any]): Names used by the statement.
+        number (int): Executions per measurement.
+        repeat (int): Number of measurements; the fastest one is kept.
+
+    Returns:
+        float: Nanoseconds per execution.
+    """
+    timer = timeit.Timer(stmt=statement, globals=namespace)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def environment() -> Dict[str, str]:
+    """
+    Describes the machine and interpreter the benchmark ran on.
+
+    Returns:
+        Dict[str, str]: Python implementation, version and platform.
+    """
+    return {
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def write_results(path: Union[str, Path], results: Dict[str, Any]) -> None:
+    """
+    Writes benchmark results as JSON.
+
+    Args:
+        path (Union[str, Path]): Output file path.
+        results (Dict[str, Any]): Benchmark results.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, ensure_ascii=False)
+        file.write("\n")
+
+
+def read_results(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Reads benchmark results written by `write_results`.
+
+    Args:
+        path (Union[str, Path]): Results file path.
+
+    Returns:
+        Dict[str, Any]: Benchmark results.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def find_regressions(
+    cases: Dict[str, Dict[str, float]],
+    baseline_cases: Dict[str, Dict[str, float]],
+    metric: str,
+    tolerance: float,
+    higher_is_better: bool = False,
+) -> List[str]:
+    """
+    Compares a metric of every case with the stored baseline.
+
+    Cases missing from the baseline are not gated.
+
+    Args:
+        cases (Dict[str, Dict[str, float]]): Current results by case name.
+        baseline_cases (Dict[str, Dict[str, float]]): Baseline results by case name.
+        metric (str): The compared metric, e.g. "ratio".
+        tolerance (float): Allowed relative degradation, e.g. 0.25 for 25%.
+        higher_is_better (bool): True for throughput-like metrics.
+
+    Returns:
+        List[str]: One message per regressed case.
+    """
+    regressions = []
+    for name, result in cases.items():
+        if name not in baseline_cases:
+            continue
+
+        current = result[metric]
+        expected = baseline_cases[name][metric]
+        if higher_is_better:
+            regressed = current < expected * (1 - tolerance)
+        else:
+            regressed = current > expected * (1 + tolerance)
+
+        if regressed:
+            regressions.append(
+                f"{name}: {metric} {current:.3f} vs baseline {expected:.3f} "
+                f"(tolerance {tolerance:.0%})"
+            )
+
+    return regressions
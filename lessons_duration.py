@@ -1,21 +1,101 @@
-from task3.json_interaction import TestDataManager
-from task3.solution import appearance
+import argparse
+from pathlib import Path
+from typing import Iterator, Tuple, Union
+
+from task3.batch import batch_appearance
+from task3.json_interaction import DEFAULT_JSON_FILE, TestDataManager
+from task3.lesson_store import STORE_SUFFIX, LessonStore
+from task3.parallel import ParallelScorer
+from task3.solution import ENGINES, appearance
+
+
+def score_test_data(
+    test_data_interface: Union[TestDataManager, LessonStore], args: argparse.Namespace
+) -> Iterator[Tuple[int, int]]:
+    """
+    Streams lessons from the test data and scores them as the arguments ask.
+
+    Args:
+        test_data_interface (Union[TestDataManager, LessonStore]): The test data.
+        args (argparse.Namespace): Parsed command-line arguments.
+
+    Yields:
+        Tuple[int, int]: The computed and the expected duration of every lesson.
+    """
+    if args.workers is None and not args.batch:
+        for record in test_data_interface.iter_records():
+            lesson_duration = appearance(
+                lesson_data=record.intervals, engine=args.engine
+            )
+            yield lesson_duration, record.answer
+        return
+
+    if args.workers is None:
+        for batch, answers in test_data_interface.iter_batches(args.batch_size):
+            yield from zip(batch_appearance(batch).tolist(), answers)
+        return
+
+    # One process pool scores every batch of the run.
+    with ParallelScorer(
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        engine="batch" if args.batch else args.engine,
+    ) as scorer:
+        for batch, answers in test_data_interface.iter_batches(args.batch_size):
+            yield from zip(scorer.score_batch(batch).tolist(), answers)
 
 
 def main() -> None:
     """
     Entry point for validating lesson durations.
 
-    This function loads test data from JSON, runs the appearance function to
+    This function streams test data from JSON or a lesson store, runs the appearance function to
     compute the effective lesson time, and compares the result to the expected answer.
     It raises an AssertionError if the result does not match the expected output.
     """
-    test_data_interface = TestDataManager()
+    argument_parser = argparse.ArgumentParser(description=main.__doc__)
+    argument_parser.add_argument(
+        "--data",
+        type=Path,
+        default=DEFAULT_JSON_FILE,
+        help=f"Test data: a JSON array, JSON Lines (.jsonl) or a lesson store ({STORE_SUFFIX}).",
+    )
+    argument_parser.add_argument(
+        "--engine",
+        choices=list(ENGINES),
+        default="sweep",
+        help="Interval intersection engine.",
+    )
+    argument_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Score lessons in batches with the vectorized batch API.",
+    )
+    argument_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=100_000,
+        help="Lessons read into memory at a time with --batch or --workers.",
+    )
+    argument_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Score lessons in chunks on a pool of worker processes.",
+    )
+    argument_parser.add_argument(
+        "--chunk-size", type=int, default=10_000, help="Lessons per worker task."
+    )
+    args = argument_parser.parse_args()
 
-    for i_test, lesson_data in enumerate(test_data_interface.lessons_data):
-        lesson_duration = appearance(lesson_data=lesson_data)
-        test_answer = test_data_interface.test_answers[i_test]
+    if args.data.suffix == STORE_SUFFIX:
+        test_data_interface = LessonStore(args.data)
+    else:
+        test_data_interface = TestDataManager(json_file=args.data)
 
+    for i_test, (lesson_duration, test_answer) in enumerate(
+        score_test_data(test_data_interface, args)
+    ):
         assert (
             lesson_duration == test_answer
         ), f"Error on test case {i_test}, got {lesson_duration}, expected {test_answer}"
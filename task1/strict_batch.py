@@ -0,0 +1,270 @@
+import inspect
+import sys
+import time
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from task1.strict_modes import StrictState
+from task1.type_checkers import annotation_name, compile_checker, exact_types
+
+# NumPy dtype kinds whose ``tolist()`` items have the given exact Python type.
+_DTYPE_KINDS = {bool: "b", int: "iu", float: "f", str: "U"}
+
+
+class BatchColumn:
+    """
+    Validates one input column of a batch call against a parameter annotation.
+
+    Homogeneous columns are checked at C speed: NumPy arrays by dtype, lists by
+    the set of their item types. Items are checked one by one only if that is not
+    conclusive (container annotations, object arrays) or to report the offending item.
+    """
+
+    def __init__(
+        self, name: str, annotation: Any, sample_size: Optional[int], max_depth: int
+    ) -> None:
+        """
+        Initializes the column validator.
+
+        Args:
+            name (str): Parameter name.
+            annotation (Any): Parameter annotation.
+            sample_size (Optional[int]): See `task1.type_checkers.compile_checker`.
+            max_depth (int): See `task1.type_checkers.compile_checker`.
+        """
+        self.name = name
+        self.annotation = annotation
+        self.exact_types: Optional[FrozenSet[type]] = exact_types(annotation)
+        self.checker = compile_checker(annotation, sample_size, max_depth)
+        self.dtype_kinds = (
+            "".join(_DTYPE_KINDS.get(type_, "") for type_ in self.exact_types)
+            if self.exact_types is not None
+            else ""
+        )
+
+    def prepare(self, column: Any) -> Sequence[Any]:
+        """
+        Converts a column to a sequence of Python objects without validation.
+
+        Args:
+            column (Any): A sequence, an iterable or a one-dimensional NumPy array.
+
+        Returns:
+            Sequence[Any]: The column items.
+        """
+        if _is_ndarray(column):
+            _check_ndim(self.name, column)
+            return column.tolist()
+        if isinstance(column, (list, tuple)):
+            return column
+        return list(column)
+
+    def validate(self, column: Any) -> Sequence[Any]:
+        """
+        Validates a column and converts it to a sequence of Python objects.
+
+        Args:
+            column (Any): A sequence, an iterable or a one-dimensional NumPy array.
+
+        Returns:
+            Sequence[Any]: The validated column items.
+
+        Raises:
+            TypeError: If the dtype or any item does not match the annotation.
+            ValueError: If an array is not one-dimensional.
+        """
+        if _is_ndarray(column):
+            _check_ndim(self.name, column)
+            kind = column.dtype.kind
+            if kind != "O":
+                if kind not in self.dtype_kinds:
+                    raise TypeError(
+                        f"Argument '{self.name}' must be {annotation_name(self.annotation)}, "
+                        f"got array of {column.dtype}"
+                    )
+                return column.tolist()
+            column = column.tolist()
+        elif not isinstance(column, (list, tuple)):
+            column = list(column)
+
+        if self.exact_types is not None and set(map(type, column)) <= self.exact_types:
+            return column
+
+        for i_item, item in enumerate(column):
+            if not self.checker(item):
+                raise TypeError(
+                    f"Argument '{self.name}'[{i_item}] must be "
+                    f"{annotation_name(self.annotation)}, got {type(item).__name__}"
+                )
+        return column
+
+
+def build_batch_api(
+    func: Callable,
+    parameters: List[inspect.Parameter],
+    state: StrictState,
+    sample_size: Optional[int],
+    max_depth: int,
+) -> Tuple[Callable[..., List[Any]], Callable[..., List[Any]]]:
+    """
+    Builds the `map` and `batch` entry points of a `strict` function.
+
+    Args:
+        func (Callable): The undecorated function, called once per row.
+        parameters (List[inspect.Parameter]): Validated parameters of `func`.
+        state (StrictState): Mode and counters of the function.
+        sample_size (Optional[int]): See `task1.type_checkers.compile_checker`.
+        max_depth (int): See `task1.type_checkers.compile_checker`.
+
+    Returns:
+        Tuple[Callable, Callable]: `map(*iterables)` and `batch(*columns, **named_columns)`.
+    """
+    columns = {
+        param.name: BatchColumn(param.name, param.annotation, sample_size, max_depth)
+        for param in parameters
+    }
+    positional = [
+        param.name
+        for param in parameters
+        if param.kind
+        in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ]
+    keyword = [
+        param.name
+        for param in parameters
+        if param.kind
+        in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+    ]
+    keyword_only = [
+        param.name
+        for param in parameters
+        if param.kind is inspect.Parameter.KEYWORD_ONLY
+    ]
+    positional_count = len(positional)
+    all_positional = positional_count == len(parameters)
+    variadic = any(
+        param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        for param in parameters
+    )
+
+    def batch(*positional_columns: Any, **named_columns: Any) -> List[Any]:
+        """
+        Calls the function once per row of the given columns.
+
+        Columns are validated as a whole (according to the function mode), then the
+        undecorated function runs over the rows without per-call wrapper overhead.
+
+        Args:
+            *positional_columns: Columns of positional arguments.
+            **named_columns: Columns of keyword arguments.
+
+        Returns:
+            List[Any]: Results in row order.
+
+        Raises:
+            TypeError: If a column does not match its annotation or does not fit the signature.
+            ValueError: If columns have different lengths.
+        """
+        if variadic or not columns:
+            raise TypeError(
+                f"{func.__qualname__}() needs named parameters and no variadic ones "
+                f"to support batches"
+            )
+        if len(positional_columns) > len(positional):
+            raise TypeError(
+                f"{func.__qualname__}() takes {len(positional)} positional columns, "
+                f"got {len(positional_columns)}"
+            )
+
+        by_name: Dict[str, Any] = dict(zip(positional, positional_columns))
+        for name, column in named_columns.items():
+            if name in by_name or name not in keyword:
+                raise TypeError(
+                    f"{func.__qualname__}() got an unexpected column {name!r}"
+                )
+            by_name[name] = column
+        missing = [name for name in columns if name not in by_name]
+        if missing:
+            raise TypeError(f"{func.__qualname__}() missing columns: {missing}")
+
+        validated = state.should_validate()
+        prepared = _prepare_columns(columns, by_name, state if validated else None)
+        rows = len(prepared[0])
+        if any(len(column) != rows for column in prepared):
+            raise ValueError("All columns must have the same length")
+
+        if state.mode.name != "off":
+            state.counters[StrictState.CALLS] += rows
+            if validated:
+                state.counters[StrictState.VALIDATIONS] += rows
+
+        if all_positional:
+            return list(map(func, *prepared))
+
+        return [
+            func(
+                *row[:positional_count],
+                **dict(zip(keyword_only, row[positional_count:])),
+            )
+            for row in zip(*prepared)
+        ]
+
+    def map_(*iterables: Any) -> List[Any]:
+        """
+        Like the builtin `map`, but validates each iterable once and returns a list.
+
+        Args:
+            *iterables: One column per positional parameter.
+
+        Returns:
+            List[Any]: Results in row order.
+        """
+        return batch(*iterables)
+
+    map_.__name__ = map_.__qualname__ = "map"
+    return map_, batch
+
+
+def _prepare_columns(
+    columns: Dict[str, BatchColumn],
+    by_name: Dict[str, Any],
+    state: Optional[StrictState],
+) -> List[Sequence[Any]]:
+    """
+    Converts the columns of a batch call, validating them if a state is given.
+
+    Args:
+        columns (Dict[str, BatchColumn]): Column validators in parameter order.
+        by_name (Dict[str, Any]): Raw columns by parameter name.
+        state (Optional[StrictState]): Counters of a validated call, None to skip validation.
+
+    Returns:
+        List[Sequence[Any]]: Converted columns in parameter order.
+
+    Raises:
+        TypeError: If a validated column does not match its annotation.
+    """
+    if state is None:
+        return [column.prepare(by_name[name]) for name, column in columns.items()]
+
+    start = time.perf_counter_ns()
+    try:
+        return [column.validate(by_name[name]) for name, column in columns.items()]
+    except TypeError:
+        state.counters[StrictState.VIOLATIONS] += 1
+        raise
+    finally:
+        state.counters[StrictState.VALIDATION_NS] += time.perf_counter_ns() - start
+
+
+def _is_ndarray(column: Any) -> bool:
+    """Checks for a NumPy array without importing NumPy."""
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(column, numpy.ndarray)
+
+
+def _check_ndim(name: str, column: Any) -> None:
+    """Rejects arrays that are not one-dimensional."""
+    if column.ndim != 1:
+        raise ValueError(
+            f"Argument '{name}' must be a one-dimensional array, got {column.ndim} dimensions"
+        )
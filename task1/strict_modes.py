@@ -0,0 +1,277 @@
+import random
+import weakref
+from typing import Callable, Iterator, List, NamedTuple, Optional, Union
+
+
+class StrictMode:
+    """
+    Describes when a `strict` function validates its arguments.
+
+    Modes:
+        - ``always``: every call is validated.
+        - ``sample(rate)``: a random share `rate` of calls is validated.
+        - ``first_n(n)``: only the first `n` calls are validated.
+        - ``off``: the decorator returns the original function, no overhead at all.
+          Functions following the default mode get a wrapper that only forwards
+          calls, so that they can be switched back on.
+    """
+
+    def __init__(self, name: str, value: Optional[float] = None) -> None:
+        """
+        Initializes the mode.
+
+        Args:
+            name (str): Mode name: "always", "sample", "first_n" or "off".
+            value (Optional[float]): Sampling rate or number of validated calls.
+        """
+        self.name = name
+        self.value = value
+
+    def __repr__(self) -> str:
+        if self.value is None:
+            return self.name
+        return f"{self.name}({self.value})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StrictMode):
+            return NotImplemented
+        return (self.name, self.value) == (other.name, other.value)
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.value))
+
+
+ALWAYS = StrictMode("always")
+OFF = StrictMode("off")
+
+ModeLike = Union[StrictMode, str]
+
+
+def sample(rate: float) -> StrictMode:
+    """
+    Validates a random share of calls.
+
+    Args:
+        rate (float): Share of validated calls, from 0.0 to 1.0.
+
+    Returns:
+        StrictMode: The sampling mode.
+
+    Raises:
+        ValueError: If rate is out of range.
+    """
+    if not 0.0 <= rate <= 1.0:
+        raise ValueError(f"Sampling rate must be between 0 and 1, got {rate}")
+    return StrictMode("sample", rate)
+
+
+def first_n(n: int) -> StrictMode:
+    """
+    Validates only the first `n` calls.
+
+    Args:
+        n (int): Number of validated calls.
+
+    Returns:
+        StrictMode: The first-n mode.
+
+    Raises:
+        ValueError: If n is negative.
+    """
+    if n < 0:
+        raise ValueError(f"Number of validated calls must not be negative, got {n}")
+    return StrictMode("first_n", n)
+
+
+def resolve_mode(mode: Optional[ModeLike]) -> StrictMode:
+    """
+    Converts a mode name or None into a StrictMode.
+
+    Args:
+        mode (Optional[ModeLike]): A StrictMode, "always", "off" or None for the default mode.
+
+    Returns:
+        StrictMode: The resolved mode.
+
+    Raises:
+        ValueError: If the mode name is unknown.
+    """
+    if mode is None:
+        return _default_mode
+    if isinstance(mode, StrictMode):
+        return mode
+    if mode == "always":
+        return ALWAYS
+    if mode == "off":
+        return OFF
+    raise ValueError(f"Unknown strict mode: {mode!r}")
+
+
+def set_default_mode(mode: ModeLike) -> None:
+    """
+    Sets the mode of every function decorated without an explicit mode.
+
+    Functions already decorated without a mode switch to it at once, and their
+    counters are reset. Functions decorated with an explicit mode keep it.
+
+    Args:
+        mode (ModeLike): The new default mode.
+    """
+    global _default_mode
+    _default_mode = resolve_mode(mode)
+    for func in list(_registry):
+        if func.__strict__.follows_default:
+            func.__strict__.set_mode(_default_mode)
+
+
+def get_default_mode() -> StrictMode:
+    """Returns the current default mode."""
+    return _default_mode
+
+
+_default_mode: StrictMode = ALWAYS
+
+
+class StrictStats(NamedTuple):
+    """
+    Snapshot of the counters of a `strict` function.
+    """
+
+    function: str
+    mode: StrictMode
+    calls: int
+    validations: int
+    violations: int
+    validation_time: float
+
+
+class StrictState:
+    """
+    Live state of a `strict` function: its mode and counters.
+
+    Counters are kept in a plain list, so the generated wrapper updates them
+    with cheap item increments: calls, validations, violations, validation time (ns).
+    In "always" mode every call is validated, so only calls are counted. In "off"
+    mode nothing is counted. Without `stats`, the wrapper only keeps the counters its
+    mode needs, e.g. validations for "first_n", and they are not reported.
+    """
+
+    CALLS, VALIDATIONS, VIOLATIONS, VALIDATION_NS = range(4)
+
+    def __init__(
+        self,
+        qualname: str,
+        mode: StrictMode,
+        follows_default: bool = False,
+        stats: bool = True,
+    ) -> None:
+        """
+        Initializes the state.
+
+        Args:
+            qualname (str): Qualified name of the decorated function.
+            mode (StrictMode): The function mode.
+            follows_default (bool): Whether the mode changes with `set_default_mode`.
+            stats (bool): Whether the wrapper counts calls and times validations.
+        """
+        self.qualname = qualname
+        self.mode = mode
+        self.follows_default = follows_default
+        self.stats = stats
+        self.counters: List[int] = [0, 0, 0, 0]
+        self.on_mode_change: Optional[Callable[[StrictMode], None]] = None
+
+    def set_mode(self, mode: StrictMode) -> None:
+        """
+        Switches the function to another mode and resets its counters.
+
+        Args:
+            mode (StrictMode): The new mode.
+        """
+        self.mode = mode
+        self.reset()
+        if self.on_mode_change is not None:
+            self.on_mode_change(mode)
+
+    def should_validate(self) -> bool:
+        """
+        Decides whether the next call (or batch) is validated, for code that
+        is not generated per function.
+        """
+        if self.mode.name == "sample":
+            return random.random() < self.mode.value
+        if self.mode.name == "first_n":
+            return self.counters[self.VALIDATIONS] < self.mode.value
+        return self.mode.name != "off"
+
+    def snapshot(self) -> StrictStats:
+        """Returns the current counters."""
+        calls, validations, violations, validation_ns = self.counters
+        if self.mode.name == "always":
+            validations = calls
+        return StrictStats(
+            function=self.qualname,
+            mode=self.mode,
+            calls=calls,
+            validations=validations,
+            violations=violations,
+            validation_time=validation_ns / 1e9,
+        )
+
+    def reset(self) -> None:
+        """Resets all counters to zero."""
+        self.counters[:] = [0, 0, 0, 0]
+
+
+_registry: "weakref.WeakSet[Callable]" = weakref.WeakSet()
+
+
+def register(func: Callable, state: StrictState) -> None:
+    """
+    Attaches the state to a decorated function and registers it for inspection.
+
+    Args:
+        func (Callable): The generated wrapper.
+        state (StrictState): Its state.
+    """
+    func.__strict__ = state
+    _registry.add(func)
+
+
+def get_stats(func: Callable) -> Optional[StrictStats]:
+    """
+    Returns the counters of a `strict` function.
+
+    Args:
+        func (Callable): A function decorated with `strict`.
+
+    Returns:
+        Optional[StrictStats]: The counters, or None if the function is not decorated,
+        decorated in explicit "off" mode or without `stats`.
+    """
+    state = getattr(func, "__strict__", None)
+    return state.snapshot() if state is not None and state.stats else None
+
+
+def reset_stats(func: Callable) -> None:
+    """
+    Resets the counters of a `strict` function. Does nothing for undecorated functions.
+
+    Args:
+        func (Callable): A function decorated with `strict`.
+    """
+    state = getattr(func, "__strict__", None)
+    if state is not None:
+        state.reset()
+
+
+def iter_stats() -> Iterator[StrictStats]:
+    """
+    Yields the counters of every live `strict` function decorated with `stats`.
+
+    Yields:
+        StrictStats: Counters of one function.
+    """
+    for func in list(_registry):
+        if func.__strict__.stats:
+            yield func.__strict__.snapshot()
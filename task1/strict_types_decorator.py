@@ -1,18 +1,64 @@
 import inspect
-from functools import wraps
+import random
+import time
+from functools import update_wrapper
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from task1.strict_batch import build_batch_api
+from task1.strict_modes import ModeLike, StrictMode, StrictState, register, resolve_mode
+from task1.type_checkers import (
+    DEFAULT_MAX_DEPTH,
+    DEFAULT_SAMPLE_SIZE,
+    annotation_name,
+    compile_expression,
+)
 
-def strict(func):
+_NAMESPACE_PREFIX = "_strict_"
+
+TIMING_STRIDE = 64
+
+
+def strict(
+    func: Optional[Callable] = None,
+    *,
+    mode: Optional[ModeLike] = None,
+    sample_size: Optional[int] = DEFAULT_SAMPLE_SIZE,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    stats: bool = False,
+) -> Callable:
     """
     A decorator that enforces strict typing rules on function arguments.
 
+    The signature is inspected once, at decoration time, and a dedicated wrapper
+    with the very same parameter list is generated for the function. Argument
+    binding is therefore done by the interpreter itself, and every call only pays
+    for the compiled annotation checks (see `task1.type_checkers`).
+
+    Can be used bare (``@strict``) or with options (``@strict(mode=sample(0.01))``).
+    With ``stats=True`` the wrapper counts calls, validations, violations and
+    validation time, see `task1.strict_modes.get_stats`. Whole columns of arguments can be processed with
+    ``func.map(*iterables)`` / ``func.batch(*columns, **named_columns)``, which
+    validate each column once (see `task1.strict_batch`).
+
     Ensures that:
         - All function parameters are explicitly annotated.
         - No parameters have default values.
-        - Annotations only use allowed types: bool, int, float, str.
+        - Annotations only use allowed types: bool, int, float, str, None, the
+          list/tuple/dict/set/frozenset generics over them and their unions.
+        - Runtime arguments match their annotations exactly (``bool`` is not ``int``).
 
     Args:
         func : The function to validate and wrap.
+        mode (Optional[ModeLike]): When arguments are validated: "always", "off",
+            `sample(rate)` or `first_n(n)`. Without a mode, the function follows the
+            global default mode, also when it is changed after decoration. With an
+            explicit "off" mode the signature is still checked, but `func` itself is
+            returned.
+        sample_size (Optional[int]): Maximum number of items checked per container argument.
+            None checks every item.
+        max_depth (int): Number of nested container levels whose items are checked.
+        stats (bool): Whether to count calls and time validations. Without stats, a
+            validated call only runs the argument checks.
 
     Returns:
         The wrapped function with validation logic.
@@ -22,22 +68,308 @@ def strict(func):
             - If any parameter is missing an annotation.
             - Any parameter has a default value.
             - Any annotation is not in the allowed types.
+            - (at call time) Any argument does not match its annotation.
     """
-    @wraps(func)
-    def wrapped_func(*args, **kwargs):
-        TYPES_ALLOWED = (bool, int, float, str)
+    if func is None:
+        return lambda decorated: strict(
+            decorated,
+            mode=mode,
+            sample_size=sample_size,
+            max_depth=max_depth,
+            stats=stats,
+        )
 
-        func_sign = inspect.signature(func)
-        parameters = func_sign.parameters
+    state = StrictState(
+        qualname=func.__qualname__,
+        mode=resolve_mode(mode),
+        follows_default=mode is None,
+        stats=stats,
+    )
+    parameters = _validate_signature(func)
+    checks = _compile_checks(parameters, sample_size, max_depth)
 
-        for name, param in parameters.items():
-            if param.default != inspect._empty:
-                raise TypeError(f"Argument {name} was passed with a default value")
-            elif param.annotation == inspect._empty:
-                raise TypeError(f"Argument {name} was passed without annotation")
-            elif param.annotation not in TYPES_ALLOWED:
-                raise TypeError(f"Type {param.annotation.__name__} of argument '{name}' is not allowed!")
+    if not state.follows_default and state.mode.name == "off":
+        return func
 
-        return func(*args, **kwargs)
+    wrapped_func = _compile_wrapper(func, parameters, checks, state)
+    update_wrapper(wrapped_func, func)
+    wrapped_func.map, wrapped_func.batch = build_batch_api(
+        func, parameters, state, sample_size, max_depth
+    )
 
+    def swap_code(new_mode: StrictMode) -> None:
+        # Every generated wrapper of `func` references the same global names, so the
+        # code of the new mode runs in the namespace of the existing wrapper: the
+        # switch costs nothing per call, and references to the wrapper stay valid.
+        wrapped_func.__code__ = _compile_wrapper(
+            func, parameters, checks, state
+        ).__code__
+
+    state.on_mode_change = swap_code
+    register(wrapped_func, state)
     return wrapped_func
+
+
+def _validate_signature(func: Callable) -> List[inspect.Parameter]:
+    """
+    Checks the function signature against the strict typing rules.
+
+    Annotation support itself is checked when the annotation is compiled.
+
+    Args:
+        func : The function to validate.
+
+    Returns:
+        List[inspect.Parameter]: The function parameters in declaration order.
+
+    Raises:
+        TypeError: If a parameter breaks one of the strict typing rules.
+    """
+    parameters = list(inspect.signature(func).parameters.values())
+
+    for param in parameters:
+        name = param.name
+        if name.startswith(_NAMESPACE_PREFIX):
+            raise TypeError(f"Argument name {name} is reserved by @strict")
+        elif param.default is not inspect.Parameter.empty:
+            raise TypeError(f"Argument {name} was passed with a default value")
+        elif param.annotation is inspect.Parameter.empty:
+            raise TypeError(f"Argument {name} was passed without annotation")
+
+    return parameters
+
+
+def _compile_checks(
+    parameters: List[inspect.Parameter],
+    sample_size: Optional[int],
+    max_depth: int,
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Compiles the annotation of every parameter into a check expression.
+
+    Variadic parameters are checked through the `_strict_value` loop variable.
+
+    Args:
+        parameters (List[inspect.Parameter]): Validated parameters.
+        sample_size (Optional[int]): Maximum number of items checked per container argument.
+        max_depth (int): Number of nested container levels whose items are checked.
+        stats (bool): Whether to count calls and time validations. Without stats, a
+            validated call only runs the argument checks.
+
+    Returns:
+        List[Tuple[str, Dict[str, Any]]]: Expression and referenced names per parameter.
+
+    Raises:
+        TypeError: If any annotation is not in the allowed types.
+    """
+    checks = []
+    for param in parameters:
+        variadic = param.kind in (
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        )
+        checked = f"{_NAMESPACE_PREFIX}value" if variadic else param.name
+        try:
+            checks.append(
+                compile_expression(param.annotation, checked, sample_size, max_depth)
+            )
+        except TypeError as exc:
+            raise TypeError(f"{exc} (argument '{param.name}')") from None
+
+    return checks
+
+
+def _compile_wrapper(
+    func: Callable,
+    parameters: List[inspect.Parameter],
+    checks: List[Tuple[str, Dict[str, Any]]],
+    state: StrictState,
+) -> Callable:
+    """
+    Generates a wrapper that mirrors the signature of `func` and checks argument types.
+
+    Args:
+        func : The function to wrap.
+        parameters (List[inspect.Parameter]): Validated parameters of `func`.
+        checks (List[Tuple[str, Dict[str, Any]]]): Compiled check of every parameter.
+        state (StrictState): Mode and counters of the wrapper.
+
+    Returns:
+        Callable: The generated wrapper.
+    """
+    namespace: Dict[str, Any] = {
+        f"{_NAMESPACE_PREFIX}func": func,
+        f"{_NAMESPACE_PREFIX}violation": _report_violation,
+        f"{_NAMESPACE_PREFIX}counters": state.counters,
+        f"{_NAMESPACE_PREFIX}clock": time.perf_counter_ns,
+        f"{_NAMESPACE_PREFIX}random": random.random,
+    }
+    signature_parts: List[str] = []
+    call_parts: List[str] = []
+    check_lines: List[str] = []
+    positional_only_seen = False
+    keyword_only_marker_needed = True
+
+    for i_param, (param, (condition, checks_namespace)) in enumerate(
+        zip(parameters, checks)
+    ):
+        name = param.name
+        type_ref = f"{_NAMESPACE_PREFIX}type_{i_param}"
+        namespace[type_ref] = param.annotation
+        namespace.update(checks_namespace)
+
+        if param.kind is inspect.Parameter.POSITIONAL_ONLY:
+            positional_only_seen = True
+        elif positional_only_seen:
+            signature_parts.append("/")
+            positional_only_seen = False
+
+        if param.kind is inspect.Parameter.VAR_POSITIONAL:
+            signature_parts.append(f"*{name}")
+            call_parts.append(f"*{name}")
+            keyword_only_marker_needed = False
+            check_lines += _loop_check(name, name, condition, type_ref)
+        elif param.kind is inspect.Parameter.VAR_KEYWORD:
+            signature_parts.append(f"**{name}")
+            call_parts.append(f"**{name}")
+            check_lines += _loop_check(name, f"{name}.values()", condition, type_ref)
+        elif param.kind is inspect.Parameter.KEYWORD_ONLY:
+            if keyword_only_marker_needed:
+                signature_parts.append("*")
+                keyword_only_marker_needed = False
+            signature_parts.append(name)
+            call_parts.append(f"{name}={name}")
+            check_lines += _single_check(name, condition, type_ref)
+        else:
+            signature_parts.append(name)
+            call_parts.append(name)
+            check_lines += _single_check(name, condition, type_ref)
+
+    if positional_only_seen:
+        signature_parts.append("/")
+
+    body = _validation_block(state.mode, check_lines, state.stats)
+    body.append(f"return {_NAMESPACE_PREFIX}func({', '.join(call_parts)})")
+    source = f"def wrapped_func({', '.join(signature_parts)}):\n" + "".join(
+        f"    {line}\n" for line in body
+    )
+
+    exec(compile(source, f"<strict {func.__qualname__}>", "exec"), namespace)
+    return namespace["wrapped_func"]
+
+
+def _validation_block(
+    mode: StrictMode, check_lines: List[str], stats: bool
+) -> List[str]:
+    """
+    Wraps the argument checks into the mode gate and counter updates.
+
+    Without stats, only the mode gate is generated: "always" runs the bare checks,
+    and "first_n" only counts validations. With stats, sparse modes time every
+    validation. In "always" mode reading the clock would cost more than the checks
+    themselves, so only every `TIMING_STRIDE`-th validation is timed and its time is
+    extrapolated. In "off" mode there is no block at all: the wrapper only forwards
+    the call.
+
+    Args:
+        mode (StrictMode): The function mode.
+        check_lines (List[str]): Generated argument checks.
+        stats (bool): Whether to count calls and time validations.
+
+    Returns:
+        List[str]: Lines of the validation block.
+    """
+    if mode.name == "off":
+        return []
+
+    counters = f"{_NAMESPACE_PREFIX}counters"
+    clock = f"{_NAMESPACE_PREFIX}clock"
+    start = f"{_NAMESPACE_PREFIX}start"
+    validations = f"{counters}[{StrictState.VALIDATIONS}]"
+
+    if not stats:
+        if mode.name == "always":
+            return check_lines
+        elif mode.name == "sample":
+            gate = [f"if {_NAMESPACE_PREFIX}random() < {mode.value!r}:"]
+            validation = check_lines
+        elif mode.name == "first_n":
+            gate = [f"if {validations} < {mode.value!r}:"]
+            validation = [f"{validations} += 1", *check_lines]
+        else:
+            raise ValueError(f"Unknown strict mode: {mode!r}")
+        return gate + [f"    {line}" for line in validation]
+
+    lines = [f"{counters}[{StrictState.CALLS}] += 1"]
+
+    def timed(scale: int) -> List[str]:
+        elapsed = f"({clock}() - {start})" + (f" * {scale}" if scale > 1 else "")
+        return [
+            f"{start} = {clock}()",
+            *check_lines,
+            f"{counters}[{StrictState.VALIDATION_NS}] += {elapsed}",
+        ]
+
+    if mode.name == "always":
+        return lines + [
+            f"if {counters}[{StrictState.CALLS}] % {TIMING_STRIDE}:",
+            *[f"    {line}" for line in check_lines],
+            "else:",
+            *[f"    {line}" for line in timed(TIMING_STRIDE)],
+        ]
+    elif mode.name == "sample":
+        lines.append(f"if {_NAMESPACE_PREFIX}random() < {mode.value!r}:")
+    elif mode.name == "first_n":
+        lines.append(f"if {validations} < {mode.value!r}:")
+    else:
+        raise ValueError(f"Unknown strict mode: {mode!r}")
+
+    validation = [f"{validations} += 1", *timed(1)]
+    return lines + [f"    {line}" for line in validation]
+
+
+def _single_check(name: str, condition: str, type_ref: str) -> List[str]:
+    """Generates the type check of a single argument."""
+    return [
+        f"if not ({condition}):",
+        f"    {_violation_call(name, name, type_ref)}",
+    ]
+
+
+def _loop_check(name: str, iterable: str, condition: str, type_ref: str) -> List[str]:
+    """Generates the type check of every value of a variadic argument."""
+    value = f"{_NAMESPACE_PREFIX}value"
+    return [
+        f"for {value} in {iterable}:",
+        f"    if not ({condition}):",
+        f"        {_violation_call(name, value, type_ref)}",
+    ]
+
+
+def _violation_call(name: str, value: str, type_ref: str) -> str:
+    """Generates the call reporting a failed check."""
+    return (
+        f"{_NAMESPACE_PREFIX}violation({_NAMESPACE_PREFIX}counters, "
+        f"{name!r}, {value}, {type_ref})"
+    )
+
+
+def _report_violation(
+    counters: List[int], name: str, value: Any, expected: Any
+) -> None:
+    """
+    Counts a failed validation and raises the TypeError reported for the argument.
+
+    Args:
+        counters (List[int]): Counters of the wrapper.
+        name (str): Argument name.
+        value (Any): The offending value.
+        expected (Any): The annotation.
+
+    Raises:
+        TypeError: Always.
+    """
+    counters[StrictState.VIOLATIONS] += 1
+    raise TypeError(
+        f"Argument '{name}' must be {annotation_name(expected)}, got {type(value).__name__}"
+    )
@@ -0,0 +1,319 @@
+import types
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+SCALAR_TYPES = (bool, int, float, str)
+CONTAINER_TYPES = (list, tuple, dict, set, frozenset)
+
+DEFAULT_SAMPLE_SIZE = 64
+DEFAULT_MAX_DEPTH = 4
+
+Checker = Callable[[Any], bool]
+
+_NoneType = type(None)
+# Generated expressions reference helpers and classes by prefixed names only: they
+# are inlined into `strict` wrappers, whose parameters could shadow ``type`` or ``int``.
+_TYPE_REF = "_strict_type"
+_checkers_cache: Dict[Hashable, Checker] = {}
+
+
+def compile_checker(
+    annotation: Any,
+    sample_size: Optional[int] = DEFAULT_SAMPLE_SIZE,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+) -> Checker:
+    """
+    Compiles an annotation into a specialized check function.
+
+    Supported annotations:
+        - bool, int, float, str (exact type match, ``bool`` is not ``int``);
+        - None;
+        - list[X], set[X], frozenset[X], dict[K, V], tuple[X, ...], tuple[X, Y, ...]
+          and their bare or ``typing`` aliases;
+        - unions: ``X | Y``, ``Optional[X]``, ``Union[X, Y]``.
+
+    Checkers are cached by annotation and limits, so identical annotations across
+    decorated functions share one object. A parametrized container gets the checker
+    that nested checks call, with no wrapper around it.
+
+    Args:
+        annotation (Any): The annotation to compile.
+        sample_size (Optional[int]): Maximum number of items checked per container.
+            Large sequences are sampled with an even stride plus their last item,
+            other containers by their first items. None checks every item.
+        max_depth (int): Number of nested container levels whose items are checked.
+            Deeper containers are only checked for their own type.
+
+    Returns:
+        Checker: A function returning True if a value matches the annotation.
+
+    Raises:
+        TypeError: If the annotation is not supported.
+    """
+    # Container checkers are cached by `_compile_container_checker` under the bare
+    # key, so wrappers of other expressions need keys of their own.
+    key = ("expression", _normalize(annotation), sample_size, max_depth)
+    checker = _checkers_cache.get(key)
+    if checker is None:
+        expression, namespace = compile_expression(
+            annotation, "value", sample_size, max_depth
+        )
+        if len(namespace) == 1 and expression == f"{next(iter(namespace))}(value)":
+            (checker,) = namespace.values()
+        else:
+            source = f"def check(value):\n    return {expression}\n"
+            checker = _build(source, namespace, annotation)
+        _checkers_cache[key] = checker
+
+    return checker
+
+
+def annotation_name(annotation: Any) -> str:
+    """
+    Returns a readable name of an annotation for error messages.
+
+    Args:
+        annotation (Any): The annotation.
+
+    Returns:
+        str: ``int`` for classes, ``list[int]``-style repr otherwise.
+    """
+    if annotation is None or annotation is _NoneType:
+        return "None"
+    if isinstance(annotation, type):
+        return annotation.__name__
+    return repr(annotation).replace("typing.", "")
+
+
+def exact_types(annotation: Any) -> Optional[FrozenSet[type]]:
+    """
+    Returns the exact types a scalar annotation accepts.
+
+    Lets callers check many values at once by comparing the set of their types.
+
+    Args:
+        annotation (Any): The annotation.
+
+    Returns:
+        Optional[FrozenSet[type]]: Accepted types for scalars, None and their unions,
+        None for container annotations.
+    """
+    if annotation is None or annotation is _NoneType:
+        return frozenset({_NoneType})
+    if annotation in SCALAR_TYPES:
+        return frozenset({annotation})
+
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        accepted: Set[type] = set()
+        for arg in get_args(annotation):
+            arg_types = exact_types(arg)
+            if arg_types is None:
+                return None
+            accepted |= arg_types
+        return frozenset(accepted)
+
+    return None
+
+
+def clear_cache() -> None:
+    """Drops all compiled checkers."""
+    _checkers_cache.clear()
+
+
+def _normalize(annotation: Any) -> Hashable:
+    """
+    Builds the cache key of an annotation, so that equivalent spellings
+    (``list[int]`` / ``List[int]``, ``int | None`` / ``Optional[int]``) share a checker.
+    """
+    if annotation is None:
+        return _NoneType
+
+    origin = get_origin(annotation)
+    if origin is None:
+        return annotation
+    if not hasattr(annotation, "__args__"):
+        # A bare alias, e.g. `typing.List`, is its class; `tuple[()]` is not.
+        return origin
+
+    args = tuple(_normalize(arg) for arg in get_args(annotation))
+    if origin is Union or origin is types.UnionType:
+        return ("|", frozenset(args))
+    return (origin, args)
+
+
+def compile_expression(
+    annotation: Any,
+    variable: str,
+    sample_size: Optional[int] = DEFAULT_SAMPLE_SIZE,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Compiles an annotation into a boolean Python expression over `variable`.
+
+    Scalar and union-of-scalar annotations are inlined, containers call their cached checker.
+
+    Args:
+        annotation (Any): The annotation to compile.
+        variable (str): Name of the checked variable in the generated code.
+        sample_size (Optional[int]): See `compile_checker`.
+        max_depth (int): See `compile_checker`.
+
+    Returns:
+        Tuple[str, Dict[str, Any]]: The expression and the names it references.
+
+    Raises:
+        TypeError: If the annotation is not supported.
+    """
+    if annotation is None or annotation is _NoneType:
+        return f"{variable} is None", {}
+
+    if annotation in SCALAR_TYPES:
+        return _exact_type_check(variable, annotation)
+
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        parts: List[str] = []
+        namespace: Dict[str, Any] = {}
+        for arg in get_args(annotation):
+            expression, arg_namespace = compile_expression(
+                arg, variable, sample_size, max_depth
+            )
+            parts.append(expression)
+            namespace.update(arg_namespace)
+        return f"({' or '.join(parts)})", namespace
+
+    container = origin if origin is not None else annotation
+    if container not in CONTAINER_TYPES:
+        raise TypeError(f"Type {annotation_name(annotation)} is not allowed!")
+
+    args = get_args(annotation)
+    if container is tuple and getattr(annotation, "__args__", None) == ():
+        # Only an explicit `tuple[()]` has empty arguments; bare `Tuple` has none.
+        expression, namespace = _exact_type_check(variable, tuple)
+        return f"({expression} and not {variable})", namespace
+    if not args or max_depth <= 0:
+        return _exact_type_check(variable, container)
+
+    checker = _compile_container_checker(
+        annotation, container, args, sample_size, max_depth
+    )
+    checker_ref = f"_strict_check_{id(checker):x}"
+    return f"{checker_ref}({variable})", {checker_ref: checker}
+
+
+def _compile_container_checker(
+    annotation: Any,
+    container: type,
+    args: Tuple[Any, ...],
+    sample_size: Optional[int],
+    max_depth: int,
+) -> Checker:
+    """
+    Generates (or fetches from cache) the check function of a parametrized container.
+    """
+    key = (_normalize(annotation), sample_size, max_depth)
+    checker = _checkers_cache.get(key)
+    if checker is not None:
+        return checker
+
+    type_check, namespace = _exact_type_check("value", container)
+    namespace["islice"] = islice
+    lines = [
+        "def check(value):",
+        f"    if not {type_check}:",
+        "        return False",
+    ]
+
+    def item_expression(item_annotation: Any, variable: str) -> str:
+        expression, item_namespace = compile_expression(
+            item_annotation, variable, sample_size, max_depth - 1
+        )
+        namespace.update(item_namespace)
+        return expression
+
+    if container is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+        if args == ((),):
+            args = ()
+        items = [item_expression(arg, f"value[{i}]") for i, arg in enumerate(args)]
+        lines.append(
+            f"    return len(value) == {len(args)}"
+            + "".join(f" and {item}" for item in items)
+        )
+    elif container is dict:
+        key_check = item_expression(args[0], "key")
+        value_check = item_expression(args[1], "item")
+        items = "value.items()"
+        if sample_size is not None:
+            items = f"islice({items}, {sample_size})"
+        lines += [
+            f"    for key, item in {items}:",
+            f"        if not ({key_check} and {value_check}):",
+            "            return False",
+            "    return True",
+        ]
+    elif container in (list, tuple) and sample_size is not None:
+        item_check = item_expression(args[0], "item")
+        lines += [
+            "    size = len(value)",
+            f"    step = -(-size // {sample_size}) if size > {sample_size} else 1",
+            "    for i_item in range(0, size, step):",
+            "        item = value[i_item]",
+            f"        if not ({item_check}):",
+            "            return False",
+            "    if step > 1:",
+            "        item = value[-1]",
+            f"        return {item_check}",
+            "    return True",
+        ]
+    else:
+        item_check = item_expression(args[0], "item")
+        items = "value" if sample_size is None else f"islice(value, {sample_size})"
+        lines += [
+            f"    for item in {items}:",
+            f"        if not ({item_check}):",
+            "            return False",
+            "    return True",
+        ]
+
+    checker = _build("\n".join(lines) + "\n", namespace, annotation)
+    _checkers_cache[key] = checker
+    return checker
+
+
+def _exact_type_check(variable: str, class_: type) -> Tuple[str, Dict[str, Any]]:
+    """
+    Generates an exact type check of a variable against an allowed class.
+
+    Every class has its own prefixed name, so the names of different checks never
+    clash when their namespaces are merged.
+    """
+    class_ref = f"_strict_class_{class_.__name__}"
+    return f"{_TYPE_REF}({variable}) is {class_ref}", {
+        _TYPE_REF: type,
+        class_ref: class_,
+    }
+
+
+def _build(source: str, namespace: Dict[str, Any], annotation: Any) -> Checker:
+    """Executes generated checker source and returns the `check` function."""
+    namespace = dict(namespace)
+    exec(compile(source, f"<checker {annotation_name(annotation)}>", "exec"), namespace)
+
+    checker = namespace["check"]
+    checker.__qualname__ = checker.__name__ = f"check_{annotation_name(annotation)}"
+    checker.__source__ = source
+    return checker
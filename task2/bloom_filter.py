@@ -0,0 +1,75 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Memory-bounded probabilistic set of strings.
+
+    Membership tests never miss an added string, but may report a string that was
+    never added with probability `error_rate`, as long as no more than `capacity`
+    strings are added. Memory use is fixed at construction: about 1.2 bytes per
+    expected string for a 0.1% error rate, whatever the length of the strings.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        """
+        Initializes an empty filter sized for `capacity` strings.
+
+        Args:
+            capacity (int): Expected number of added strings.
+            error_rate (float): Acceptable false positive rate, between 0 and 1.
+
+        Raises:
+            ValueError: If the capacity or the error rate is out of range.
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        if not 0 < error_rate < 1:
+            raise ValueError(f"error_rate must be between 0 and 1, got {error_rate}")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bits_count = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hashes_count = max(1, round(self.bits_count / capacity * math.log(2)))
+        self._bits = bytearray((self.bits_count + 7) // 8)
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the bit array, in bytes."""
+        return len(self._bits)
+
+    def add(self, item: str) -> bool:
+        """
+        Adds a string.
+
+        Args:
+            item (str): The string.
+
+        Returns:
+            bool: True if the string was not in the filter before (no false negatives:
+            False may be returned for a new string with probability `error_rate`).
+        """
+        added = False
+        for position in self._positions(item):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not self._bits[byte] & mask:
+                self._bits[byte] |= mask
+                added = True
+        return added
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def _positions(self, item: str):
+        """Yields the bit positions of a string, by double hashing one 128-bit digest."""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes_count):
+            yield (first + i * second) % self.bits_count
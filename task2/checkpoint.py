@@ -0,0 +1,203 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Union
+
+from loguru import logger
+
+CHECKPOINT_FORMAT_VERSION = 1
+
+
+class CrawlState(NamedTuple):
+    """
+    Progress of a sequential crawl, as of the last checkpoint.
+
+    `names_size` is the size in bytes of the names file that matches this state:
+    names appended after it belong to pages that have to be crawled again.
+    """
+
+    start_url: str
+    next_url: Optional[str]
+    parsed_pages_count: int
+    extracted_names_count: int
+    names_size: int
+
+
+class CrawlCheckpoint:
+    """
+    Checkpoint of a sequential category crawl, kept in a directory.
+
+    Names of every crawled page are appended to "names.txt", one per line, as the
+    crawl goes. Every `every_pages` pages, and at the end of the crawl, the next-page
+    URL and the crawl counters are written to "state.json" atomically, after the
+    names file is flushed to disk. A resumed crawl drops names appended after the
+    last state write and starts again at the recorded next-page URL, so a crash
+    repeats at most `every_pages` pages.
+
+    Usage:
+        checkpoint = CrawlCheckpoint("checkpoints/animals")
+        parser.parse(relative_url, checkpoint=checkpoint, resume=True)
+    """
+
+    def __init__(self, checkpoint_dir: Union[str, Path], every_pages: int = 10) -> None:
+        """
+        Initializes the checkpoint.
+
+        Args:
+            checkpoint_dir (Union[str, Path]): Directory of the checkpoint files.
+            every_pages (int): Number of pages between state writes.
+        """
+        if every_pages < 1:
+            raise ValueError(f"every_pages must be positive, got {every_pages}")
+
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.every_pages = every_pages
+        self.state_path = self.checkpoint_dir / "state.json"
+        self.names_path = self.checkpoint_dir / "names.txt"
+        self._names_file = None
+        self._start_url: Optional[str] = None
+        self._pages_since_save = 0
+
+    def load(self) -> Optional[CrawlState]:
+        """
+        Loads the last saved state.
+
+        Returns:
+            Optional[CrawlState]: The state, None if there is no readable checkpoint.
+        """
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable checkpoint {self.state_path}: {exc}")
+            return None
+
+        if data.pop("version", None) != CHECKPOINT_FORMAT_VERSION:
+            return None
+        return CrawlState(**data)
+
+    def start(self, start_url: str, resume: bool = False) -> Optional[CrawlState]:
+        """
+        Opens the checkpoint for a crawl.
+
+        Args:
+            start_url (str): The start relative URL of the crawl.
+            resume (bool): Whether to continue the checkpointed crawl of the same
+                start URL. Otherwise, the checkpoint is reset.
+
+        Returns:
+            Optional[CrawlState]: The state to resume from, None for a fresh crawl.
+        """
+        self.close()
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        self._start_url = start_url
+        self._pages_since_save = 0
+
+        state = self.load() if resume else None
+        if state is not None and state.start_url != start_url:
+            logger.warning(
+                f"Checkpoint belongs to {state.start_url}, starting a fresh crawl"
+            )
+            state = None
+        if state is not None and self._names_size() < state.names_size:
+            logger.warning("Checkpoint names are missing, starting a fresh crawl")
+            state = None
+
+        if state is None:
+            self._names_file = open(self.names_path, "w", encoding="utf-8")
+            self._save(
+                CrawlState(
+                    start_url=start_url,
+                    next_url=start_url,
+                    parsed_pages_count=0,
+                    extracted_names_count=0,
+                    names_size=0,
+                )
+            )
+            return None
+
+        os.truncate(self.names_path, state.names_size)
+        self._names_file = open(self.names_path, "a", encoding="utf-8")
+        logger.info(
+            f"Resuming crawl after {state.parsed_pages_count} pages "
+            f"at: {state.next_url}"
+        )
+        return state
+
+    def names(self) -> List[str]:
+        """
+        Reads the names of all checkpointed pages.
+
+        Returns:
+            List[str]: The names, in crawl order.
+        """
+        if self._names_file is not None:
+            self._names_file.flush()
+        if not self.names_path.exists():
+            return []
+        with open(self.names_path, "r", encoding="utf-8") as file:
+            return file.read().splitlines()
+
+    def record_page(
+        self,
+        page_names: List[str],
+        next_url: Optional[str],
+        parsed_pages_count: int,
+        extracted_names_count: int,
+    ) -> None:
+        """
+        Records a crawled page, saving the state every `every_pages` pages.
+
+        Args:
+            page_names (List[str]): Animal names of the page.
+            next_url (Optional[str]): The relative URL of the next page, None at the end.
+            parsed_pages_count (int): Pages crawled so far.
+            extracted_names_count (int): Names extracted so far.
+        """
+        if page_names:
+            self._names_file.write("\n".join(page_names) + "\n")
+        self._pages_since_save += 1
+
+        if next_url is None or self._pages_since_save >= self.every_pages:
+            self._names_file.flush()
+            os.fsync(self._names_file.fileno())
+            self._save(
+                CrawlState(
+                    start_url=self._start_url,
+                    next_url=next_url,
+                    parsed_pages_count=parsed_pages_count,
+                    extracted_names_count=extracted_names_count,
+                    names_size=self._names_size(),
+                )
+            )
+            self._pages_since_save = 0
+
+    def close(self) -> None:
+        """Closes the names file."""
+        if self._names_file is not None:
+            self._names_file.close()
+            self._names_file = None
+
+    def _names_size(self) -> int:
+        """Returns the size in bytes of the names file, 0 if it does not exist."""
+        try:
+            return self.names_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _save(self, state: CrawlState) -> None:
+        """Writes the state atomically."""
+        data = dict(state._asdict(), version=CHECKPOINT_FORMAT_VERSION)
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=self.checkpoint_dir,
+            suffix=".tmp",
+            delete=False,
+        ) as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(file.name, self.state_path)
+        logger.debug("Checkpoint saved after {} pages", state.parsed_pages_count)
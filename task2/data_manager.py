@@ -1,15 +1,203 @@
-from typing import List
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
-import pandas as pd
 from loguru import logger
 
+from task2.bloom_filter import BloomFilter
+from task2.metrics import PipelineMetrics
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def letter_counts_frame(letter_counts: Dict[str, int]) -> "pd.DataFrame":
+    """
+    Exports per-letter counts as a DataFrame sorted by letter.
+
+    pandas is imported here only, so aggregation does not depend on it.
+
+    Args:
+        letter_counts (Dict[str, int]): Number of names by first letter.
+
+    Returns:
+        pd.DataFrame: DataFrame with columns "first_letter" and "count".
+    """
+    import pandas as pd
+
+    letters = sorted(letter_counts)
+    return pd.DataFrame(
+        {
+            "first_letter": letters,
+            "count": [letter_counts[letter] for letter in letters],
+        },
+        columns=["first_letter", "count"],
+    )
+
+
+class StreamingAggregator:
+    """
+    Counts unique animal names by their first letter, one name at a time.
+
+    Names can be fed straight from the crawl with `add` / `add_many`: only the
+    dedup structure and the per-letter counters are kept, never the list of names.
+    By default the dedup structure is an exact set. For very large inputs, pass
+    `approximate_capacity` to use a fixed-size Bloom filter instead: memory stays
+    bounded, at the cost of missing about `error_rate` of the unique names.
+    The time spent in `add_many` is recorded in `metrics` as "aggregation_seconds".
+
+    Example:
+        aggregator = StreamingAggregator(metrics=PipelineMetrics())
+        aggregator.add_many(["Python europaeus", "Hydrochoerinae", "Python kyaiktiyo"])
+        aggregator.snapshot()  # {"H": 1, "P": 2}
+    """
+
+    def __init__(
+        self,
+        capitalize: bool = True,
+        approximate_capacity: Optional[int] = None,
+        error_rate: float = 0.001,
+        metrics: Optional[PipelineMetrics] = None,
+    ) -> None:
+        """
+        Initializes an empty aggregator.
+
+        Args:
+            capitalize (bool): Whether to capitalize names before counting. Pass False
+                for names that are capitalized already, like the parser output.
+            approximate_capacity (Optional[int]): Expected number of unique names for a
+                Bloom filter dedup. Exact set dedup if None.
+            error_rate (float): False positive rate of the Bloom filter.
+            metrics (Optional[PipelineMetrics]): Registry to record aggregation time in.
+                A new one if None.
+        """
+        self.capitalize = capitalize
+        self.metrics: PipelineMetrics = metrics or PipelineMetrics()
+        self.letter_counts: Dict[str, int] = {}
+        self.unique_count: int = 0
+        self._seen = (
+            BloomFilter(capacity=approximate_capacity, error_rate=error_rate)
+            if approximate_capacity is not None
+            else set()
+        )
+
+    def add(self, name: str) -> bool:
+        """
+        Counts a name, unless it was counted before.
+
+        Args:
+            name (str): An animal name.
+
+        Returns:
+            bool: Whether the name was counted.
+        """
+        if self.capitalize:
+            name = name.capitalize()
+        if not name:
+            return False
+
+        if isinstance(self._seen, set):
+            if name in self._seen:
+                return False
+            self._seen.add(name)
+        elif not self._seen.add(name):
+            return False
+
+        letter = name[0]
+        self.letter_counts[letter] = self.letter_counts.get(letter, 0) + 1
+        self.unique_count += 1
+        return True
+
+    def add_many(self, names: Iterable[str]) -> int:
+        """
+        Counts names, skipping the ones counted before.
+
+        Args:
+            names (Iterable[str]): Animal names, e.g. a page of the crawl.
+
+        Returns:
+            int: Number of names counted.
+        """
+        with self.metrics.timer("aggregation_seconds"):
+            return sum(self.add(name) for name in names)
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Returns the current counts.
+
+        Returns:
+            Dict[str, int]: Number of unique names by first letter, sorted by letter.
+        """
+        return {
+            letter: self.letter_counts[letter] for letter in sorted(self.letter_counts)
+        }
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """
+        Exports the current counts in the format of `group_animals_by_first_letter`.
+
+        Returns:
+            pd.DataFrame: DataFrame with columns "first_letter" and "count".
+        """
+        return letter_counts_frame(self.letter_counts)
+
+
+class CategoryAggregator:
+    """
+    Counts unique animal names by first letter per category and across all categories.
+
+    The combined counts deduplicate names listed in several categories, so an animal
+    that is both in "Птицы" and in "Животные по алфавиту" is counted once overall and
+    once in each of its categories.
+
+    Usage:
+        aggregator = CategoryAggregator(capitalize=False)
+        for category, page in parser.iter_category_pages(start_urls):
+            aggregator.add_page(category, page.page_names)
+        aggregator.combined.snapshot()
+    """
+
+    def __init__(
+        self, capitalize: bool = True, metrics: Optional[PipelineMetrics] = None
+    ) -> None:
+        """
+        Initializes an empty aggregator.
+
+        Args:
+            capitalize (bool): Whether to capitalize names before counting.
+            metrics (Optional[PipelineMetrics]): Registry to record the aggregation time
+                of the combined counts in. A new one if None.
+        """
+        self.capitalize = capitalize
+        self.combined = StreamingAggregator(capitalize=capitalize, metrics=metrics)
+        self.categories: Dict[str, StreamingAggregator] = {}
+
+    def add_page(self, category: str, names: Iterable[str]) -> int:
+        """
+        Counts the names of one page of a category.
+
+        Args:
+            category (str): The category of the page.
+            names (Iterable[str]): Animal names of the page.
+
+        Returns:
+            int: Number of names counted for the first time across all categories.
+        """
+        names = list(names)
+        aggregator = self.categories.get(category)
+        if aggregator is None:
+            aggregator = self.categories[category] = StreamingAggregator(
+                capitalize=self.capitalize
+            )
+        aggregator.add_many(names)
+        return self.combined.add_many(names)
+
 
 class DataStructurer:
     """
-    Groups a list of animal names by their first letter using pandas.
+    Groups a list of animal names by their first letter.
 
     This class takes a list of "animal names" and produces a grouped DataFrame
     showing how many animals start with each letter of the alphabet.
+    For names streamed from the crawl, use `StreamingAggregator` directly.
 
     Example:
         Input: ["Python europaeus", "Hydrochoerinae", "Python kyaiktiyo"]
@@ -19,18 +207,23 @@ class DataStructurer:
             P             2
     """
 
-    def __init__(self, data: List[str]) -> None:
+    def __init__(
+        self, data: List[str], metrics: Optional[PipelineMetrics] = None
+    ) -> None:
         """
         Initializes the DataStructurer with a list of animal names.
 
         Args:
             data (List[str]): List of animal names.
+            metrics (Optional[PipelineMetrics]): Registry to record aggregation time in.
+                A new one if None.
         """
         self.animal_names = data
+        self.metrics: PipelineMetrics = metrics or PipelineMetrics()
 
         logger.debug("DataStructurer initialized")
 
-    def group_animals_by_first_letter(self) -> pd.DataFrame:
+    def group_animals_by_first_letter(self) -> "pd.DataFrame":
         """
         Groups animal names by the first letter and counts occurrences.
 
@@ -43,15 +236,7 @@ class DataStructurer:
 
         if not self.animal_names:
             logger.warning("No animal names to structuring process")
-            return pd.DataFrame(columns=["first_letter", "count"])
-
-        unique_names = pd.Series(self.animal_names).str.capitalize().drop_duplicates()
-        first_letters = unique_names.str[0]
-
-        df = pd.DataFrame({"first_letter": first_letters})
-
-        grouped_df = (
-            df.value_counts().reset_index(name="count").sort_values(by="first_letter")
-        )
 
-        return grouped_df
+        aggregator = StreamingAggregator(metrics=self.metrics)
+        aggregator.add_many(self.animal_names)
+        return aggregator.to_dataframe()
@@ -0,0 +1,206 @@
+import html as html_entities
+import re
+from typing import Dict, List, NamedTuple, Optional, Type, Union
+
+import lxml.html
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+
+NEXT_PAGE_TEXT = "Следующая страница"
+
+_NEXT_PAGE_LINK = re.compile(
+    r'<a\s[^>]*?href="([^"]*)"[^>]*>\s*' + re.escape(NEXT_PAGE_TEXT) + r"\s*</a>"
+)
+
+
+class ExtractedPage(NamedTuple):
+    """
+    Data extracted from one category listing page.
+    """
+
+    titles: List[str]
+    next_page_relative_url: Optional[str]
+
+
+class PageExtractor:
+    """
+    Base class of category page extractors.
+
+    An extractor turns the HTML of a category listing page into the titles listed in
+    "div.mw-category.mw-category-columns" <li> elements (the "title" attribute of the
+    first <a> tag of every <li>) and the "Следующая страница" link.
+    Extractors keep no per-page state and are shared by concurrent crawl workers.
+    """
+
+    name: str = ""
+
+    def extract(self, html: str) -> ExtractedPage:
+        """
+        Extracts the titles and the "Next page" link of a page.
+
+        Args:
+            html (str): Page HTML.
+
+        Returns:
+            ExtractedPage: The titles, in page order, and the relative URL of the
+            "Next page" (None if not found).
+        """
+        raise NotImplementedError
+
+
+class SoupExtractor(PageExtractor):
+    """
+    Builds a full BeautifulSoup tree of the page and queries it with CSS selectors.
+
+    The slowest backend, kept as the reference implementation.
+    """
+
+    name = "soup"
+
+    def extract(self, html: str) -> ExtractedPage:
+        soup = BeautifulSoup(html, "lxml")
+        return ExtractedPage(
+            titles=self._get_titles(soup),
+            next_page_relative_url=self._get_next_page_relative_url(soup),
+        )
+
+    @staticmethod
+    def _get_titles(soup: BeautifulSoup) -> List[str]:
+        """
+        Extracts the titles of all <li> elements inside "mw-category-columns".
+
+        Args:
+            soup (BeautifulSoup): Parsed HTML page.
+
+        Returns:
+            List[str]: The "title" attributes of the first <a> tag of every <li>.
+        """
+        titles = []
+        for li in soup.select(selector="div.mw-category.mw-category-columns li"):
+            if li.a and li.a.has_attr("title"):
+                titles.append(li.a.get("title"))
+        return titles
+
+    @staticmethod
+    def _get_next_page_relative_url(soup: BeautifulSoup) -> Optional[str]:
+        """
+        Finds the "Next page" link.
+
+        Args:
+            soup (BeautifulSoup): Parsed HTML page.
+
+        Returns:
+            Optional[str]: The relative URL to the "Next page" or None if not found.
+        """
+        next_page_link = soup.find(name="a", string=NEXT_PAGE_TEXT)
+        if next_page_link and next_page_link.has_attr("href"):
+            return next_page_link.get("href")
+        return None
+
+
+class StrainedSoupExtractor(SoupExtractor):
+    """
+    Builds a BeautifulSoup tree of the category blocks only, skipping navigation chrome.
+
+    A SoupStrainer keeps the "mw-pages" block, which holds the listing and the pagination
+    links, and the "mw-subcategories" block, which is listed like pages.
+    """
+
+    name = "strained"
+
+    def __init__(self) -> None:
+        self._strainer = SoupStrainer(
+            name="div", attrs={"id": ["mw-pages", "mw-subcategories"]}
+        )
+
+    def extract(self, html: str) -> ExtractedPage:
+        soup = BeautifulSoup(html, "lxml", parse_only=self._strainer)
+        return ExtractedPage(
+            titles=self._get_titles(soup),
+            next_page_relative_url=self._get_next_page_relative_url(soup),
+        )
+
+
+class LxmlExtractor(PageExtractor):
+    """
+    Parses the page with lxml directly and queries it with precompiled XPath.
+
+    No Python object is created per element of the page: only the matched <li>
+    elements and the pagination link are visited from Python.
+    """
+
+    name = "lxml"
+
+    _LI_ELEMENTS = etree.XPath(
+        "//div[contains(concat(' ', normalize-space(@class), ' '), ' mw-category ')"
+        " and contains(concat(' ', normalize-space(@class), ' '), ' mw-category-columns ')]"
+        "//li"
+    )
+    _FIRST_LINK = etree.XPath("(.//a)[1]")
+    _NEXT_PAGE_HREF = etree.XPath("(//a[. = $text])[1]/@href")
+
+    def extract(self, html: str) -> ExtractedPage:
+        if not html.strip():
+            return ExtractedPage(titles=[], next_page_relative_url=None)
+
+        root = lxml.html.document_fromstring(html)
+        titles = []
+        for li in self._LI_ELEMENTS(root):
+            links = self._FIRST_LINK(li)
+            if links and "title" in links[0].attrib:
+                titles.append(links[0].attrib["title"])
+
+        next_page_href = self._NEXT_PAGE_HREF(root, text=NEXT_PAGE_TEXT)
+        return ExtractedPage(
+            titles=titles,
+            next_page_relative_url=str(next_page_href[0]) if next_page_href else None,
+        )
+
+
+def find_next_page_link(html: str) -> Optional[str]:
+    """
+    Finds the "Следующая страница" link with a regular expression, without parsing the page.
+
+    Lets a crawl request the next page before the current one is extracted. It may miss
+    links in unusual markup: callers should fall back to the extractor result when it
+    returns None.
+
+    Args:
+        html (str): Page HTML.
+
+    Returns:
+        Optional[str]: The relative URL to the "Next page" or None if not found.
+    """
+    match = _NEXT_PAGE_LINK.search(html)
+    return html_entities.unescape(match.group(1)) if match else None
+
+
+EXTRACTORS: Dict[str, Type[PageExtractor]] = {
+    extractor.name: extractor
+    for extractor in (SoupExtractor, StrainedSoupExtractor, LxmlExtractor)
+}
+
+DEFAULT_EXTRACTOR = LxmlExtractor.name
+
+
+def get_extractor(extractor: Union[str, PageExtractor]) -> PageExtractor:
+    """
+    Resolves an extractor backend.
+
+    Args:
+        extractor (Union[str, PageExtractor]): A backend name ("soup", "strained", "lxml")
+            or an extractor instance.
+
+    Returns:
+        PageExtractor: The extractor.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    if isinstance(extractor, PageExtractor):
+        return extractor
+    if extractor not in EXTRACTORS:
+        raise ValueError(
+            f"Unknown extractor {extractor!r}, expected one of: {', '.join(EXTRACTORS)}"
+        )
+    return EXTRACTORS[extractor]()
@@ -0,0 +1,166 @@
+import json
+import os
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Set, Union
+
+from loguru import logger
+
+from task2.data_manager import letter_counts_frame
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+INCREMENTAL_FORMAT_VERSION = 1
+
+
+class PageRecord(NamedTuple):
+    """
+    What a previous run extracted from one category page.
+    """
+
+    fingerprint: str
+    names: List[str]
+
+
+class IncrementalAggregate:
+    """
+    Per-letter counts of unique animal names, kept up to date between crawls.
+
+    The state file stores, per page URL, the content fingerprint and the names of the
+    previous run, and the per-letter counts of unique names. On the next run, pages
+    with the same fingerprint are skipped, and changed pages only add or remove the
+    names that differ, so the counts are adjusted by the diff instead of being
+    recomputed from every name.
+
+    Usage:
+        aggregate = IncrementalAggregate("state/animals.json")
+        for page in parser.iter_page_records(relative_url):
+            aggregate.update_page(page.url, page.fingerprint, page.page_names)
+        aggregate.finish()
+        aggregate.save()
+    """
+
+    def __init__(self, state_file: Union[str, Path]) -> None:
+        """
+        Initializes the aggregate with the state of the previous run, if there is one.
+
+        Args:
+            state_file (Union[str, Path]): Path to the JSON state file.
+        """
+        self.state_file = Path(state_file)
+        self.pages: Dict[str, PageRecord] = {}
+        self.name_refs: Counter = Counter()
+        self.letter_counts: Counter = Counter()
+        self.added_names_count: int = 0
+        self.removed_names_count: int = 0
+        self.changed_pages_count: int = 0
+        self._seen_urls: Set[str] = set()
+
+        self._load()
+        logger.debug(f"IncrementalAggregate initialized with {len(self.pages)} pages")
+
+    def update_page(self, url: str, fingerprint: str, names: Iterable[str]) -> None:
+        """
+        Applies the current content of a page.
+
+        Args:
+            url (str): The page URL.
+            fingerprint (str): Fingerprint of the page content.
+            names (Iterable[str]): Animal names listed on the page.
+        """
+        self._seen_urls.add(url)
+        previous = self.pages.get(url)
+        if previous is not None and previous.fingerprint == fingerprint:
+            return
+
+        names = [name.capitalize() for name in names if name]
+        previous_names = Counter(previous.names) if previous is not None else Counter()
+        current_names = Counter(names)
+        self._remove_names(previous_names - current_names)
+        self._add_names(current_names - previous_names)
+
+        self.pages[url] = PageRecord(fingerprint=fingerprint, names=names)
+        self.changed_pages_count += 1
+
+    def finish(self) -> None:
+        """
+        Removes the pages that were not seen since the aggregate was loaded.
+
+        Call it once after a complete crawl: pages that left the category take
+        their names with them.
+        """
+        for url in set(self.pages) - self._seen_urls:
+            self._remove_names(Counter(self.pages.pop(url).names))
+            self.changed_pages_count += 1
+
+        logger.info(
+            f"Incremental update: {self.changed_pages_count} pages changed, "
+            f"{self.added_names_count} names added, {self.removed_names_count} removed"
+        )
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """
+        Exports the counts in the format of `DataStructurer.group_animals_by_first_letter`.
+
+        Returns:
+            pd.DataFrame: DataFrame with columns "first_letter" and "count", sorted by letter.
+        """
+        return letter_counts_frame(self.letter_counts)
+
+    def save(self) -> None:
+        """Writes the state file atomically."""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": INCREMENTAL_FORMAT_VERSION,
+            "pages": {url: page._asdict() for url, page in self.pages.items()},
+            "letter_counts": dict(self.letter_counts),
+        }
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=self.state_file.parent,
+            suffix=".tmp",
+            delete=False,
+        ) as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(file.name, self.state_file)
+
+    def _load(self) -> None:
+        """Loads the state of the previous run, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable state {self.state_file}: {exc}")
+            return
+
+        if data.get("version") != INCREMENTAL_FORMAT_VERSION:
+            return
+
+        self.pages = {url: PageRecord(**page) for url, page in data["pages"].items()}
+        self.letter_counts = Counter(data["letter_counts"])
+        for page in self.pages.values():
+            self.name_refs.update(page.names)
+
+    def _add_names(self, names: Counter) -> None:
+        """Adds name occurrences, counting names that were listed on no page before."""
+        for name, occurrences in names.items():
+            if self.name_refs[name] == 0:
+                self.letter_counts[name[0]] += 1
+                self.added_names_count += 1
+            self.name_refs[name] += occurrences
+
+    def _remove_names(self, names: Counter) -> None:
+        """Removes name occurrences, uncounting names that are listed on no page anymore."""
+        for name, occurrences in names.items():
+            self.name_refs[name] -= occurrences
+            if self.name_refs[name] <= 0:
+                del self.name_refs[name]
+                self.letter_counts[name[0]] -= 1
+                if self.letter_counts[name[0]] == 0:
+                    del self.letter_counts[name[0]]
+                self.removed_names_count += 1
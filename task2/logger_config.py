@@ -4,43 +4,78 @@ from typing import Union
 
 from loguru import logger
 
+LOG_PROFILES = ("debug", "production")
+
+FILE_FORMAT = (
+    "{time:YYYY-MM-DD HH:mm:ss} | {level} | {line}: {function} | {elapsed} | {message}"
+)
+CONSOLE_FORMAT = (
+    "<blue>{time:YYYY-MM-DD HH:mm:ss}</blue> | <green>{level}</green> | {message}"
+)
+
 
 class LoggerConfigurator:
     """
     Configures loguru logging with both file and console output.
+
+    Two profiles are available:
+        - "debug": DEBUG and higher go to the file, written synchronously by the
+          logging thread. Records show the caller line and rich tracebacks.
+        - "production": INFO and higher go to the file. Both sinks are enqueued: records
+          are handed to a background writer thread, so the crawl threads never wait for
+          disk or console I/O. DEBUG records are dropped by loguru before their message
+          is formatted, so lazy logging calls (`logger.debug("{}", value)`) cost nothing.
+
+    With enqueued sinks, call `logger.complete()` before exiting to flush pending records.
     """
 
-    def __init__(self, log_file: Union[str, Path]) -> None:
+    def __init__(self, log_file: Union[str, Path], profile: str = "debug") -> None:
         """
         Initializes the logger configuration.
 
         Args:
             log_file (Union[str, Path]): Path to the file where logs should be stored.
+            profile (str): Logging profile: "debug" or "production".
+
+        Raises:
+            ValueError: If the profile is unknown.
         """
+        if profile not in LOG_PROFILES:
+            raise ValueError(
+                f"Unknown log profile {profile!r}, expected one of: {', '.join(LOG_PROFILES)}"
+            )
         self.log_file = log_file
+        self.profile = profile
 
     def setup_logger(self) -> None:
         """
         Sets up the loguru logger:
-            - Logs DEBUG and higher to a rotating, compressed log file.
+            - Logs DEBUG ("debug" profile) or INFO ("production" profile) and higher to
+              a rotating, compressed log file.
             - Logs INFO and SUCCESS levels to the console output.
         """
         logger.remove()
+        production = self.profile == "production"
 
         logger.add(
             sink=self.log_file,
-            level="DEBUG",
+            level="INFO" if production else "DEBUG",
             rotation="10 MB",
             retention=10,
             compression="zip",
             encoding="utf-8",
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {line}: {function} | {elapsed} | {message}",
+            format=FILE_FORMAT,
+            enqueue=production,
+            backtrace=not production,
+            diagnose=not production,
         )
 
         logger.add(
             sink=sys.stdout,
+            level="INFO",
             filter=lambda record: record["level"].name in ["INFO", "SUCCESS"],
-            format="<blue>{time:YYYY-MM-DD HH:mm:ss}</blue> | <green>{level}</green> | {message}",
+            format=CONSOLE_FORMAT,
+            enqueue=production,
         )
 
-        logger.debug(f"Logger initialized with log file: {self.log_file}")
+        logger.debug("Logger initialized with log file: {}", self.log_file)
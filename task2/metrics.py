@@ -0,0 +1,220 @@
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+MetricsHook = Callable[[str, float], None]
+
+
+class Histogram:
+    """
+    Distribution of observed values, in power-of-two buckets.
+
+    A value falls in the bucket of the smallest power of two not less than it; zeros
+    (e.g. the body of a "304 Not Modified" answer) have their own bucket.
+
+    Bucket bounds do not depend on the unit, so the same histogram type holds
+    latencies in seconds, page sizes in bytes and names per page. Percentiles are
+    estimated with the upper bound of their bucket, capped at the largest value.
+    """
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.total: float = 0.0
+        self.min: float = math.inf
+        self.max: float = -math.inf
+        self.zeros_count: int = 0
+        self.buckets: Dict[int, int] = {}
+
+    def observe(self, value: float) -> None:
+        """
+        Adds a value.
+
+        Args:
+            value (float): The value, e.g. a latency in seconds.
+        """
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if value <= 0:
+            self.zeros_count += 1
+            return
+        exponent = math.ceil(math.log2(value))
+        self.buckets[exponent] = self.buckets.get(exponent, 0) + 1
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimates a percentile.
+
+        Args:
+            fraction (float): The percentile as a fraction, e.g. 0.9 for p90.
+
+        Returns:
+            float: Upper bound of the bucket of the percentile. 0 without values.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = fraction * self.count
+        seen = self.zeros_count
+        if seen >= rank:
+            return max(0.0, self.min)
+        for exponent in sorted(self.buckets):
+            seen += self.buckets[exponent]
+            if seen >= rank:
+                return min(2.0**exponent, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Exports the histogram.
+
+        Returns:
+            Dict[str, Any]: Count, total, min, max, mean, p50, p90, p99, and the number
+            of values by bucket upper bound ("le").
+        """
+        if not self.count:
+            return {"count": 0, "total": 0.0}
+
+        buckets = [{"le": 0.0, "count": self.zeros_count}] if self.zeros_count else []
+        buckets.extend(
+            {"le": 2.0**exponent, "count": self.buckets[exponent]}
+            for exponent in sorted(self.buckets)
+        )
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.total / self.count,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+            "buckets": buckets,
+        }
+
+
+class PipelineMetrics:
+    """
+    Thread-safe registry of the counters and histograms of a crawl.
+
+    The parser, the aggregators and the report writer record into one registry:
+    per-page fetch latency, downloaded bytes, HTML parse time and names, aggregation
+    time and write time. `to_dict` / `dump` export totals and distributions as JSON.
+
+    An optional hook is called with the name and value of every observation, e.g. to
+    feed a live dashboard or a profiler. It runs in the recording thread: keep it fast.
+
+    Usage:
+        metrics = PipelineMetrics()
+        with metrics.timer("aggregation_seconds"):
+            aggregator.add_many(page_names)
+        metrics.dump("metrics/run.json")
+    """
+
+    def __init__(self, hook: Optional[MetricsHook] = None) -> None:
+        """
+        Initializes an empty registry.
+
+        Args:
+            hook (Optional[MetricsHook]): Called with `(name, value)` of every
+                observation and counter increment.
+        """
+        self.hook = hook
+        self.counters: Dict[str, float] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self.info: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """
+        Adds to a counter.
+
+        Args:
+            name (str): Counter name, e.g. "not_modified_pages".
+            value (float): Increment.
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+        if self.hook is not None:
+            self.hook(name, value)
+
+    def observe(self, name: str, value: float) -> None:
+        """
+        Adds a value to a histogram.
+
+        Args:
+            name (str): Histogram name, e.g. "fetch_seconds".
+            value (float): The value.
+        """
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(value)
+        if self.hook is not None:
+            self.hook(name, value)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """
+        Observes the wall time of a block, in seconds, including when it raises.
+
+        Args:
+            name (str): Histogram name, e.g. "parse_seconds".
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started)
+
+    def set_info(self, name: str, value: Any) -> None:
+        """
+        Attaches a JSON-serializable value to the export, e.g. scheduler statistics.
+
+        Args:
+            name (str): Key of the value.
+            value (Any): The value.
+        """
+        with self._lock:
+            self.info[name] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Exports the registry.
+
+        Returns:
+            Dict[str, Any]: "counters", "histograms" (see `Histogram.to_dict`) and "info",
+            each sorted by name.
+        """
+        with self._lock:
+            return {
+                "counters": dict(sorted(self.counters.items())),
+                "histograms": {
+                    name: self.histograms[name].to_dict()
+                    for name in sorted(self.histograms)
+                },
+                "info": dict(sorted(self.info.items())),
+            }
+
+    def dump(self, path: Union[str, Path]) -> None:
+        """
+        Writes the export atomically as JSON.
+
+        Args:
+            path (Union[str, Path]): JSON file path.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+        ) as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False, indent=2)
+        os.replace(file.name, path)
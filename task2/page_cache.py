@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import requests
+from loguru import logger
+
+CACHE_FORMAT_VERSION = 2
+
+
+def content_fingerprint(content: bytes) -> str:
+    """
+    Fingerprints the content of a page.
+
+    Args:
+        content (bytes): The response body.
+
+    Returns:
+        str: SHA-256 hex digest of the content.
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+class CachedPage(NamedTuple):
+    """
+    A cached category page: HTTP validators and the data extracted from the page.
+
+    `subcategories` holds the titles of the subcategories listed on the page, which are
+    not animal names.
+    """
+
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fingerprint: str
+    page_names: List[str]
+    next_page_relative_url: Optional[str]
+    subcategories: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_response(
+        cls,
+        url: str,
+        response: requests.Response,
+        page_names: List[str],
+        next_page_relative_url: Optional[str],
+        subcategories: Sequence[str] = (),
+    ) -> "CachedPage":
+        """
+        Builds a cache entry from a fetched page.
+
+        Args:
+            url (str): The page URL.
+            response (requests.Response): The 200 response.
+            page_names (List[str]): Animal names extracted from the page.
+            next_page_relative_url (Optional[str]): The "Next page" link of the page.
+            subcategories (Sequence[str]): Subcategory titles listed on the page.
+
+        Returns:
+            CachedPage: The cache entry.
+        """
+        return cls(
+            url=url,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            fingerprint=content_fingerprint(response.content),
+            page_names=page_names,
+            next_page_relative_url=next_page_relative_url,
+            subcategories=tuple(subcategories),
+        )
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Returns the headers that revalidate this entry with the server.
+
+        Returns:
+            Dict[str, str]: "If-None-Match" and/or "If-Modified-Since" headers.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """
+    Persistent on-disk cache of category pages, keyed by URL.
+
+    Entries keep the response validators ("ETag", "Last-Modified") next to the names
+    and the "Next page" link extracted from the page, so a "304 Not Modified" answer
+    needs neither a download nor an HTML parse. Every entry is one small JSON file,
+    written atomically, so concurrent crawl workers never see partial entries.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            cache_dir (Union[str, Path]): Directory of the cache files.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def load(self, url: str) -> Optional[CachedPage]:
+        """
+        Loads the entry of a URL.
+
+        Args:
+            url (str): The page URL.
+
+        Returns:
+            Optional[CachedPage]: The entry, None if missing, unreadable or outdated.
+        """
+        path = self._entry_path(url)
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {exc}")
+            return None
+
+        if data.pop("version", None) != CACHE_FORMAT_VERSION or data["url"] != url:
+            return None
+        data["subcategories"] = tuple(data["subcategories"])
+        return CachedPage(**data)
+
+    def store(self, page: CachedPage) -> None:
+        """
+        Stores an entry, if the server gave validators to revalidate it with.
+
+        Args:
+            page (CachedPage): The entry.
+        """
+        if not page.etag and not page.last_modified:
+            return
+
+        path = self._entry_path(page.url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = dict(page._asdict(), version=CACHE_FORMAT_VERSION)
+
+        with tempfile.NamedTemporaryFile(
+            mode="w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+        ) as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(file.name, path)
+
+    def _entry_path(self, url: str) -> Path:
+        """Returns the file path of the entry of a URL."""
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.json"
@@ -1,10 +1,65 @@
-from urllib.parse import urljoin, unquote
-from typing import List, Optional
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from urllib.parse import quote, urljoin, unquote
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import requests
-from bs4 import BeautifulSoup
-from bs4.element import ResultSet
 from loguru import logger
+from requests.adapters import HTTPAdapter
+
+from task2.checkpoint import CrawlCheckpoint
+from task2.extractors import (
+    DEFAULT_EXTRACTOR,
+    ExtractedPage,
+    PageExtractor,
+    get_extractor,
+)
+from task2.metrics import PipelineMetrics
+from task2.page_cache import CachedPage, PageCache, content_fingerprint
+from task2.request_scheduler import RequestScheduler
+
+DEFAULT_USER_AGENT = "tetrika-junior-animal-parser/1.0.1 (+https://github.com/zizevskikh-dev/tetrika-junior)"
+DEFAULT_TIMEOUT: Tuple[float, float] = (5.0, 30.0)
+
+DEFAULT_SHARD_PREFIXES: Tuple[str, ...] = tuple("АБВГДЕЖЗИЙКЛМНОПРСТУФХЦЧШЭЮЯ")
+
+CATEGORY_NAMESPACE = "Категория:"
+
+_SHARD_DONE = object()
+
+
+class PageDownload(NamedTuple):
+    """
+    A downloaded category page, before extraction.
+
+    `page` is set when the cached page was reused: the page needs no extraction then.
+    """
+
+    url: str
+    response: requests.Response
+    text: str
+    page: Optional[CachedPage]
+
+
+class CategoryPage(NamedTuple):
+    """
+    A page of a multi-category crawl: the start URL of its category and the page record.
+    """
+
+    category: str
+    page: CachedPage
 
 
 class WikiAnimalParser:
@@ -12,112 +67,635 @@ class WikiAnimalParser:
     Parses all animal names from a Wikipedia website.
 
     The parser follows pagination and extracts animal names from <li> elements
-    that contain <a> tags with a "title" attribute.
+    that contain <a> tags with a "title" attribute, with a pluggable extractor
+    backend. Pages can be consumed as they are parsed with `iter_pages` /
+    `iter_names`, or collected at once with `parse`.
+    `iter_pages_sharded` crawls a category concurrently, split by "from=" start keys,
+    and `iter_category_pages` crawls several categories on one shared worker pool.
+    Subcategories listed on a page are kept apart from the animal names.
+
+    Requests go through one pooled keep-alive session, paced by an adaptive scheduler
+    that backs off on throttling and retries failures. With a `cache_dir`, pages are
+    revalidated with "ETag" / "If-Modified-Since", and unchanged pages are taken from
+    the cache without downloading or parsing them again.
+
+    Fetch latency, downloaded bytes, parse time and names of every page are recorded
+    in `metrics`.
+
+    The parser owns network resources: use it as a context manager or call `close()`.
     """
 
-    def __init__(self, base_url: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        pool_size: int = 10,
+        timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+        cache_dir: Optional[Union[str, Path]] = None,
+        user_agent: str = DEFAULT_USER_AGENT,
+        extractor: Union[str, PageExtractor] = DEFAULT_EXTRACTOR,
+        scheduler: Optional[RequestScheduler] = None,
+        metrics: Optional[PipelineMetrics] = None,
+    ) -> None:
         """
         Initializes the WikiAnimalParser with the given base URL.
 
         Args:
             base_url (str): The base URL of the target website (e.g., "https://ru.wikipedia.org/").
+            pool_size (int): Maximum number of kept-alive connections per host.
+                Should not be less than the number of concurrent workers.
+            timeout (Union[float, Tuple[float, float]]): Connect and read timeouts, in seconds.
+            cache_dir (Optional[Union[str, Path]]): Directory of the persistent page cache.
+                No cache if None.
+            user_agent (str): "User-Agent" header of every request.
+            extractor (Union[str, PageExtractor]): HTML extraction backend: "lxml" (fastest),
+                "strained" (BeautifulSoup of the category blocks only), "soup" (full
+                BeautifulSoup tree), or an extractor instance.
+            scheduler (Optional[RequestScheduler]): Paces and retries requests. By default,
+                an adaptive scheduler allowing up to `pool_size` concurrent requests.
+            metrics (Optional[PipelineMetrics]): Registry to record per-page metrics in.
+                A new one if None.
         """
         self.base_url: str = base_url
+        self.extractor: PageExtractor = get_extractor(extractor)
+        self.timeout = timeout
+        self.session: requests.Session = self._create_session(pool_size, user_agent)
+        self.scheduler: RequestScheduler = scheduler or RequestScheduler(
+            max_concurrency=pool_size
+        )
+        self.metrics: PipelineMetrics = metrics or PipelineMetrics()
+        self.cache: Optional[PageCache] = (
+            PageCache(cache_dir) if cache_dir is not None else None
+        )
         self.animal_names: List[str] = []
         self.parsed_pages_count: int = 0
+        self.extracted_names_count: int = 0
+        self.not_modified_pages_count: int = 0
+        self._counters_lock = threading.Lock()
 
         logger.debug("WikiAnimalParser initialized")
 
-    def parse(self, relative_url: Optional[str]) -> List[str]:
+    def __enter__(self) -> "WikiAnimalParser":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the pooled connections."""
+        self.session.close()
+
+    def parse(
+        self,
+        relative_url: Optional[str],
+        shard_prefixes: Optional[Sequence[str]] = None,
+        max_workers: int = 8,
+        checkpoint: Optional[CrawlCheckpoint] = None,
+        resume: bool = False,
+    ) -> List[str]:
         """
-        Recursively parses "List of animal names" pages starting from the given relative URL,
-        extracting animal names and continuing to the "Next page" if it exists.
+        Parses "List of animal names" pages starting from the given relative URL,
+        extracting animal names and continuing to the "Next page" while it exists.
 
         Args:
-            relative_url (Optional[str]): A current relative URL path to the "List of animal names" page.
+            relative_url (Optional[str]): A start relative URL path to the "List of animal names" page.
+            shard_prefixes (Optional[Sequence[str]]): If given, the category is crawled
+                concurrently with `iter_pages_sharded`, split by these start keys.
+            max_workers (int): Number of concurrent requests of a sharded crawl.
+            checkpoint (Optional[CrawlCheckpoint]): Checkpoint of a sequential crawl.
+            resume (bool): Whether to continue the crawl saved in `checkpoint`.
 
         Returns:
-            List[str]: A list of extracted animal names.
-        """
-        if self.parsed_pages_count == 0:
-            logger.info("Starting parsing process")
+            List[str]: A list of extracted animal names, including the names restored
+            from the checkpoint.
 
-        url_to_parse = urljoin(base=self.base_url, url=unquote(relative_url))
-        soup = self._get_soup_object(url=url_to_parse)
+        Raises:
+            ValueError: If a checkpoint is given for a sharded crawl.
+        """
+        if checkpoint is not None and shard_prefixes is not None:
+            raise ValueError("Checkpoints are supported by sequential crawls only")
 
-        li_elements = self._get_li_elements(soup)
-        self._add_animals_to_data(li_elements)
+        if shard_prefixes is None:
+            pages = self.iter_pages(
+                relative_url=relative_url, checkpoint=checkpoint, resume=resume
+            )
+        else:
+            pages = self.iter_pages_sharded(
+                relative_url=relative_url,
+                prefixes=shard_prefixes,
+                max_workers=max_workers,
+            )
 
-        next_page_relative_url = self._get_next_page_relative_url(soup)
-        if next_page_relative_url:
-            self.parse(relative_url=next_page_relative_url)
+        if checkpoint is None:
+            for page_names in pages:
+                self.animal_names.extend(page_names)
         else:
-            logger.warning(f"Next page not found")
-            logger.info(f"Finishing parsing process")
+            # The checkpoint keeps the names of the resumed and the new pages alike.
+            for _ in pages:
+                pass
+            self.animal_names.extend(checkpoint.names())
 
         return self.animal_names
 
+    def iter_pages(
+        self,
+        relative_url: Optional[str],
+        checkpoint: Optional[CrawlCheckpoint] = None,
+        resume: bool = False,
+    ) -> Iterator[List[str]]:
+        """
+        Iteratively walks "List of animal names" pages and yields the names of each page.
+
+        Only the current page is kept in memory, so consumers can aggregate names
+        while the crawl runs, and long paginations do not grow the call stack.
+
+        With a checkpoint, every page is recorded in it. A resumed crawl restores the
+        counters and starts at the checkpointed next page: the names of the pages
+        crawled before are not yielded again, they are available from `checkpoint.names()`.
+
+        Args:
+            relative_url (Optional[str]): A start relative URL path to the "List of animal names" page.
+            checkpoint (Optional[CrawlCheckpoint]): Checkpoint to record the crawl in.
+            resume (bool): Whether to continue the crawl saved in `checkpoint`.
+
+        Yields:
+            List[str]: Animal names extracted from one page.
+        """
+        for page in self.iter_page_records(
+            relative_url=relative_url, checkpoint=checkpoint, resume=resume
+        ):
+            yield page.page_names
+
+    def iter_page_records(
+        self,
+        relative_url: Optional[str],
+        checkpoint: Optional[CrawlCheckpoint] = None,
+        resume: bool = False,
+    ) -> Iterator[CachedPage]:
+        """
+        Walks "List of animal names" pages like `iter_pages`, yielding full page records.
+
+        Args:
+            relative_url (Optional[str]): A start relative URL path to the "List of animal names" page.
+            checkpoint (Optional[CrawlCheckpoint]): Checkpoint to record the crawl in.
+            resume (bool): Whether to continue the crawl saved in `checkpoint`.
+
+        Yields:
+            CachedPage: The URL, content fingerprint, animal names and "Next page" link
+            of one page.
+        """
+        logger.info("Starting parsing process")
+
+        if checkpoint is not None:
+            state = checkpoint.start(start_url=relative_url, resume=resume)
+            if state is not None:
+                with self._counters_lock:
+                    self.parsed_pages_count = state.parsed_pages_count
+                    self.extracted_names_count = state.extracted_names_count
+                relative_url = state.next_url
+
+        try:
+            while relative_url:
+                page = self._fetch_page_record(relative_url)
+                relative_url = page.next_page_relative_url
+                if checkpoint is not None:
+                    checkpoint.record_page(
+                        page_names=page.page_names,
+                        next_url=relative_url,
+                        parsed_pages_count=self.parsed_pages_count,
+                        extracted_names_count=self.extracted_names_count,
+                    )
+                yield page
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+        logger.warning(f"Next page not found")
+        logger.info(f"Finishing parsing process")
+
+    def iter_names(self, relative_url: Optional[str]) -> Iterator[str]:
+        """
+        Iteratively walks "List of animal names" pages and yields animal names one by one.
+
+        Args:
+            relative_url (Optional[str]): A start relative URL path to the "List of animal names" page.
+
+        Yields:
+            str: An extracted animal name.
+        """
+        for page_names in self.iter_pages(relative_url=relative_url):
+            yield from page_names
+
+    def iter_pages_sharded(
+        self,
+        relative_url: str,
+        prefixes: Sequence[str] = DEFAULT_SHARD_PREFIXES,
+        max_workers: int = 8,
+    ) -> Iterator[List[str]]:
+        """
+        Crawls a category concurrently, split into shards by "from=" start keys.
+
+        The first page of every shard ("relative_url" itself and "relative_url?from=<prefix>")
+        is fetched concurrently, then each shard follows its own pagination on a bounded
+        thread pool. A shard stops right before the first title of any other shard, so
+        seams are deduplicated exactly, whatever collation the wiki uses, and prefixes
+        without titles collapse into their neighbours.
+
+        Pages are yielded as soon as they are parsed: in order within a shard, in no
+        particular order across shards.
+
+        Args:
+            relative_url (str): A start relative URL path to the "List of animal names" page.
+            prefixes (Sequence[str]): Shard start keys, e.g. the letters of the alphabet.
+            max_workers (int): Maximum number of concurrent requests.
+
+        Yields:
+            List[str]: Animal names extracted from one page.
+        """
+        logger.info(f"Starting sharded parsing process: {len(prefixes) + 1} shards")
+
+        start_urls = [relative_url] + [
+            self._with_start_key(relative_url, prefix) for prefix in prefixes
+        ]
+        pages: "queue.Queue[object]" = queue.Queue(maxsize=max_workers * 2)
+        cancelled = threading.Event()
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="shard"
+        ) as pool:
+            first_pages = list(pool.map(self._fetch_page, start_urls))
+
+            shards = {}
+            for page_names, next_page_relative_url in first_pages:
+                if page_names and page_names[0] not in shards:
+                    shards[page_names[0]] = (page_names, next_page_relative_url)
+            boundaries = frozenset(shards)
+
+            futures = [
+                pool.submit(
+                    self._crawl_shard,
+                    page_names,
+                    next_page_relative_url,
+                    boundaries,
+                    pages,
+                    cancelled,
+                )
+                for page_names, next_page_relative_url in shards.values()
+            ]
+            del first_pages, shards
+
+            try:
+                running = len(futures)
+                while running:
+                    item = pages.get()
+                    if item is _SHARD_DONE:
+                        running -= 1
+                    elif isinstance(item, BaseException):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                cancelled.set()
+                while any(not future.done() for future in futures):
+                    try:
+                        pages.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+
+        logger.info(f"Finishing sharded parsing process")
+
+    def iter_category_pages(
+        self,
+        relative_urls: Iterable[str],
+        max_workers: int = 8,
+        subcategory_depth: int = 0,
+    ) -> Iterator[CategoryPage]:
+        """
+        Crawls several categories at once on one bounded thread pool.
+
+        Every page is a separate task: when a page is fetched, the next page of its
+        category is scheduled. Categories advance side by side, so the crawl takes about
+        as long as the longest category instead of the sum of all of them, as long as
+        there are enough workers. With `subcategory_depth`, the subcategories listed on
+        the pages are crawled as categories too, each category once.
+
+        Pages are yielded as soon as they are parsed: in order within a category, in no
+        particular order across categories. Names are not deduplicated across
+        categories, see `CategoryAggregator`.
+
+        Args:
+            relative_urls (Iterable[str]): Start relative URL paths of the categories.
+            max_workers (int): Maximum number of concurrent requests.
+            subcategory_depth (int): Levels of subcategories to follow, 0 for none.
+
+        Yields:
+            CategoryPage: The start URL of the category of a page and the page record.
+        """
+        start_urls = list(dict.fromkeys(relative_urls))
+        logger.info(
+            f"Starting multi-category parsing process: {len(start_urls)} categories"
+        )
+
+        seen_categories = {self._category_title(url) for url in start_urls}
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="category"
+        ) as pool:
+            pending: Dict[Future, Tuple[str, int]] = {
+                pool.submit(self._fetch_page_record, url): (url, 0)
+                for url in start_urls
+            }
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        category, depth = pending.pop(future)
+                        page = future.result()
+
+                        if page.next_page_relative_url:
+                            next_page = pool.submit(
+                                self._fetch_page_record, page.next_page_relative_url
+                            )
+                            pending[next_page] = (category, depth)
+                        if depth < subcategory_depth:
+                            for title in page.subcategories:
+                                if title in seen_categories:
+                                    continue
+                                seen_categories.add(title)
+                                url = f"wiki/{title.replace(' ', '_')}"
+                                pending[pool.submit(self._fetch_page_record, url)] = (
+                                    url,
+                                    depth + 1,
+                                )
+
+                        yield CategoryPage(category=category, page=page)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        logger.info(
+            f"Finishing multi-category parsing process: {len(seen_categories)} categories"
+        )
+
+    def _crawl_shard(
+        self,
+        page_names: List[str],
+        next_page_relative_url: Optional[str],
+        boundaries: frozenset,
+        pages: "queue.Queue[object]",
+        cancelled: threading.Event,
+    ) -> None:
+        """
+        Follows the pagination of one shard and puts its pages on the queue.
+
+        Args:
+            page_names (List[str]): Names of the first page of the shard.
+            next_page_relative_url (Optional[str]): The next page of the shard.
+            boundaries (frozenset): First titles of all shards.
+            pages (queue.Queue): Output queue; receives page name lists, an exception
+                if the crawl failed, and `_SHARD_DONE` at the end.
+            cancelled (threading.Event): Set when the consumer stops early.
+        """
+        try:
+            own_start = page_names[0]
+            while not cancelled.is_set():
+                cut = next(
+                    (
+                        i_name
+                        for i_name, name in enumerate(page_names)
+                        if name in boundaries and name != own_start
+                    ),
+                    None,
+                )
+                pages.put(page_names if cut is None else page_names[:cut])
+
+                if cut is not None or not next_page_relative_url:
+                    break
+                page_names, next_page_relative_url = self._fetch_page(
+                    next_page_relative_url
+                )
+        except Exception as exc:
+            pages.put(exc)
+        finally:
+            pages.put(_SHARD_DONE)
+
+    def _fetch_page(self, relative_url: str) -> Tuple[List[str], Optional[str]]:
+        """
+        Fetches one "List of animal names" page.
+
+        Args:
+            relative_url (str): A relative URL path to the page.
+
+        Returns:
+            Tuple[List[str], Optional[str]]: Animal names of the page and the relative URL
+            of the "Next page" (None if not found).
+        """
+        page = self._fetch_page_record(relative_url)
+        return page.page_names, page.next_page_relative_url
+
+    def _fetch_page_record(self, relative_url: str) -> CachedPage:
+        """
+        Fetches one "List of animal names" page, revalidating its cache entry if there is one.
+
+        Args:
+            relative_url (str): A relative URL path to the page.
+
+        Returns:
+            CachedPage: The page URL, validators, content fingerprint, animal names and
+            the relative URL of the "Next page" (None if not found).
+        """
+        download = self._download_page(relative_url)
+        if download.page is not None:
+            return download.page
+        with self.metrics.timer("parse_seconds"):
+            extracted = self.extractor.extract(download.text)
+        return self._parse_download(download, extracted)
+
+    def _download_page(self, relative_url: str) -> "PageDownload":
+        """
+        Downloads one page, reusing the cached page when it did not change.
+
+        The cached names are reused without parsing when the server answers "304 Not
+        Modified", or when the downloaded content has the fingerprint of the cached one.
+
+        Args:
+            relative_url (str): A relative URL path to the page.
+
+        Returns:
+            PageDownload: The download, with `page` set if the cached page was reused.
+        """
+        url_to_parse = urljoin(base=self.base_url, url=unquote(relative_url))
+        cached = self.cache.load(url_to_parse) if self.cache is not None else None
+        response = self._get_response(url=url_to_parse, cached=cached)
+
+        if cached is not None and response.status_code == 304:
+            logger.debug("Not modified, using cached page: {}", url_to_parse)
+            self._count_page(cached.page_names, not_modified=True)
+            return PageDownload(url_to_parse, response, "", cached)
+
+        fingerprint = content_fingerprint(response.content)
+        if cached is not None and cached.fingerprint == fingerprint:
+            logger.debug("Unchanged content, using cached page: {}", url_to_parse)
+            self._count_page(cached.page_names, not_modified=True)
+            page = CachedPage.from_response(
+                url_to_parse,
+                response,
+                cached.page_names,
+                cached.next_page_relative_url,
+                cached.subcategories,
+            )
+            self.cache.store(page)
+            return PageDownload(url_to_parse, response, "", page)
+
+        return PageDownload(url_to_parse, response, response.text, None)
+
+    def _parse_download(
+        self, download: "PageDownload", extracted: ExtractedPage
+    ) -> CachedPage:
+        """
+        Turns the extraction result of a downloaded page into a page record, and caches it.
+
+        Args:
+            download (PageDownload): The download.
+            extracted (ExtractedPage): What the extractor found in `download.text`.
+
+        Returns:
+            CachedPage: The page record.
+        """
+        subcategories = [
+            title for title in extracted.titles if title.startswith(CATEGORY_NAMESPACE)
+        ]
+        page_names = self._extract_animal_names(
+            [
+                title
+                for title in extracted.titles
+                if not title.startswith(CATEGORY_NAMESPACE)
+            ]
+        )
+        self._count_page(page_names)
+
+        page = CachedPage.from_response(
+            download.url,
+            download.response,
+            page_names,
+            extracted.next_page_relative_url,
+            subcategories,
+        )
+        if self.cache is not None:
+            self.cache.store(page)
+        return page
+
     @staticmethod
-    def _get_soup_object(url: str) -> BeautifulSoup:
+    def _category_title(relative_url: str) -> str:
         """
-        Sends a GET request to the target URL and parses the HTML content into a BeautifulSoup object.
+        Returns the category title a start URL points to, as subcategories are listed.
 
         Args:
-            url (str): The target URL of the page to fetch and parse.
+            relative_url (str): A relative URL path like "wiki/Категория:Птицы".
 
         Returns:
-            BeautifulSoup: Parsed HTML content.
+            str: The title, e.g. "Категория:Птицы".
         """
-        logger.debug(f"Fetching and parsing URL: {url}")
-        response = requests.get(url=url)
-        return BeautifulSoup(response.text, "lxml")
+        return unquote(relative_url).rsplit("/", 1)[-1].replace("_", " ")
 
     @staticmethod
-    def _get_li_elements(soup: BeautifulSoup) -> ResultSet:
+    def _with_start_key(relative_url: str, start_key: str) -> str:
         """
-        Extracts all <li> elements containing animal name inside <a> tag.
+        Adds a "from=" start key to a category URL.
 
         Args:
-            soup (BeautifulSoup): Parsed HTML page.
+            relative_url (str): A relative URL path to the category page.
+            start_key (str): The title prefix the listing should start at.
 
         Returns:
-            ResultSet: A list of <li> elements inside "mw-category-columns".
+            str: The relative URL of the listing starting at `start_key`.
         """
-        return soup.select(selector="div.mw-category.mw-category-columns li")
+        separator = "&" if "?" in relative_url else "?"
+        return f"{relative_url}{separator}from={quote(start_key)}"
 
     @staticmethod
-    def _get_next_page_relative_url(soup: BeautifulSoup) -> Optional[str]:
+    def _create_session(pool_size: int, user_agent: str) -> requests.Session:
         """
-        Finds the "Next page" link on the current "List of animal names" page.
+        Creates the keep-alive session shared by all requests of the parser.
 
         Args:
-            soup (BeautifulSoup): Parsed HTML page.
+            pool_size (int): Maximum number of kept-alive connections per host.
+            user_agent (str): "User-Agent" header of every request.
+
+        Returns:
+            requests.Session: The session.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["User-Agent"] = user_agent
+        return session
+
+    def _get_response(
+        self, url: str, cached: Optional[CachedPage] = None
+    ) -> requests.Response:
+        """
+        Sends a GET request to the target URL through the pooled session.
+
+        The scheduler paces the request and retries it on throttling, server errors and
+        connection failures.
+
+        Args:
+            url (str): The target URL of the page to fetch.
+            cached (Optional[CachedPage]): Cache entry to revalidate.
+
         Returns:
-            Optional[str]: The relative URL to the "Next page" or None if not found.
+            requests.Response: The 200 response, or 304 if the cache entry is still valid.
+
+        Raises:
+            requests.HTTPError: If the server answered with an error status, after retries.
+            requests.ConnectionError: If the server could not be reached, after retries.
+        """
+        logger.debug("Fetching URL: {}", url)
+        headers = cached.conditional_headers() if cached is not None else None
+        with self.metrics.timer("fetch_seconds"):
+            response = self.scheduler.request(
+                lambda: self.session.get(url=url, headers=headers, timeout=self.timeout)
+            )
+        self.metrics.observe("page_bytes", len(response.content))
+        response.raise_for_status()
+        return response
+
+    def _extract_animal_names(self, titles: List[str]) -> List[str]:
         """
-        next_page_relative_url = soup.find(name="a", string="Следующая страница")
-        if next_page_relative_url:
-            if next_page_relative_url.has_attr("href"):
-                return next_page_relative_url.get("href")
+        Turns the titles listed on one page into animal names.
 
-        return next_page_relative_url
+        The names are logged as one DEBUG record per page, built only if a sink accepts it.
 
-    def _add_animals_to_data(self, li_elements: ResultSet) -> None:
+        Args:
+            titles (List[str]): Titles extracted from the page.
+
+        Returns:
+            List[str]: Animal names of the page.
         """
-        Extracts animal names from a ResultSet of <li> elements and adds them to the animal_names list.
+        page_names = [title.capitalize() for title in titles]
+        logger.opt(lazy=True).debug(
+            "Extracted {} animals: {}",
+            lambda: len(page_names),
+            lambda: ", ".join(page_names),
+        )
+        return page_names
 
-        Each <li> element is expected to contain an <a> tag with a "title" attribute representing the animal name.
+    def _count_page(self, page_names: List[str], not_modified: bool = False) -> None:
+        """
+        Updates the crawl counters with one page.
 
         Args:
-            li_elements (ResultSet): A ResultSet containing <li> elements.
+            page_names (List[str]): Animal names of the page.
+            not_modified (bool): Whether the page was taken from the cache.
         """
-        for li in li_elements:
-            if li.a:
-                if li.a.has_attr("title"):
-                    animal_name = li.a.get("title").capitalize()
-                    logger.debug(f"Extracted animal: {animal_name}")
-                    self.animal_names.append(animal_name)
+        with self._counters_lock:
+            self.parsed_pages_count += 1
+            self.extracted_names_count += len(page_names)
+            if not_modified:
+                self.not_modified_pages_count += 1
+            logger.info("Extracted animals: {}", self.extracted_names_count)
+            logger.debug("Parsed pages: {}", self.parsed_pages_count)
 
-        self.parsed_pages_count += 1
-        logger.info(f"Extracted animals: {len(self.animal_names)}")
-        logger.debug(f"Parsed pages: {self.parsed_pages_count}")
+        self.metrics.observe("names_per_page", len(page_names))
+        if not_modified:
+            self.metrics.increment("not_modified_pages")
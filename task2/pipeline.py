@@ -0,0 +1,303 @@
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from loguru import logger
+
+from task2.checkpoint import CrawlCheckpoint
+from task2.extractors import find_next_page_link
+from task2.page_cache import CachedPage
+from task2.parser import PageDownload, WikiAnimalParser
+
+_STAGE_DONE = object()
+_POLL_INTERVAL = 0.1
+
+
+class _Download(NamedTuple):
+    """A downloaded page on its way to the extract stage."""
+
+    sequence: int
+    download: PageDownload
+    next_page_link: Optional["queue.Queue"]
+
+
+class _Failure(NamedTuple):
+    """An exception raised by a stage, forwarded to the consumer."""
+
+    error: BaseException
+
+
+class CrawlPipeline:
+    """
+    Crawls a category with overlapped fetch, extract and consume stages.
+
+    The fetch stage downloads pages one after another in a thread. It finds the "Next
+    page" link with a regular expression and requests the next page right away, while
+    extract workers (threads, optionally backed by a process pool) parse the previous
+    pages, and the caller consumes the parsed ones. Stages are connected by bounded
+    queues: a slow stage blocks the ones before it instead of piling up pages.
+    Wall time tends to the time of the slowest stage instead of the sum of all of them.
+
+    Pages are yielded in crawl order, like `WikiAnimalParser.iter_page_records` yields them.
+
+    Usage:
+        with WikiAnimalParser(base_url) as parser:
+            for page_names in CrawlPipeline(parser).iter_pages(relative_url):
+                aggregator.add_many(page_names)
+    """
+
+    def __init__(
+        self,
+        parser: WikiAnimalParser,
+        queue_size: int = 8,
+        extract_workers: int = 2,
+        extract_processes: int = 0,
+    ) -> None:
+        """
+        Initializes the pipeline.
+
+        Args:
+            parser (WikiAnimalParser): The parser that downloads and extracts pages.
+            queue_size (int): Capacity of the queues between stages.
+            extract_workers (int): Number of extract threads.
+            extract_processes (int): Size of the process pool the extract threads hand
+                HTML parsing to. 0 parses in the threads.
+        """
+        self.parser = parser
+        self.queue_size = queue_size
+        self.extract_workers = max(1, extract_workers, extract_processes)
+        self.extract_processes = extract_processes
+
+    def iter_pages(
+        self,
+        relative_url: Optional[str],
+        checkpoint: Optional[CrawlCheckpoint] = None,
+        resume: bool = False,
+    ) -> Iterator[List[str]]:
+        """
+        Crawls the category and yields the names of each page.
+
+        Args:
+            relative_url (Optional[str]): A start relative URL path to the "List of animal names" page.
+            checkpoint (Optional[CrawlCheckpoint]): Checkpoint to record the crawl in.
+            resume (bool): Whether to continue the crawl saved in `checkpoint`.
+
+        Yields:
+            List[str]: Animal names extracted from one page.
+        """
+        for page in self.iter_page_records(
+            relative_url=relative_url, checkpoint=checkpoint, resume=resume
+        ):
+            yield page.page_names
+
+    def iter_page_records(
+        self,
+        relative_url: Optional[str],
+        checkpoint: Optional[CrawlCheckpoint] = None,
+        resume: bool = False,
+    ) -> Iterator[CachedPage]:
+        """
+        Crawls the category and yields full page records, in crawl order.
+
+        Checkpoints behave as in `WikiAnimalParser.iter_pages`: pages are recorded as
+        they are yielded, and a resumed crawl starts at the checkpointed next page.
+
+        Args:
+            relative_url (Optional[str]): A start relative URL path to the "List of animal names" page.
+            checkpoint (Optional[CrawlCheckpoint]): Checkpoint to record the crawl in.
+            resume (bool): Whether to continue the crawl saved in `checkpoint`.
+
+        Yields:
+            CachedPage: The URL, content fingerprint, animal names and "Next page" link
+            of one page.
+
+        Raises:
+            Exception: The first exception raised by a stage, e.g. `requests.HTTPError`.
+        """
+        logger.info("Starting pipelined parsing process")
+
+        pages_count = names_count = 0
+        if checkpoint is not None:
+            state = checkpoint.start(start_url=relative_url, resume=resume)
+            if state is not None:
+                pages_count = state.parsed_pages_count
+                names_count = state.extracted_names_count
+                with self.parser._counters_lock:
+                    self.parser.parsed_pages_count = pages_count
+                    self.parser.extracted_names_count = names_count
+                relative_url = state.next_url
+
+        downloads: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        records: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        cancelled = threading.Event()
+        pool = (
+            # Workers are spawned: forking a process with running threads is unsafe.
+            ProcessPoolExecutor(
+                max_workers=self.extract_processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            if self.extract_processes
+            else None
+        )
+
+        threads = [
+            threading.Thread(
+                target=self._fetch_stage,
+                args=(relative_url, downloads, records, cancelled),
+                daemon=True,
+            )
+        ] + [
+            threading.Thread(
+                target=self._extract_stage,
+                args=(downloads, records, cancelled, pool),
+                daemon=True,
+            )
+            for _ in range(self.extract_workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            finished_workers = 0
+            reordered: Dict[int, CachedPage] = {}
+            next_sequence = 0
+            while finished_workers < self.extract_workers:
+                item = records.get()
+                if item is _STAGE_DONE:
+                    finished_workers += 1
+                    continue
+                if isinstance(item, _Failure):
+                    raise item.error
+
+                sequence, page = item
+                reordered[sequence] = page
+                while next_sequence in reordered:
+                    page = reordered.pop(next_sequence)
+                    next_sequence += 1
+                    pages_count += 1
+                    names_count += len(page.page_names)
+                    if checkpoint is not None:
+                        checkpoint.record_page(
+                            page_names=page.page_names,
+                            next_url=page.next_page_relative_url,
+                            parsed_pages_count=pages_count,
+                            extracted_names_count=names_count,
+                        )
+                    yield page
+        finally:
+            cancelled.set()
+            for thread in threads:
+                thread.join()
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+            if checkpoint is not None:
+                checkpoint.close()
+
+        logger.info("Finishing pipelined parsing process")
+
+    def _fetch_stage(
+        self,
+        relative_url: Optional[str],
+        downloads: queue.Queue,
+        records: queue.Queue,
+        cancelled: threading.Event,
+    ) -> None:
+        """
+        Downloads pages in crawl order until the last page.
+
+        Args:
+            relative_url (Optional[str]): The relative URL of the first page to fetch.
+            downloads (queue.Queue): Output queue to the extract stage.
+            records (queue.Queue): Queue to the consumer, for failures.
+            cancelled (threading.Event): Set when the consumer stops.
+        """
+        try:
+            sequence = 0
+            while relative_url and not cancelled.is_set():
+                download = self.parser._download_page(relative_url)
+                next_page_link = None
+                if download.page is not None:
+                    relative_url = download.page.next_page_relative_url
+                else:
+                    relative_url = find_next_page_link(download.text)
+                    if relative_url is None:
+                        # Unusual markup or the last page: wait for the extractor.
+                        next_page_link = queue.Queue(maxsize=1)
+
+                item = _Download(sequence, download, next_page_link)
+                if not self._put(downloads, item, cancelled):
+                    return
+                if next_page_link is not None:
+                    relative_url = self._get(next_page_link, cancelled)
+                sequence += 1
+        except Exception as error:
+            self._put(records, _Failure(error), cancelled)
+        finally:
+            for _ in range(self.extract_workers):
+                self._put(downloads, _STAGE_DONE, cancelled)
+
+    def _extract_stage(
+        self,
+        downloads: queue.Queue,
+        records: queue.Queue,
+        cancelled: threading.Event,
+        pool: Optional[Executor],
+    ) -> None:
+        """
+        Extracts downloaded pages until the fetch stage is done.
+
+        Args:
+            downloads (queue.Queue): Input queue from the fetch stage.
+            records (queue.Queue): Output queue to the consumer.
+            cancelled (threading.Event): Set when the consumer stops.
+            pool (Optional[Executor]): Process pool to parse HTML in, if any.
+        """
+        try:
+            while True:
+                item = self._get(downloads, cancelled)
+                if item is None or item is _STAGE_DONE:
+                    break
+
+                page = item.download.page
+                if page is None:
+                    extract = self.parser.extractor.extract
+                    with self.parser.metrics.timer("parse_seconds"):
+                        if pool is not None:
+                            extracted = pool.submit(
+                                extract, item.download.text
+                            ).result()
+                        else:
+                            extracted = extract(item.download.text)
+                    page = self.parser._parse_download(item.download, extracted)
+
+                if item.next_page_link is not None:
+                    item.next_page_link.put(page.next_page_relative_url)
+                if not self._put(records, (item.sequence, page), cancelled):
+                    return
+        except Exception as error:
+            self._put(records, _Failure(error), cancelled)
+            cancelled.set()
+        self._put(records, _STAGE_DONE, cancelled)
+
+    @staticmethod
+    def _put(target: queue.Queue, item: Any, cancelled: threading.Event) -> bool:
+        """Puts an item, waiting for room unless the pipeline is cancelled."""
+        while not cancelled.is_set():
+            try:
+                target.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @staticmethod
+    def _get(source: queue.Queue, cancelled: threading.Event) -> Any:
+        """Gets an item, waiting for one unless the pipeline is cancelled (None then)."""
+        while not cancelled.is_set():
+            try:
+                return source.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return None
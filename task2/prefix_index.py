@@ -0,0 +1,211 @@
+import argparse
+import os
+import tempfile
+from bisect import bisect_left
+from itertools import groupby
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+PREFIX_INDEX_HEADER = "prefix-index v1"
+
+
+class PrefixIndex:
+    """
+    Sorted array of unique animal names, queried by prefix with binary search.
+
+    Names starting with a prefix form one contiguous range of the sorted array, found
+    with two bisections: counting them takes O(log n), listing them O(log n + k).
+    Names are capitalized like `StreamingAggregator` counts them, and so are queries.
+
+    Usage:
+        index = PrefixIndex.from_names(parser.iter_names(relative_url))
+        index.count("Пит")
+        index.save("state/beasts.index")
+    """
+
+    def __init__(self, sorted_names: List[str]) -> None:
+        """
+        Initializes the index over names that are unique, capitalized and sorted.
+
+        Use `from_names` or `PrefixIndexBuilder` to build one from arbitrary names.
+
+        Args:
+            sorted_names (List[str]): The names.
+        """
+        self.names = sorted_names
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_names(cls, names: Iterable[str]) -> "PrefixIndex":
+        """
+        Builds an index in one pass over names.
+
+        Args:
+            names (Iterable[str]): Animal names, in any order, with duplicates.
+
+        Returns:
+            PrefixIndex: The index.
+        """
+        builder = PrefixIndexBuilder()
+        builder.add_many(names)
+        return builder.build()
+
+    def count(self, prefix: str) -> int:
+        """
+        Counts the names starting with a prefix.
+
+        Args:
+            prefix (str): The prefix, e.g. "Пит". An empty prefix matches every name.
+
+        Returns:
+            int: Number of names.
+        """
+        start, stop = self._range(prefix)
+        return stop - start
+
+    def list(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Lists the names starting with a prefix.
+
+        Args:
+            prefix (str): The prefix, e.g. "Пит".
+            limit (Optional[int]): Maximum number of names, all of them if None.
+
+        Returns:
+            List[str]: The names, sorted.
+        """
+        start, stop = self._range(prefix)
+        if limit is not None:
+            stop = min(stop, start + limit)
+        return self.names[start:stop]
+
+    def prefix_counts(self, length: int, prefix: str = "") -> Dict[str, int]:
+        """
+        Counts names by their first `length` letters.
+
+        Args:
+            length (int): Prefix length, e.g. 1 for per-letter counts, 2 or 3 for finer ones.
+            prefix (str): Only count names starting with this prefix.
+
+        Returns:
+            Dict[str, int]: Number of names by prefix, sorted by prefix. Names shorter
+            than `length` are counted under themselves.
+        """
+        if length < 1:
+            raise ValueError(f"length must be positive, got {length}")
+
+        start, stop = self._range(prefix)
+        return {
+            key: sum(1 for _ in group)
+            for key, group in groupby(
+                self.names[start:stop], key=lambda name: name[:length]
+            )
+        }
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Writes the index atomically, as a header line and one name per line.
+
+        Args:
+            path (Union[str, Path]): Index file path.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+        ) as file:
+            file.write(f"{PREFIX_INDEX_HEADER}\n")
+            file.writelines(f"{name}\n" for name in self.names)
+        os.replace(file.name, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "PrefixIndex":
+        """
+        Reads an index written by `save`.
+
+        Args:
+            path (Union[str, Path]): Index file path.
+
+        Returns:
+            PrefixIndex: The index.
+
+        Raises:
+            ValueError: If the file is not a prefix index.
+        """
+        with open(path, "r", encoding="utf-8") as file:
+            lines = file.read().splitlines()
+
+        if not lines or lines[0] != PREFIX_INDEX_HEADER:
+            raise ValueError(f"{path} is not a prefix index")
+        return cls(lines[1:])
+
+    def _range(self, prefix: str) -> Tuple[int, int]:
+        """Returns the slice bounds of the names starting with a prefix."""
+        if not prefix:
+            return 0, len(self.names)
+
+        prefix = prefix.capitalize()
+        start = bisect_left(self.names, prefix)
+        # The smallest string that sorts after every string starting with the prefix.
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return start, bisect_left(self.names, upper, lo=start)
+
+
+class PrefixIndexBuilder:
+    """
+    Collects names page by page while the crawl runs, then sorts them once into a `PrefixIndex`.
+    """
+
+    def __init__(self) -> None:
+        self._names: Set[str] = set()
+
+    def add_many(self, names: Iterable[str]) -> None:
+        """
+        Adds names, e.g. a page of the crawl.
+
+        Args:
+            names (Iterable[str]): Animal names.
+        """
+        self._names.update(name.capitalize() for name in names if name)
+
+    def build(self) -> PrefixIndex:
+        """
+        Sorts the collected names into an index.
+
+        Returns:
+            PrefixIndex: The index.
+        """
+        return PrefixIndex(sorted(self._names))
+
+
+def main() -> None:
+    """
+    Queries a saved prefix index: counts and lists the names starting with a prefix.
+    """
+    argument_parser = argparse.ArgumentParser(description=main.__doc__)
+    argument_parser.add_argument("index", type=Path, help="Index file path.")
+    argument_parser.add_argument("prefix", nargs="?", default="")
+    argument_parser.add_argument("--limit", type=int, default=20)
+    argument_parser.add_argument(
+        "--levels",
+        type=int,
+        default=0,
+        help="Print counts by prefixes this many letters longer than the query.",
+    )
+    args = argument_parser.parse_args()
+
+    index = PrefixIndex.load(args.index)
+    print(f"{index.count(args.prefix)} names start with {args.prefix!r}")
+    for name in index.list(args.prefix, limit=args.limit):
+        print(f"  {name}")
+
+    if args.levels:
+        length = len(args.prefix) + args.levels
+        for prefix, count in index.prefix_counts(length, prefix=args.prefix).items():
+            print(f"{prefix:<{length}} {count}")
+
+
+if __name__ == "__main__":
+    main()
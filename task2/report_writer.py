@@ -1,63 +1,409 @@
+import csv
+import errno
+import gzip
+import io
+import json
+import os
+import re
+import secrets
+import shutil
+from datetime import datetime, timezone
+from itertools import chain, count
 from pathlib import Path
-from typing import Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-import pandas as pd
 from loguru import logger
 
+from task2.metrics import PipelineMetrics
 
-class CSVReportWriter:
+if TYPE_CHECKING:
+    import pandas as pd
+
+REPORT_FORMATS = ("csv", "csv.gz", "jsonl", "jsonl.gz")
+NAMING_SCHEMES = ("index", "timestamp")
+
+# `os.link` errors of filesystems without hard links.
+_NO_HARD_LINKS = {errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EXDEV}
+
+
+class ReportWriter:
     """
-    Handles writing a pandas DataFrame to a uniquely named CSV file
-    in a specified directory to avoid overwriting existing reports.
+    Writes report rows to a uniquely named file in a specified directory, never
+    overwriting existing reports.
+
+    Rows are streamed from any iterable to CSV or JSON Lines, optionally gzip-compressed.
+    A report is written to a temporary file first and published under its final name
+    with a hard link, which fails if the name exists: concurrent writers never clobber
+    each other, and readers never see a partial report. On filesystems without hard
+    links, the final name is created exclusively and the report copied into it.
+
+    Unique names follow one of two schemes:
+        - "index": "beasts.csv", "beasts(1).csv", "beasts(2).csv", ... The last
+          published index is kept in a hidden counter file next to the reports, e.g.
+          ".beasts.csv.last", so the next name is found without listing the directory.
+          The directory is listed once, when it has no counter yet.
+        - "timestamp": "beasts-20240131T120000.000000Z.csv". Names are unique without
+          looking at the directory.
+
+    Write time, report size and rows are recorded in `metrics`.
+
+    Usage:
+        writer = ReportWriter("reports", "beasts", report_format="jsonl")
+        writer.write_rows(aggregator.snapshot().items(), columns=["first_letter", "count"])
     """
 
-    def __init__(self, report_dir: Union[Path, str], report_filename: str) -> None:
+    def __init__(
+        self,
+        report_dir: Union[Path, str],
+        report_filename: str,
+        metrics: Optional[PipelineMetrics] = None,
+        report_format: str = "csv",
+        naming: str = "index",
+    ) -> None:
         """
-        Initializes the CSVReportWriter.
+        Initializes the ReportWriter.
 
         Args:
-            report_dir (Union[Path, str]): Directory where the CSV report will be saved.
-            report_filename (str): Base name of the CSV file (without extension).
+            report_dir (Union[Path, str]): Directory where the report will be saved.
+            report_filename (str): Base name of the report file (without extension).
+            metrics (Optional[PipelineMetrics]): Registry to record write metrics in.
+                A new one if None.
+            report_format (str): "csv", "jsonl", or one of them gzip-compressed:
+                "csv.gz", "jsonl.gz".
+            naming (str): Unique naming scheme: "index" or "timestamp".
+
+        Raises:
+            ValueError: If the format or the naming scheme is unknown.
         """
+        if report_format not in REPORT_FORMATS:
+            raise ValueError(
+                f"Unknown report format {report_format!r}, expected one of: {', '.join(REPORT_FORMATS)}"
+            )
+        if naming not in NAMING_SCHEMES:
+            raise ValueError(
+                f"Unknown naming scheme {naming!r}, expected one of: {', '.join(NAMING_SCHEMES)}"
+            )
+
+        self.metrics: PipelineMetrics = metrics or PipelineMetrics()
         self.report_dir: Path = Path(report_dir)
         self.report_filename: str = report_filename
-        self.output_file_path: Path = self.report_dir / f"{self.report_filename}.csv"
+        self.report_format: str = report_format
+        self.naming: str = naming
+        self._hard_links: bool = True
+        self.output_file_path: Path = (
+            self.report_dir / f"{self.report_filename}.{self.report_format}"
+        )
 
-    def _generate_unique_file_path(self, counter: int):
+    def write(self, df: "pd.DataFrame", include_index: bool = False) -> Optional[Path]:
         """
-        Generates a unique file path to avoid overwriting existing CSV reports.
+        Writes the provided DataFrame to a uniquely named report file.
 
         Args:
-            counter (int): Starting counter for uniqueness suffix. Defaults to 1.
+            df (pd.DataFrame): The DataFrame to write.
+            include_index (bool): Whether to include the DataFrame index in the output.
+
+        Returns:
+            Optional[Path]: The report path, None if the DataFrame is empty.
         """
+        if df.empty:
+            logger.warning("Provided DataFrame is empty. Report will not be written.")
+            return None
+
+        columns = [str(column) for column in df.columns]
+        if include_index:
+            columns.insert(0, str(df.index.name or "index"))
+        return self.write_rows(
+            df.itertuples(index=include_index, name=None), columns=columns
+        )
+
+    def write_rows(
+        self, rows: Iterable[Sequence[Any]], columns: Optional[Sequence[str]] = None
+    ) -> Optional[Path]:
+        """
+        Streams rows to a uniquely named report file, one row at a time.
+
+        CSV reports have no header row. JSON Lines reports hold one object per row,
+        keyed by `columns`, or one array per row without them.
+
+        Args:
+            rows (Iterable[Sequence[Any]]): The rows, e.g. a generator.
+            columns (Optional[Sequence[str]]): Column names.
+
+        Returns:
+            Optional[Path]: The report path, None if there are no rows.
+        """
+        rows = iter(rows)
+        first_row = next(rows, None)
+        if first_row is None:
+            logger.warning("No rows to report. Report will not be written.")
+            return None
+
         self.report_dir.mkdir(parents=True, exist_ok=True)
+        with self.metrics.timer("write_seconds"):
+            with _create_temporary(self.report_dir) as file:
+                try:
+                    rows_count = self._write_to(file, chain([first_row], rows), columns)
+                except BaseException:
+                    file.close()
+                    os.unlink(file.name)
+                    raise
+            try:
+                self.output_file_path = self._publish(Path(file.name))
+            finally:
+                os.unlink(file.name)
 
-        while self.output_file_path.exists():
-            self.output_file_path = (
-                self.report_dir / f"{self.report_filename}({counter}).csv"
-            )
-            counter += 1
+        logger.info(f"Report has been written to: {self.output_file_path}")
+        self.metrics.observe("report_bytes", self.output_file_path.stat().st_size)
+        self.metrics.increment("report_rows", rows_count)
+        return self.output_file_path
 
-    def write(self, df: pd.DataFrame, include_index: bool = False) -> None:
+    def _write_to(
+        self,
+        file: BinaryIO,
+        rows: Iterable[Sequence[Any]],
+        columns: Optional[Sequence[str]],
+    ) -> int:
         """
-        Writes the provided DataFrame to a uniquely named CSV file.
+        Encodes rows into an open binary file.
 
         Args:
-            df (pd.DataFrame): The DataFrame to write to the CSV file.
-            include_index (bool): Whether to include the DataFrame index in the CSV output.
+            file (BinaryIO): The temporary report file.
+            rows (Iterable[Sequence[Any]]): The rows.
+            columns (Optional[Sequence[str]]): Column names for JSON Lines objects.
+
+        Returns:
+            int: Number of rows written.
         """
-        if df.empty:
-            logger.warning(
-                "Provided DataFrame is empty. CSV report will not be written."
-            )
+        stream: BinaryIO = file
+        if self.report_format.endswith(".gz"):
+            stream = gzip.GzipFile(fileobj=file, mode="wb")
+
+        rows_count = 0
+        # Closing the text layer closes `stream`; a gzip stream leaves `file` open.
+        with io.TextIOWrapper(stream, encoding="utf-8", newline="") as text:
+            if self.report_format.startswith("csv"):
+                writer = csv.writer(text, lineterminator="\n")
+                for row in rows:
+                    writer.writerow(row)
+                    rows_count += 1
+            else:
+                for row in rows:
+                    record = dict(zip(columns, row)) if columns else list(row)
+                    text.write(
+                        json.dumps(record, ensure_ascii=False, default=_json_default)
+                    )
+                    text.write("\n")
+                    rows_count += 1
+        return rows_count
+
+    def _publish(self, temporary_path: Path) -> Path:
+        """
+        Links a written report under the first free unique name.
+
+        Args:
+            temporary_path (Path): The written report.
+
+        Returns:
+            Path: The report path.
+        """
+        for path, index in self._candidate_paths():
+            try:
+                self._place(temporary_path, path)
+            except FileExistsError:
+                # Taken by a concurrent writer since the name was chosen.
+                continue
+
+            if index is not None:
+                self._store_last_index(index)
+            return path
+
+    def _place(self, temporary_path: Path, path: Path) -> None:
+        """
+        Creates a report name for a written report, never overwriting.
+
+        Args:
+            temporary_path (Path): The written report.
+            path (Path): The report name.
+
+        Raises:
+            FileExistsError: If the name is taken.
+        """
+        if self._hard_links:
+            try:
+                os.link(temporary_path, path)
+                return
+            except OSError as error:
+                # A taken name (EEXIST) is not a missing hard link support.
+                if error.errno not in _NO_HARD_LINKS:
+                    raise
+                logger.warning(
+                    "No hard links in {}, copying reports instead", self.report_dir
+                )
+                self._hard_links = False
+        _copy_exclusive(temporary_path, path)
+
+    def _candidate_paths(self) -> Iterator[Tuple[Path, Optional[int]]]:
+        """
+        Yields unique name candidates in order of preference.
+
+        Yields:
+            Tuple[Path, Optional[int]]: Report paths, endlessly, likely free ones first,
+            with their index for the "index" scheme.
+        """
+        extension = f".{self.report_format}"
+        if self.naming == "timestamp":
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S.%fZ")
+            yield self.report_dir / f"{self.report_filename}-{stamp}{extension}", None
+            for index in count(1):
+                name = f"{self.report_filename}-{stamp}-{index}{extension}"
+                yield self.report_dir / name, None
             return
 
-        self._generate_unique_file_path(counter=1)
-        logger.info(f"Writing report to: {self.output_file_path}")
-        df.to_csv(
-            path_or_buf=self.output_file_path,
-            encoding="utf-8",
-            index=include_index,
-            header=False,
+        last_index = self._read_last_index()
+        if last_index is None:
+            last_index = self._scan_last_index()
+        for index in count(last_index + 1):
+            name = (
+                self.report_filename
+                if index == 0
+                else f"{self.report_filename}({index})"
+            )
+            yield self.report_dir / f"{name}{extension}", index
+
+    @property
+    def _counter_path(self) -> Path:
+        """Hidden file with the last published index of the "index" scheme."""
+        return self.report_dir / f".{self.report_filename}.{self.report_format}.last"
+
+    def _read_last_index(self) -> Optional[int]:
+        """
+        Reads the last published index.
+
+        Returns:
+            Optional[int]: The index, None if there is no readable counter.
+        """
+        try:
+            return int(self._counter_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _store_last_index(self, index: int) -> None:
+        """
+        Atomically replaces the counter with a published index.
+
+        The counter is only a hint: names stay unique because publishing never
+        overwrites, so a counter lowered by a concurrent writer costs a few retries.
+
+        Args:
+            index (int): The index just published.
+        """
+        with _create_temporary(self.report_dir) as file:
+            file.write(str(index).encode())
+        os.replace(file.name, self._counter_path)
+
+    def _scan_last_index(self) -> int:
+        """
+        Finds the last index among existing reports with one directory listing.
+
+        Returns:
+            int: The highest index, -1 if there are no reports.
+        """
+        pattern = re.compile(
+            re.escape(self.report_filename)
+            + r"(?:\((\d+)\))?"
+            + re.escape(f".{self.report_format}")
         )
-        logger.info("Report has been written")
+        indexes = [
+            int(match.group(1) or 0)
+            for match in map(pattern.fullmatch, os.listdir(self.report_dir))
+            if match
+        ]
+        return max(indexes, default=-1)
+
+
+class CSVReportWriter(ReportWriter):
+    """
+    Handles writing a pandas DataFrame to a uniquely named CSV file
+    in a specified directory to avoid overwriting existing reports.
+
+    A `ReportWriter` with the "csv" format, kept for existing callers.
+    """
+
+    def __init__(
+        self,
+        report_dir: Union[Path, str],
+        report_filename: str,
+        metrics: Optional[PipelineMetrics] = None,
+        naming: str = "index",
+    ) -> None:
+        """
+        Initializes the CSVReportWriter.
+
+        Args:
+            report_dir (Union[Path, str]): Directory where the CSV report will be saved.
+            report_filename (str): Base name of the CSV file (without extension).
+            metrics (Optional[PipelineMetrics]): Registry to record write metrics in.
+                A new one if None.
+            naming (str): Unique naming scheme: "index" or "timestamp".
+        """
+        super().__init__(
+            report_dir=report_dir,
+            report_filename=report_filename,
+            metrics=metrics,
+            report_format="csv",
+            naming=naming,
+        )
+
+
+def _create_temporary(directory: Path) -> BinaryIO:
+    """
+    Creates a new temporary file in a directory and opens it for writing.
+
+    Unlike `tempfile`, which creates owner-only files, the file is created with the
+    0o666 mode reduced by the process umask, so published reports get the same
+    permissions as any other new file.
+
+    Args:
+        directory (Path): Directory of the file.
+
+    Returns:
+        BinaryIO: The open file; its `name` is the file path.
+    """
+    while True:
+        try:
+            return open(directory / f"tmp{secrets.token_hex(8)}.tmp", "xb")
+        except FileExistsError:
+            continue
+
+
+def _copy_exclusive(source: Path, path: Path) -> None:
+    """
+    Copies a file to a new path that must not exist yet.
+
+    Raises:
+        FileExistsError: If the path exists.
+    """
+    descriptor = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    try:
+        with open(descriptor, "wb") as target, open(source, "rb") as file:
+            shutil.copyfileobj(file, target)
+    except BaseException:
+        os.unlink(path)
+        raise
+
+
+def _json_default(value: Any) -> Any:
+    """Converts NumPy scalars, e.g. from DataFrame rows, to Python values."""
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
@@ -0,0 +1,286 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, NamedTuple, Optional
+
+import requests
+from loguru import logger
+
+THROTTLE_STATUSES = frozenset({429, 503})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class SchedulerStats(NamedTuple):
+    """
+    A snapshot of a `RequestScheduler`.
+    """
+
+    rate: float
+    concurrency_limit: int
+    in_flight: int
+    requests_count: int
+    retries_count: int
+    throttled_count: int
+    errors_count: int
+
+
+class RequestScheduler:
+    """
+    Paces requests with an adaptive rate and concurrency limit, and retries failed ones.
+
+    The limits follow AIMD (additive increase, multiplicative decrease): every response
+    that is fast and successful raises the rate by `rate_increase` requests per second,
+    and every `concurrency_window` such responses raise the concurrency limit by one.
+    Congestion halves both: "429 Too Many Requests" and "503 Service Unavailable"
+    answers, server errors, connection failures and responses slower than
+    `slow_latency`. Decreases are applied at most once per `decrease_cooldown` seconds,
+    so a burst of failures of concurrent requests counts as one congestion event.
+
+    Requests are paced by a token bucket that holds up to one second of requests.
+    A "Retry-After" header pauses every request until the server is ready again.
+    Failed requests are retried with jittered exponential backoff ("full jitter").
+    The scheduler is shared by all the threads of a crawl.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = 50.0,
+        min_rate: float = 0.5,
+        max_rate: float = 100.0,
+        rate_increase: float = 0.5,
+        decrease_factor: float = 0.5,
+        max_concurrency: int = 10,
+        concurrency_window: int = 10,
+        slow_latency: float = 5.0,
+        decrease_cooldown: float = 1.0,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        max_retry_after: float = 120.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Initializes the scheduler.
+
+        Args:
+            initial_rate (float): Starting request rate, in requests per second.
+            min_rate (float): Lowest request rate.
+            max_rate (float): Highest request rate.
+            rate_increase (float): Rate added by every fast successful response.
+            decrease_factor (float): Factor applied to the rate and the concurrency
+                limit on congestion.
+            max_concurrency (int): Highest (and starting) number of requests in flight.
+            concurrency_window (int): Fast successful responses per concurrency increase.
+            slow_latency (float): Latency, in seconds, treated as congestion.
+            decrease_cooldown (float): Minimal interval between decreases, in seconds.
+            max_retries (int): Retries of a failed request before giving up.
+            backoff_base (float): Backoff of the first retry, in seconds.
+            backoff_cap (float): Longest backoff, in seconds.
+            max_retry_after (float): Longest honored "Retry-After" pause, in seconds.
+            seed (Optional[int]): Seed of the backoff jitter.
+        """
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate_increase = rate_increase
+        self.decrease_factor = decrease_factor
+        self.max_concurrency = max_concurrency
+        self.concurrency_window = concurrency_window
+        self.slow_latency = slow_latency
+        self.decrease_cooldown = decrease_cooldown
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.max_retry_after = max_retry_after
+
+        self.rate: float = min(max(initial_rate, min_rate), max_rate)
+        self.concurrency_limit: int = max_concurrency
+        self.in_flight: int = 0
+        self.requests_count: int = 0
+        self.retries_count: int = 0
+        self.throttled_count: int = 0
+        self.errors_count: int = 0
+
+        self._condition = threading.Condition()
+        self._random = random.Random(seed)
+        self._tokens: float = self.rate
+        self._refilled_at: float = time.monotonic()
+        self._paused_until: float = 0.0
+        self._last_decrease: float = float("-inf")
+        self._successes_in_window: int = 0
+
+    def stats(self) -> SchedulerStats:
+        """
+        Returns the current limits and counters.
+
+        Returns:
+            SchedulerStats: The snapshot.
+        """
+        with self._condition:
+            return SchedulerStats(
+                rate=round(self.rate, 3),
+                concurrency_limit=self.concurrency_limit,
+                in_flight=self.in_flight,
+                requests_count=self.requests_count,
+                retries_count=self.retries_count,
+                throttled_count=self.throttled_count,
+                errors_count=self.errors_count,
+            )
+
+    def request(self, send: Callable[[], requests.Response]) -> requests.Response:
+        """
+        Sends a request when the limits allow it, retrying it on failure.
+
+        Args:
+            send (Callable[[], requests.Response]): Sends the request once.
+
+        Returns:
+            requests.Response: The first response that is not retryable, or the last
+            one when the retries ran out.
+
+        Raises:
+            requests.ConnectionError: If the last attempt failed to connect.
+            requests.Timeout: If the last attempt timed out.
+        """
+        for attempt in range(self.max_retries + 1):
+            self._acquire()
+            started = time.monotonic()
+            retry_after = None
+            try:
+                response = send()
+            except (requests.ConnectionError, requests.Timeout) as error:
+                self._release(started, status=None, retry_after=None)
+                if attempt == self.max_retries:
+                    raise
+                logger.warning(f"Request failed, retrying: {error}")
+            except BaseException:
+                self._abandon()
+                raise
+            else:
+                retry_after = self._retry_after(response)
+                self._release(started, response.status_code, retry_after)
+                if (
+                    response.status_code not in RETRY_STATUSES
+                    or attempt == self.max_retries
+                ):
+                    return response
+                logger.warning(
+                    f"Got {response.status_code} for {response.url}, retrying"
+                )
+
+            with self._condition:
+                self.retries_count += 1
+            if retry_after is None:
+                # With "Retry-After", the pause of the scheduler delays the retry.
+                time.sleep(self._backoff(attempt))
+
+    def _acquire(self) -> None:
+        """Waits for a free concurrency slot, the end of a pause and a rate token."""
+        with self._condition:
+            while self.in_flight >= self.concurrency_limit:
+                self._condition.wait()
+            self.in_flight += 1
+            self.requests_count += 1
+
+        while True:
+            with self._condition:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def _abandon(self) -> None:
+        """Frees the concurrency slot of a request that raised an unexpected error."""
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def _release(
+        self, started: float, status: Optional[int], retry_after: Optional[float]
+    ) -> None:
+        """Frees the concurrency slot and adapts the limits to the outcome of a request."""
+        now = time.monotonic()
+        latency = now - started
+        with self._condition:
+            self.in_flight -= 1
+            if status in THROTTLE_STATUSES:
+                self.throttled_count += 1
+            if status is None or status in RETRY_STATUSES:
+                self.errors_count += 1
+                self._decrease(now)
+            elif latency > self.slow_latency:
+                self._decrease(now)
+            else:
+                self._increase()
+
+            if retry_after is not None:
+                self._paused_until = max(self._paused_until, now + retry_after)
+                self._tokens = 0.0
+            self._condition.notify_all()
+
+    def _increase(self) -> None:
+        """Additive increase of the rate and, every window, of the concurrency limit."""
+        self.rate = min(self.max_rate, self.rate + self.rate_increase)
+        self._successes_in_window += 1
+        if self._successes_in_window >= self.concurrency_window:
+            self._successes_in_window = 0
+            self.concurrency_limit = min(
+                self.max_concurrency, self.concurrency_limit + 1
+            )
+
+    def _decrease(self, now: float) -> None:
+        """Multiplicative decrease of the rate and the concurrency limit."""
+        if now - self._last_decrease < self.decrease_cooldown:
+            return
+        self._last_decrease = now
+        self._successes_in_window = 0
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self.concurrency_limit = max(
+            1, int(self.concurrency_limit * self.decrease_factor)
+        )
+        logger.info(
+            f"Backing off: {self.rate:.2f} requests/s, "
+            f"{self.concurrency_limit} concurrent requests"
+        )
+
+    def _refill(self, now: float) -> None:
+        """Adds the tokens earned since the last refill, up to one second of requests."""
+        capacity = max(1.0, self.rate)
+        elapsed = max(0.0, now - max(self._refilled_at, self._paused_until))
+        self._tokens = min(capacity, self._tokens + elapsed * self.rate)
+        self._refilled_at = max(now, self._refilled_at)
+
+    def _backoff(self, attempt: int) -> float:
+        """Returns a jittered exponential backoff delay for a retry, in seconds."""
+        with self._condition:
+            return self._random.uniform(
+                0, min(self.backoff_cap, self.backoff_base * 2**attempt)
+            )
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """
+        Parses the "Retry-After" header of a response.
+
+        Args:
+            response (requests.Response): The response.
+
+        Returns:
+            Optional[float]: Seconds to wait, capped at `max_retry_after`. None if the
+            header is missing or invalid.
+        """
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(max(0.0, seconds), self.max_retry_after)
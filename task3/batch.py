@@ -0,0 +1,249 @@
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+import numpy as np
+
+
+class LessonBatch(NamedTuple):
+    """
+    Many lessons packed into flat int64 arrays, CSR-style.
+
+    The timestamps of lesson `i` are `pupil[pupil_offsets[i]:pupil_offsets[i + 1]]`
+    and `tutor[tutor_offsets[i]:tutor_offsets[i + 1]]`: login and logout pairs, as in
+    `task3/test_data.json`. Offsets have one entry more than there are lessons.
+
+    Attributes:
+        lessons (np.ndarray): Lesson (start, end) timestamps, shape (lessons, 2).
+        pupil (np.ndarray): Pupil timestamps of all lessons.
+        pupil_offsets (np.ndarray): Start of every lesson in `pupil`.
+        tutor (np.ndarray): Tutor timestamps of all lessons.
+        tutor_offsets (np.ndarray): Start of every lesson in `tutor`.
+    """
+
+    lessons: np.ndarray
+    pupil: np.ndarray
+    pupil_offsets: np.ndarray
+    tutor: np.ndarray
+    tutor_offsets: np.ndarray
+
+    @property
+    def lessons_count(self) -> int:
+        """Number of lessons in the batch."""
+        return len(self.lessons)
+
+    def chunk(self, start: int, stop: int) -> "LessonBatch":
+        """
+        Returns lessons `start` to `stop` as a batch of views into this one.
+
+        Only the offsets are copied, rebased to the chunk.
+
+        Args:
+            start (int): First lesson of the chunk.
+            stop (int): Lesson after the last one of the chunk.
+
+        Returns:
+            LessonBatch: The chunk.
+        """
+        pupil_offsets = self.pupil_offsets[start : stop + 1]
+        tutor_offsets = self.tutor_offsets[start : stop + 1]
+        return LessonBatch(
+            lessons=self.lessons[start:stop],
+            pupil=self.pupil[pupil_offsets[0] : pupil_offsets[-1]],
+            pupil_offsets=pupil_offsets - pupil_offsets[0],
+            tutor=self.tutor[tutor_offsets[0] : tutor_offsets[-1]],
+            tutor_offsets=tutor_offsets - tutor_offsets[0],
+        )
+
+    def lesson(self, index: int) -> Dict[str, List[int]]:
+        """
+        Unpacks one lesson into the `appearance` format.
+
+        Args:
+            index (int): Lesson index.
+
+        Returns:
+            Dict[str, List[int]]: Lesson, pupil and tutor timestamps.
+        """
+        return {
+            "lesson": self.lessons[index].tolist(),
+            "pupil": self.pupil[
+                self.pupil_offsets[index] : self.pupil_offsets[index + 1]
+            ].tolist(),
+            "tutor": self.tutor[
+                self.tutor_offsets[index] : self.tutor_offsets[index + 1]
+            ].tolist(),
+        }
+
+    @classmethod
+    def from_lessons(
+        cls, lessons_data: Iterable[Dict[str, List[int]]]
+    ) -> "LessonBatch":
+        """
+        Packs lessons in the `appearance` format into a batch.
+
+        An unpaired trailing login of a role is dropped, as `appearance` does.
+
+        Args:
+            lessons_data (Iterable[Dict[str, List[int]]]): Lesson, pupil and tutor
+                timestamps per lesson.
+
+        Returns:
+            LessonBatch: The packed lessons.
+        """
+        lessons, pupil, tutor = [], [], []
+        pupil_counts, tutor_counts = [], []
+        for lesson_data in lessons_data:
+            lessons.append(lesson_data["lesson"][:2])
+            for timestamps, counts, role in (
+                (pupil, pupil_counts, "pupil"),
+                (tutor, tutor_counts, "tutor"),
+            ):
+                paired = len(lesson_data[role]) // 2 * 2
+                timestamps.extend(lesson_data[role][:paired])
+                counts.append(paired)
+
+        return cls(
+            lessons=np.array(lessons, dtype=np.int64).reshape(-1, 2),
+            pupil=np.array(pupil, dtype=np.int64),
+            pupil_offsets=_offsets(pupil_counts),
+            tutor=np.array(tutor, dtype=np.int64),
+            tutor_offsets=_offsets(tutor_counts),
+        )
+
+
+def batch_appearance(batch: LessonBatch) -> np.ndarray:
+    """
+    Calculates the effective duration of every lesson in a batch at once.
+
+    Every interval is clipped to its lesson and turned into a login (+1) and a logout
+    (-1) event of its role. Events are sorted by lesson and time; cumulative sums give
+    the number of open pupil and tutor connections after every event, and the time to
+    the next event counts when both are positive. Gives the same results as
+    `appearance` without any per-interval Python objects.
+
+    Args:
+        batch (LessonBatch): The lessons.
+
+    Returns:
+        np.ndarray: int64 durations, one per lesson.
+
+    Raises:
+        ValueError: If the offsets of a role do not cover its timestamps, or a lesson
+            has an odd number of timestamps of a role.
+    """
+    lessons_count = batch.lessons_count
+    pupil_lessons, pupil_starts, pupil_ends = _clipped_intervals(
+        batch.pupil, batch.pupil_offsets, batch.lessons
+    )
+    tutor_lessons, tutor_starts, tutor_ends = _clipped_intervals(
+        batch.tutor, batch.tutor_offsets, batch.lessons
+    )
+
+    event_lessons = np.concatenate(
+        [pupil_lessons, pupil_lessons, tutor_lessons, tutor_lessons]
+    )
+    event_times = np.concatenate([pupil_starts, pupil_ends, tutor_starts, tutor_ends])
+    pupil_deltas = _connection_deltas(len(pupil_lessons), 0, 2 * len(tutor_lessons))
+    tutor_deltas = _connection_deltas(len(tutor_lessons), 2 * len(pupil_lessons), 0)
+
+    order = _event_order(event_lessons, event_times, batch.lessons)
+    event_lessons, event_times = event_lessons[order], event_times[order]
+
+    # Every lesson opens and closes as many connections of a role, so the global
+    # running counts are back to zero at each lesson boundary.
+    pupil_present = np.cumsum(pupil_deltas[order])[:-1] > 0
+    tutor_present = np.cumsum(tutor_deltas[order])[:-1] > 0
+    both_present = (
+        pupil_present & tutor_present & (event_lessons[:-1] == event_lessons[1:])
+    )
+
+    durations = np.zeros(lessons_count, dtype=np.int64)
+    np.add.at(
+        durations,
+        event_lessons[:-1][both_present],
+        np.diff(event_times)[both_present],
+    )
+    return durations
+
+
+def _event_order(
+    event_lessons: np.ndarray, event_times: np.ndarray, lessons: np.ndarray
+) -> np.ndarray:
+    """
+    Orders events by lesson, then by time.
+
+    Clipped event times lie within their lesson, so both keys fit into one int64 key:
+    the lesson index times the longest lesson, plus the time since the lesson start.
+    A single-key argsort is several times faster than `np.lexsort`, which is kept for
+    batches whose key would overflow.
+
+    Args:
+        event_lessons (np.ndarray): Lesson index of every event.
+        event_times (np.ndarray): Timestamp of every event.
+        lessons (np.ndarray): Lesson (start, end) timestamps.
+
+    Returns:
+        np.ndarray: Indexes that sort the events.
+    """
+    if not len(event_lessons):
+        return np.zeros(0, dtype=np.int64)
+    span = int(np.max(lessons[:, 1] - lessons[:, 0])) + 1
+    if len(lessons) * span >= np.iinfo(np.int64).max:
+        return np.lexsort((event_times, event_lessons))
+    return np.argsort(event_lessons * span + (event_times - lessons[event_lessons, 0]))
+
+
+def _connection_deltas(intervals: int, before: int, after: int) -> np.ndarray:
+    """
+    Changes of one role's open connections for the events of `batch_appearance`.
+
+    Args:
+        intervals (int): Number of intervals of the role.
+        before (int): Number of other role events before the role's events.
+        after (int): Number of other role events after them.
+
+    Returns:
+        np.ndarray: Zeros for the other role's events, +1 for logins and -1 for logouts.
+    """
+    deltas = np.zeros(before + 2 * intervals + after, dtype=np.int32)
+    deltas[before : before + intervals] = 1
+    deltas[before + intervals : before + 2 * intervals] = -1
+    return deltas
+
+
+def _offsets(counts: List[int]) -> np.ndarray:
+    """Turns per-lesson lengths into CSR offsets."""
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+def _clipped_intervals(
+    timestamps: np.ndarray, offsets: np.ndarray, lessons: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Splits one role's timestamps into intervals clipped to their lessons.
+
+    Args:
+        timestamps (np.ndarray): Login and logout pairs of all lessons.
+        offsets (np.ndarray): Start of every lesson in `timestamps`.
+        lessons (np.ndarray): Lesson (start, end) timestamps.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Lesson index, start and end of every
+        non-empty clipped interval.
+
+    Raises:
+        ValueError: If the offsets do not cover the timestamps, or a lesson has an odd
+            number of timestamps.
+    """
+    if offsets[0] != 0 or offsets[-1] != len(timestamps):
+        raise ValueError("Offsets must span all timestamps, from 0")
+    counts = np.diff(offsets)
+    if np.any(counts % 2):
+        raise ValueError("Every lesson needs login and logout timestamp pairs")
+
+    interval_lessons = np.repeat(np.arange(len(counts)), counts // 2)
+    starts = np.maximum(timestamps[0::2], lessons[interval_lessons, 0])
+    ends = np.minimum(timestamps[1::2], lessons[interval_lessons, 1])
+    non_empty = starts < ends
+    return interval_lessons[non_empty], starts[non_empty], ends[non_empty]
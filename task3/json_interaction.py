@@ -1,23 +1,105 @@
 import json
+import re
+from functools import cached_property
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, TextIO, Tuple, Union
+
+from task3.batch import LessonBatch
+
+DEFAULT_JSON_FILE = Path(__file__).parent / "test_data.json"
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class LessonRecord(NamedTuple):
+    """
+    One test case: the intervals of a lesson and the expected connection duration.
+    """
+
+    intervals: Dict[str, List[int]]
+    answer: int
 
 
 class TestDataManager:
     """
     Load and manage test data from a JSON file.
+
+    The file holds a JSON array of {"intervals": ..., "answer": ...} objects, or one
+    such object per line for JSON Lines files (".jsonl", ".ndjson").
+
+    `test_data`, `lessons_data` and `test_answers` load the whole file on first
+    access. For large exports, `iter_records` and `iter_batches` stream the file in
+    constant memory instead.
     """
 
-    def __init__(self) -> None:
+    # Not a test class, despite its name.
+    __test__ = False
+
+    def __init__(
+        self, json_file: Optional[Union[str, Path]] = None, chunk_size: int = 1 << 16
+    ) -> None:
         """
         Initializes the data manager.
 
-        Loads the JSON data from the file system, and extracts lesson intervals and expected answers.
+        Args:
+            json_file (Optional[Union[str, Path]]): Test data file;
+                "task3/test_data.json" if None.
+            chunk_size (int): Characters read at a time when streaming a JSON array.
+        """
+        self.json_file: Path = Path(json_file) if json_file else DEFAULT_JSON_FILE
+        self.chunk_size: int = chunk_size
+
+    @cached_property
+    def test_data(self) -> List[Dict[str, Any]]:
+        """Test data, loaded on first access."""
+        return self._deserialize_json()
+
+    @cached_property
+    def lessons_data(self) -> List[Dict[str, List[int]]]:
+        """Lessons interval data, loaded on first access."""
+        return self._extract_lessons_data()
+
+    @cached_property
+    def test_answers(self) -> List[int]:
+        """Expected connection durations, loaded on first access."""
+        return self._extract_test_answers()
+
+    def iter_records(self) -> Iterator[LessonRecord]:
+        """
+        Streams test cases from the file, one at a time.
+
+        Yields:
+            LessonRecord: Lesson intervals and the expected answer.
+
+        Raises:
+            ValueError: If the file is not a JSON array or JSON Lines of test cases.
+        """
+        with open(self.json_file, "r", encoding="utf-8") as file:
+            if self.json_file.suffix in JSON_LINES_SUFFIXES:
+                test_cases = _iter_json_lines(file)
+            else:
+                test_cases = _iter_json_array(file, self.chunk_size)
+            for test_case in test_cases:
+                yield LessonRecord(test_case["intervals"], test_case["answer"])
+
+    def iter_batches(self, batch_size: int) -> Iterator[Tuple[LessonBatch, List[int]]]:
         """
-        self.json_file: Path = Path(__file__).parent / "test_data.json"
-        self.test_data: List[Dict[str, Any]] = self._deserialize_json()
-        self.lessons_data: List[Dict[str, List[int]]] = self._extract_lessons_data()
-        self.test_answers: List[int] = self._extract_test_answers()
+        Streams test cases packed for the vectorized scorer.
+
+        Args:
+            batch_size (int): Lessons per batch; the last batch may be smaller.
+
+        Yields:
+            Tuple[LessonBatch, List[int]]: Packed lessons and their expected answers.
+        """
+        records = self.iter_records()
+        while chunk := list(islice(records, batch_size)):
+            yield (
+                LessonBatch.from_lessons(record.intervals for record in chunk),
+                [record.answer for record in chunk],
+            )
 
     def _deserialize_json(self) -> List[Dict[str, Any]]:
         """Deserializes test data from the JSON file.
@@ -26,6 +108,8 @@ class TestDataManager:
             List[Dict[str, Any]]: Test data.
         """
         with open(self.json_file, "r", encoding="utf-8") as file:
+            if self.json_file.suffix in JSON_LINES_SUFFIXES:
+                return list(_iter_json_lines(file))
             test_data = json.load(file)
 
         return test_data
@@ -46,3 +130,86 @@ class TestDataManager:
             for each lesson.
         """
         return [interval["answer"] for interval in self.test_data]
+
+
+def _iter_json_lines(file: TextIO) -> Iterator[Any]:
+    """
+    Parses a JSON Lines file one line at a time. Blank lines are skipped.
+
+    Args:
+        file (TextIO): The open file.
+
+    Yields:
+        Any: The value of every line.
+    """
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _iter_json_array(file: TextIO, chunk_size: int) -> Iterator[Any]:
+    """
+    Parses the items of a top-level JSON array incrementally.
+
+    Only the current item and one chunk of text are held in memory. Items are decoded
+    with `json.JSONDecoder.raw_decode`; an item cut off at the end of the buffer is
+    decoded again once the next chunk is read.
+
+    Args:
+        file (TextIO): The open file.
+        chunk_size (int): Characters read at a time.
+
+    Yields:
+        Any: The items of the array.
+
+    Raises:
+        ValueError: If the file is not a single JSON array.
+    """
+    decoder = json.JSONDecoder()
+    buffer, position, eof = "", 0, False
+
+    def next_char() -> Optional[str]:
+        """Skips whitespace, reading more text as needed; None at the end of file."""
+        nonlocal buffer, position, eof
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position < len(buffer):
+                return buffer[position]
+            if eof:
+                return None
+            buffer, position = file.read(chunk_size), 0
+            eof = not buffer
+
+    if next_char() != "[":
+        raise ValueError(f"{file.name} is not a JSON array")
+    position += 1
+    if next_char() == "]":
+        position += 1
+    else:
+        while True:
+            next_char()
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    end = None
+                # A number that ends the buffer may go on in the next chunk.
+                if end is not None and (end < len(buffer) or eof):
+                    break
+                chunk = file.read(chunk_size)
+                buffer, position, eof = buffer[position:] + chunk, 0, not chunk
+
+            position = end
+            yield item
+
+            separator = next_char()
+            position += 1
+            if separator == "]":
+                break
+            if separator != ",":
+                raise ValueError(f"Expected ',' or ']' in {file.name} after an item")
+
+    if next_char() is not None:
+        raise ValueError(f"Unexpected data in {file.name} after the JSON array")
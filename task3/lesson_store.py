@@ -0,0 +1,237 @@
+import argparse
+import os
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, Tuple, Union
+
+import numpy as np
+
+from task3.batch import LessonBatch
+from task3.json_interaction import LessonRecord, TestDataManager
+
+STORE_FORMAT_VERSION = 1
+STORE_SUFFIX = ".lessons"
+
+_MAGIC = b"LESSONS\x00"
+# Magic, format version, lessons count, pupil and tutor timestamps count.
+_HEADER = struct.Struct("<8sIQQQ")
+_HEADER_SIZE = 64
+_DTYPE = np.dtype("<i8")
+# Columns in file order, each an int64 array.
+_COLUMNS = ("lessons", "answers", "pupil_offsets", "pupil", "tutor_offsets", "tutor")
+
+
+class LessonStore:
+    """
+    A compact columnar binary store of lesson intervals, read through a memory map.
+
+    The file has a 64-byte header and little-endian int64 columns: lesson bounds,
+    expected answers, and per role CSR offsets and login/logout timestamps, as in
+    `LessonBatch`. Opening a store only maps the file: lessons are read from the page
+    cache on access, and `batch`, `lesson` and the streamed records and batches are
+    views without copies.
+
+    Usage:
+        convert_json("export.jsonl", "export.lessons")
+        store = LessonStore("export.lessons")
+        durations = batch_appearance(store.batch)
+        assert durations.tolist() == store.answers.tolist()
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Opens a store written by `convert_json`.
+
+        Args:
+            path (Union[str, Path]): Store file path.
+
+        Raises:
+            ValueError: If the file is not a lesson store, has another format version,
+                or is truncated.
+        """
+        self.path: Path = Path(path)
+        with open(self.path, "rb") as file:
+            header = file.read(_HEADER_SIZE)
+        if len(header) < _HEADER_SIZE or not header.startswith(_MAGIC):
+            raise ValueError(f"{self.path} is not a lesson store")
+        _, version, lessons_count, pupil_count, tutor_count = _HEADER.unpack_from(
+            header
+        )
+        if version != STORE_FORMAT_VERSION:
+            raise ValueError(f"{self.path} has an unsupported store version {version}")
+
+        lengths = _column_lengths(lessons_count, pupil_count, tutor_count)
+        expected_size = _HEADER_SIZE + sum(lengths.values()) * _DTYPE.itemsize
+        if self.path.stat().st_size != expected_size:
+            raise ValueError(f"{self.path} is truncated or corrupt")
+
+        data = np.memmap(self.path, dtype=_DTYPE, mode="r", offset=_HEADER_SIZE)
+        columns: Dict[str, np.ndarray] = {}
+        offset = 0
+        for column in _COLUMNS:
+            columns[column] = data[offset : offset + lengths[column]]
+            offset += lengths[column]
+
+        self.answers: np.ndarray = columns.pop("answers")
+        self.batch: LessonBatch = LessonBatch(
+            lessons=columns.pop("lessons").reshape(-1, 2), **columns
+        )
+
+    def __len__(self) -> int:
+        """Number of lessons in the store."""
+        return self.batch.lessons_count
+
+    def lesson(self, index: int) -> Dict[str, np.ndarray]:
+        """
+        Returns one lesson for `appearance`, as views into the store.
+
+        Args:
+            index (int): Lesson index.
+
+        Returns:
+            Dict[str, np.ndarray]: Lesson, pupil and tutor timestamps.
+        """
+        batch = self.batch
+        return {
+            "lesson": batch.lessons[index],
+            "pupil": batch.pupil[
+                batch.pupil_offsets[index] : batch.pupil_offsets[index + 1]
+            ],
+            "tutor": batch.tutor[
+                batch.tutor_offsets[index] : batch.tutor_offsets[index + 1]
+            ],
+        }
+
+    def iter_records(self) -> Iterator[LessonRecord]:
+        """
+        Yields every test case, as `TestDataManager.iter_records` does.
+
+        Yields:
+            LessonRecord: Lesson intervals, as views into the store, and the expected
+            answer.
+        """
+        for index in range(len(self)):
+            yield LessonRecord(self.lesson(index), int(self.answers[index]))
+
+    def iter_batches(self, batch_size: int) -> Iterator[Tuple[LessonBatch, np.ndarray]]:
+        """
+        Yields consecutive chunks of the store for a batch scorer, as
+        `TestDataManager.iter_batches` does.
+
+        Args:
+            batch_size (int): Lessons per chunk; the last chunk may be smaller.
+
+        Yields:
+            Tuple[LessonBatch, np.ndarray]: Views into the store, and the expected
+            answers of the chunk.
+        """
+        for start in range(0, len(self), batch_size):
+            stop = min(start + batch_size, len(self))
+            yield self.batch.chunk(start, stop), self.answers[start:stop]
+
+
+def convert_json(
+    json_file: Union[str, Path],
+    store_path: Union[str, Path],
+    batch_size: int = 100_000,
+) -> Path:
+    """
+    Converts lesson test data from JSON or JSON Lines to a lesson store.
+
+    Lessons are streamed with `TestDataManager.iter_batches` and every column is
+    appended to its own temporary file, so memory stays bounded by one batch. The
+    columns are then concatenated into a temporary store file, which replaces the
+    target atomically. The store is created with the 0o666 mode reduced by the
+    process umask, like any other new file, so other users can map it.
+
+    Args:
+        json_file (Union[str, Path]): Test data, as read by `TestDataManager`.
+        store_path (Union[str, Path]): Output store file path.
+        batch_size (int): Lessons converted at a time.
+
+    Returns:
+        Path: The store path.
+    """
+    store_path = Path(store_path)
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    manager = TestDataManager(json_file=json_file)
+    lessons_count = pupil_count = tutor_count = 0
+
+    with tempfile.TemporaryDirectory(dir=store_path.parent) as columns_dir:
+        column_files = {
+            column: open(Path(columns_dir) / column, "wb") for column in _COLUMNS
+        }
+        try:
+            for column in ("pupil_offsets", "tutor_offsets"):
+                np.zeros(1, dtype=_DTYPE).tofile(column_files[column])
+
+            for batch, answers in manager.iter_batches(batch_size):
+                columns = {
+                    "lessons": batch.lessons,
+                    "answers": np.array(answers, dtype=_DTYPE),
+                    "pupil_offsets": batch.pupil_offsets[1:] + pupil_count,
+                    "pupil": batch.pupil,
+                    "tutor_offsets": batch.tutor_offsets[1:] + tutor_count,
+                    "tutor": batch.tutor,
+                }
+                for column, array in columns.items():
+                    array.astype(_DTYPE, copy=False).tofile(column_files[column])
+                lessons_count += batch.lessons_count
+                pupil_count += len(batch.pupil)
+                tutor_count += len(batch.tutor)
+        finally:
+            for file in column_files.values():
+                file.close()
+
+        # Written next to the columns, on the target's filesystem; the directory and
+        # anything left in it are removed with it.
+        temporary_path = Path(columns_dir) / "store"
+        with open(temporary_path, "xb") as store_file:
+            header = _HEADER.pack(
+                _MAGIC,
+                STORE_FORMAT_VERSION,
+                lessons_count,
+                pupil_count,
+                tutor_count,
+            )
+            store_file.write(header.ljust(_HEADER_SIZE, b"\x00"))
+            for column in _COLUMNS:
+                with open(Path(columns_dir) / column, "rb") as column_file:
+                    shutil.copyfileobj(column_file, store_file)
+        os.replace(temporary_path, store_path)
+
+    return store_path
+
+
+def _column_lengths(
+    lessons_count: int, pupil_count: int, tutor_count: int
+) -> Dict[str, int]:
+    """Returns the number of int64 values of every column."""
+    return {
+        "lessons": 2 * lessons_count,
+        "answers": lessons_count,
+        "pupil_offsets": lessons_count + 1,
+        "pupil": pupil_count,
+        "tutor_offsets": lessons_count + 1,
+        "tutor": tutor_count,
+    }
+
+
+def main() -> None:
+    """
+    Converts lesson test data from JSON or JSON Lines to a memory-mapped lesson store.
+    """
+    argument_parser = argparse.ArgumentParser(description=main.__doc__)
+    argument_parser.add_argument("json_file", type=Path)
+    argument_parser.add_argument("store_path", type=Path)
+    argument_parser.add_argument("--batch-size", type=int, default=100_000)
+    args = argument_parser.parse_args()
+
+    convert_json(args.json_file, args.store_path, batch_size=args.batch_size)
+    print(f"{len(LessonStore(args.store_path))} lessons written to: {args.store_path}")
+
+
+if __name__ == "__main__":
+    main()
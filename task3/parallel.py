@@ -0,0 +1,220 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from task3.batch import LessonBatch, batch_appearance
+from task3.solution import ENGINES, appearance
+
+PARALLEL_ENGINES = ("batch",) + tuple(ENGINES)
+
+# Worker process state: the last shared batch mapped by `_attach_batch`.
+_worker_memory: Optional[shared_memory.SharedMemory] = None
+_worker_batch: Optional[LessonBatch] = None
+
+
+class ParallelScorer:
+    """
+    Scores large lesson datasets on several cores with a process pool.
+
+    The lessons are packed into a `LessonBatch` and copied once into a shared memory
+    block. A task only names the block and a (start, stop) range of lessons: no lesson
+    dicts are pickled to the workers, every worker maps a block once, and every chunk
+    sends back one array of durations. Chunks are scored with `batch_appearance` or,
+    per lesson, with an `appearance` engine.
+
+    Used as a context manager, the scorer keeps one process pool for all the batches
+    it scores, e.g. a stream of batches; otherwise every call starts its own pool.
+
+    Usage:
+        with ParallelScorer(workers=8, chunk_size=50_000) as scorer:
+            for batch, answers in TestDataManager().iter_batches(1_000_000):
+                durations = scorer.score_batch(batch)
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: int = 10_000,
+        engine: str = "batch",
+    ) -> None:
+        """
+        Initializes the scorer.
+
+        Args:
+            workers (Optional[int]): Number of worker processes; the number of CPUs if
+                None. With one worker, lessons are scored in this process.
+            chunk_size (int): Lessons per task.
+            engine (str): "batch" for `batch_appearance`, or an `appearance` engine:
+                "sweep" or "pairwise".
+
+        Raises:
+            ValueError: If the engine is unknown, or the worker count or the chunk
+                size is not positive.
+        """
+        if engine not in PARALLEL_ENGINES:
+            raise ValueError(
+                f"Unknown engine {engine!r}, expected one of: {', '.join(PARALLEL_ENGINES)}"
+            )
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be positive")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        self.workers: int = workers or os.cpu_count() or 1
+        self.chunk_size: int = chunk_size
+        self.engine: str = engine
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "ParallelScorer":
+        if self.workers > 1 and self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shuts down the process pool of the context manager, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def score(self, lessons_data: Iterable[Dict[str, List[int]]]) -> List[int]:
+        """
+        Calculates the effective duration of every lesson.
+
+        Args:
+            lessons_data (Iterable[Dict[str, List[int]]]): Lesson, pupil and tutor
+                timestamps per lesson, e.g. `TestDataManager().lessons_data`.
+
+        Returns:
+            List[int]: Durations, in input order.
+        """
+        return self.score_batch(LessonBatch.from_lessons(lessons_data)).tolist()
+
+    def score_batch(self, batch: LessonBatch) -> np.ndarray:
+        """
+        Calculates the effective duration of every lesson of a packed batch.
+
+        Args:
+            batch (LessonBatch): The lessons.
+
+        Returns:
+            np.ndarray: int64 durations, in input order.
+        """
+        chunks = [
+            (start, min(start + self.chunk_size, batch.lessons_count))
+            for start in range(0, batch.lessons_count, self.chunk_size)
+        ]
+        if not chunks:
+            return np.zeros(0, dtype=np.int64)
+        if self.workers == 1 or len(chunks) == 1:
+            return np.concatenate(
+                [_score_chunk(batch, self.engine, *chunk) for chunk in chunks]
+            )
+
+        executor = self._executor
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=min(self.workers, len(chunks)))
+        layout = [(field, len(array)) for field, array in zip(batch._fields, batch)]
+        size = sum(array.size for array in batch) * np.dtype(np.int64).itemsize
+        memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            _copy_to_buffer(batch, memory.buf, layout)
+            tasks = [(memory.name, layout, self.engine, *chunk) for chunk in chunks]
+            # `map` yields in submission order, whatever chunk finishes first.
+            durations = list(executor.map(_score_shared_chunk, tasks))
+            return np.concatenate(durations)
+        finally:
+            memory.close()
+            memory.unlink()
+            if executor is not self._executor:
+                executor.shutdown()
+
+
+def _batch_views(buffer: memoryview, layout: List[Tuple[str, int]]) -> LessonBatch:
+    """
+    Lays out the arrays of a batch over one buffer.
+
+    Args:
+        buffer (memoryview): Buffer of the shared memory block.
+        layout (List[Tuple[str, int]]): Field names and lengths, in `LessonBatch` order.
+
+    Returns:
+        LessonBatch: int64 arrays backed by the buffer.
+    """
+    arrays = {}
+    offset = 0
+    for field, length in layout:
+        shape = (length, 2) if field == "lessons" else (length,)
+        arrays[field] = np.ndarray(shape, dtype=np.int64, buffer=buffer, offset=offset)
+        offset += arrays[field].nbytes
+    return LessonBatch(**arrays)
+
+
+def _copy_to_buffer(
+    batch: LessonBatch, buffer: memoryview, layout: List[Tuple[str, int]]
+) -> None:
+    """Copies a batch into a buffer; no view of the buffer outlives the call."""
+    for shared_array, array in zip(_batch_views(buffer, layout), batch):
+        shared_array[...] = array
+
+
+def _attach_batch(name: str, layout: List[Tuple[str, int]]) -> LessonBatch:
+    """
+    Maps a shared batch in a worker process, once per batch.
+
+    The mapping of the previous batch is closed when the next one is attached, so a
+    worker keeps at most one block alive after the scorer unlinks it.
+
+    Args:
+        name (str): Name of the shared memory block.
+        layout (List[Tuple[str, int]]): Field names and lengths, in `LessonBatch` order.
+
+    Returns:
+        LessonBatch: int64 arrays backed by the block.
+    """
+    global _worker_memory, _worker_batch
+    if _worker_memory is None or _worker_memory.name != name:
+        if _worker_memory is not None:
+            # The views must be released before their buffer is unmapped.
+            _worker_batch = None
+            _worker_memory.close()
+        _worker_memory = shared_memory.SharedMemory(name=name)
+        _worker_batch = _batch_views(_worker_memory.buf, layout)
+    return _worker_batch
+
+
+def _score_shared_chunk(
+    task: Tuple[str, List[Tuple[str, int]], str, int, int],
+) -> np.ndarray:
+    """Scores a chunk of a shared batch in a worker process."""
+    name, layout, engine, start, stop = task
+    return _score_chunk(_attach_batch(name, layout), engine, start, stop)
+
+
+def _score_chunk(batch: LessonBatch, engine: str, start: int, stop: int) -> np.ndarray:
+    """
+    Scores lessons `start` to `stop` of a batch.
+
+    Args:
+        batch (LessonBatch): The lessons.
+        engine (str): "batch" or an `appearance` engine.
+        start (int): First lesson of the chunk.
+        stop (int): Lesson after the last one of the chunk.
+
+    Returns:
+        np.ndarray: int64 durations of the chunk.
+    """
+    if engine == "batch":
+        return batch_appearance(batch.chunk(start, stop))
+    return np.array(
+        [
+            appearance(batch.lesson(index), engine=engine)
+            for index in range(start, stop)
+        ],
+        dtype=np.int64,
+    )
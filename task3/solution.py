@@ -1,12 +1,38 @@
-from typing import Dict, List, Set, Tuple
+from typing import Callable, Dict, List, Set, Tuple
 
+Interval = Tuple[int, int]
 
-def appearance(lesson_data: Dict[str, List[int]]) -> int:
+
+def appearance(lesson_data: Dict[str, List[int]], engine: str = "sweep") -> int:
     """Calculates the effective lesson durations.
 
     For each lesson, computes the overlapping intervals during which both the pupil
     and tutor are present within the lesson timeframe. The total overlapping time is
     calculated and stored for each lesson.
+
+    Args:
+        lesson_data (Dict[str, List[int]]): Lesson, pupil and tutor timestamps.
+        engine (str): Intersection engine: "sweep" merges each role's intervals and
+            intersects them in one pass; "pairwise" is the reference implementation
+            that compares every pupil interval with every tutor interval.
+
+    Returns:
+        int: Seconds during which both the pupil and the tutor were in the lesson.
+
+    Raises:
+        ValueError: If the engine is unknown.
+    """
+    if engine not in ENGINES:
+        raise ValueError(
+            f"Unknown engine {engine!r}, expected one of: {', '.join(ENGINES)}"
+        )
+    return ENGINES[engine](lesson_data)
+
+
+def _pairwise_appearance(lesson_data: Dict[str, List[int]]) -> int:
+    """Intersects every pupil interval with every tutor interval, in O(n·m).
+
+    Kept as the reference implementation of the sweep engine.
     """
     lesson_start = lesson_data["lesson"][0]
     lesson_end = lesson_data["lesson"][1]
@@ -16,6 +42,8 @@ def appearance(lesson_data: Dict[str, List[int]]) -> int:
     connections = _get_connection_intervals(
         pupil_intervals, tutor_intervals, lesson_start, lesson_end
     )
+    if not connections:
+        return 0
     connections_intersected = _intersect_pure_intervals(connections)
 
     lesson_duration = sum(
@@ -24,6 +52,27 @@ def appearance(lesson_data: Dict[str, List[int]]) -> int:
     return lesson_duration
 
 
+def _sweep_appearance(lesson_data: Dict[str, List[int]]) -> int:
+    """Intersects the merged intervals of both roles, in O((n + m) log(n + m)).
+
+    Each role's intervals are clipped to the lesson and merged into sorted disjoint
+    intervals, which are then intersected with two pointers.
+    """
+    lesson_start = lesson_data["lesson"][0]
+    lesson_end = lesson_data["lesson"][1]
+    pupil_intervals = _merge_role_intervals(
+        _get_lesson_intervals_by_role(lesson=lesson_data, role="pupil"),
+        lesson_start,
+        lesson_end,
+    )
+    tutor_intervals = _merge_role_intervals(
+        _get_lesson_intervals_by_role(lesson=lesson_data, role="tutor"),
+        lesson_start,
+        lesson_end,
+    )
+    return _overlap_duration(pupil_intervals, tutor_intervals)
+
+
 def _get_lesson_intervals_by_role(
     lesson: Dict[str, List[int]], role: str
 ) -> Set[Tuple[int, int]]:
@@ -90,3 +139,62 @@ def _intersect_pure_intervals(
         else:
             intervals_intersected.append((current_start, current_end))
     return intervals_intersected
+
+
+def _merge_role_intervals(
+    intervals: Set[Interval], lesson_start: int, lesson_end: int
+) -> List[Interval]:
+    """Clips one role's intervals to the lesson and merges the overlapping ones.
+
+    Args:
+        intervals (Set[Tuple[int, int]]): (login, logout) pairs of one role.
+        lesson_start (int): Start timestamp of the lesson.
+        lesson_end (int): End timestamp of the lesson.
+
+    Returns:
+        List[Tuple[int, int]]: Sorted, disjoint, non-empty intervals within the lesson.
+    """
+    clipped = sorted(
+        (max(start, lesson_start), min(end, lesson_end)) for start, end in intervals
+    )
+    merged: List[Interval] = []
+    for start, end in clipped:
+        if start >= end:
+            continue
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _overlap_duration(first: List[Interval], second: List[Interval]) -> int:
+    """Sums the overlap of two sorted lists of disjoint intervals in one pass.
+
+    Args:
+        first (List[Tuple[int, int]]): Sorted disjoint intervals.
+        second (List[Tuple[int, int]]): Sorted disjoint intervals.
+
+    Returns:
+        int: Total length of the intersection of both lists.
+    """
+    duration = 0
+    i = j = 0
+    while i < len(first) and j < len(second):
+        start = max(first[i][0], second[j][0])
+        end = min(first[i][1], second[j][1])
+        if start < end:
+            duration += end - start
+        # The interval that ends first cannot overlap anything further in the other list.
+        if first[i][1] < second[j][1]:
+            i += 1
+        else:
+            j += 1
+    return duration
+
+
+ENGINES: Dict[str, Callable[[Dict[str, List[int]]], int]] = {
+    "sweep": _sweep_appearance,
+    "pairwise": _pairwise_appearance,
+}
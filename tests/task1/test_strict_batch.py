@@ -0,0 +1,102 @@
+import pytest
+
+from task1.decorated_funcs import sum_two
+from task1.strict_modes import (
+    get_default_mode,
+    get_stats,
+    reset_stats,
+    set_default_mode,
+)
+from task1.strict_types_decorator import strict
+
+
+def test_map_over_lists():
+    """
+    Tests that `map` runs the function over whole columns and counts every row.
+    """
+    counted = strict(sum_two.__wrapped__, stats=True)
+
+    assert counted.map([1, 2, 3], range(3)) == [1, 3, 5]
+    assert counted.batch([1, 2], b=(10, 20)) == [11, 22]
+    assert get_stats(counted).calls == 5
+    reset_stats(counted)
+    assert get_stats(counted).calls == 0
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [([1, 2, "3"], [1, 2, 3]), ([1, 2, 3], [1, True, 3]), ([1.0], [1])],
+    ids=[" str item ", " bool item ", " float column "],
+)
+def test_map_rejects_mismatched_items(a, b):
+    """
+    Tests that a column with an item of the wrong type is rejected before any call.
+    """
+    with pytest.raises(TypeError):
+        sum_two.map(a, b)
+
+
+def test_map_rejects_columns_of_different_length():
+    """
+    Tests that columns must have the same length.
+    """
+    with pytest.raises(ValueError):
+        sum_two.map([1, 2], [1])
+
+
+def test_batch_with_mixed_and_container_columns():
+    """
+    Tests union columns with mixed item types and per-item checks of container columns.
+    """
+
+    @strict
+    def describe(value: int | None, *, tags: list[str]) -> str:
+        return f"{value}:{','.join(tags)}"
+
+    assert describe.batch([1, None], tags=[["a"], []]) == ["1:a", "None:"]
+
+    with pytest.raises(TypeError):
+        describe.batch([1, None], tags=[["a"], [1]])
+
+    with pytest.raises(TypeError):
+        describe.map([1], [["a"]])
+
+
+def test_batch_in_off_mode_does_not_validate():
+    """
+    Tests that functions following an "off" default mode keep the batch API, without
+    validation.
+    """
+
+    @strict
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    previous = get_default_mode()
+    try:
+        set_default_mode("off")
+        assert add.map([1, 2.5], [1, 1]) == [2, 3.5]
+    finally:
+        set_default_mode(previous)
+    with pytest.raises(TypeError):
+        add.map([1, 2.5], [1, 1])
+
+
+def test_map_over_numpy_arrays():
+    """
+    Tests that NumPy columns are checked by dtype and passed on as Python scalars.
+    """
+    numpy = pytest.importorskip("numpy")
+
+    results = sum_two.map(numpy.arange(3), numpy.array([10, 20, 30], dtype="uint8"))
+    assert results == [10, 21, 32]
+    assert all(type(result) is int for result in results)
+
+    with pytest.raises(TypeError):
+        sum_two.map(numpy.arange(3, dtype=float), numpy.arange(3))
+
+    with pytest.raises(TypeError):
+        sum_two.map(numpy.array([1, "2"], dtype=object), numpy.arange(2))
+
+    with pytest.raises(ValueError):
+        sum_two.map(numpy.zeros((2, 2), dtype=int), numpy.arange(2))
@@ -0,0 +1,104 @@
+import inspect
+
+import pytest
+
+from task1.strict_types_decorator import strict
+
+
+def test_signature_is_validated_at_decoration_time():
+    """
+    Tests that an invalid signature is rejected when the decorator is applied,
+    not when the decorated function is called.
+    """
+    with pytest.raises(TypeError):
+
+        @strict
+        def with_default(a: int = 1):
+            return a
+
+    with pytest.raises(TypeError):
+
+        @strict
+        def without_annotation(a):
+            return a
+
+    with pytest.raises(TypeError):
+
+        @strict
+        def with_disallowed_type(a: bytes):
+            return a
+
+
+def test_wrapper_keeps_signature_and_metadata():
+    """
+    Tests that the generated wrapper exposes the signature and metadata of the original function.
+    """
+
+    def concat(a: str, /, b: str, *, c: str) -> str:
+        """Concatenates three strings."""
+        return a + b + c
+
+    wrapped = strict(concat)
+
+    assert wrapped.__name__ == "concat"
+    assert wrapped.__doc__ == concat.__doc__
+    assert inspect.signature(wrapped) == inspect.signature(concat)
+    assert wrapped("x", b="y", c="z") == "xyz"
+
+    with pytest.raises(TypeError):
+        wrapped(a="x", b="y", c="z")
+
+
+def test_variadic_arguments_are_checked():
+    """
+    Tests that every value passed through *args and **kwargs is checked.
+    """
+
+    @strict
+    def total(*args: int, **kwargs: int) -> int:
+        return sum(args) + sum(kwargs.values())
+
+    assert total(1, 2, x=3) == 6
+
+    with pytest.raises(TypeError):
+        total(1, 2.0)
+
+    with pytest.raises(TypeError):
+        total(1, x="3")
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [(True, 1), (1, True), (1.0, 1), (1, "1")],
+    ids=[" bool as int ", " int then bool ", " float as int ", " str as int "],
+)
+def test_argument_types_are_exact(a, b):
+    """
+    Tests that argument types must match the annotation exactly.
+    """
+
+    @strict
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    with pytest.raises(TypeError):
+        add(a, b)
+
+    with pytest.raises(TypeError):
+        add(a=a, b=b)
+
+
+def test_parameter_named_type():
+    """
+    Tests that a parameter named like a builtin used by the checks does not shadow it.
+    """
+
+    @strict
+    def describe(type: str) -> str:
+        return type
+
+    assert describe("a") == "a"
+    assert describe(type="a") == "a"
+
+    with pytest.raises(TypeError):
+        describe(1)
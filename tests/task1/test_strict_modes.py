@@ -0,0 +1,150 @@
+import pytest
+
+from task1.strict_modes import (
+    ALWAYS,
+    OFF,
+    first_n,
+    get_default_mode,
+    get_stats,
+    iter_stats,
+    reset_stats,
+    sample,
+    set_default_mode,
+)
+from task1.strict_types_decorator import TIMING_STRIDE, strict
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+def test_off_mode_returns_original_function():
+    """
+    Tests that an explicit "off" mode has no wrapper at all, but still checks the signature.
+    """
+    assert strict(mode="off")(add) is add
+    assert not hasattr(add, "map")
+    assert get_stats(add) is None
+
+    with pytest.raises(TypeError):
+
+        @strict(mode="off")
+        def with_default(a: int = 1):
+            return a
+
+
+def test_always_mode_counters():
+    """
+    Tests the counters of a function validated on every call.
+    """
+    wrapped = strict(mode="always", stats=True)(add)
+    calls = TIMING_STRIDE * 2 + 1
+
+    for _ in range(calls):
+        wrapped(1, 2)
+    with pytest.raises(TypeError):
+        wrapped(1, "2")
+
+    stats = get_stats(wrapped)
+    assert stats.mode == ALWAYS
+    assert stats.calls == calls + 1
+    assert stats.validations == calls + 1
+    assert stats.violations == 1
+    assert stats.validation_time > 0
+
+    reset_stats(wrapped)
+    assert get_stats(wrapped).calls == 0
+
+
+def test_first_n_mode_validates_only_first_calls():
+    """
+    Tests that "first_n" mode stops validating after n calls.
+    """
+    wrapped = strict(mode=first_n(2), stats=True)(add)
+
+    assert wrapped(1, 2) == 3
+    with pytest.raises(TypeError):
+        wrapped(1, 2.0)
+    assert wrapped(1, 2.0) == 3.0
+
+    stats = get_stats(wrapped)
+    assert (stats.calls, stats.validations, stats.violations) == (3, 2, 1)
+
+
+@pytest.mark.parametrize("rate, expected", [(0.0, 0), (1.0, 100)])
+def test_sample_mode_extremes(rate, expected):
+    """
+    Tests that "sample" mode validates no calls at rate 0 and every call at rate 1.
+    """
+    wrapped = strict(mode=sample(rate), stats=True)(add)
+
+    for _ in range(100):
+        wrapped(1, 2)
+
+    assert get_stats(wrapped).validations == expected
+
+
+def test_sample_mode_rate():
+    """
+    Tests that "sample" mode validates roughly the requested share of calls.
+    """
+    wrapped = strict(mode=sample(0.1), stats=True)(add)
+
+    for _ in range(10_000):
+        wrapped(1, 2)
+
+    assert 500 < get_stats(wrapped).validations < 1_500
+
+
+def test_default_mode_applies_to_decorated_functions():
+    """
+    Tests that the global default mode switch also applies to decorated functions.
+    """
+    previous = get_default_mode()
+    try:
+        set_default_mode("off")
+        following = strict(add, stats=True)
+        explicit = strict(mode="always", stats=True)(add)
+        assert following(1, 2.0) == 3.0
+
+        set_default_mode(first_n(1))
+        assert any(stats.function == add.__qualname__ for stats in iter_stats())
+        assert get_stats(following).mode == first_n(1)
+        assert get_stats(explicit).mode == ALWAYS
+        with pytest.raises(TypeError):
+            following(1, 2.0)
+        assert following(1, 2.0) == 3.0
+
+        set_default_mode("off")
+        assert following(1, 2.0) == 3.0
+        assert get_stats(following).calls == 0
+    finally:
+        set_default_mode(previous)
+
+
+def test_wrappers_without_stats_only_check():
+    """
+    Tests that wrappers without stats validate by mode and report no counters.
+    """
+    always = strict(mode="always")(add)
+    once = strict(mode=first_n(1))(add)
+
+    with pytest.raises(TypeError):
+        always(1, 2.0)
+    with pytest.raises(TypeError):
+        once(1, 2.0)
+    assert once(1, 2.0) == 3.0
+    assert get_stats(always) is None
+    assert get_stats(once) is None
+
+
+def test_invalid_modes_are_rejected():
+    """
+    Tests that unknown modes and out-of-range mode arguments raise ValueError.
+    """
+    with pytest.raises(ValueError):
+        strict(mode="sometimes")(add)
+    with pytest.raises(ValueError):
+        sample(1.5)
+    with pytest.raises(ValueError):
+        first_n(-1)
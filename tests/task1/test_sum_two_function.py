@@ -2,7 +2,7 @@ from typing import Any, Tuple
 
 import pytest
 
-from task1.strict_types_decorator import strict, sum_two
+from task1.decorated_funcs import sum_two
 
 
 def test_sum_two_positive_cases(get_sum_two_positive_case: Tuple[Any, Any]):
@@ -24,7 +24,7 @@ def test_sum_two_positive_cases(get_sum_two_positive_case: Tuple[Any, Any]):
 
 def test_sum_two_negative_cases(get_sum_two_negative_case: Tuple[Any, Any]):
     """
-    Tests that sum_twosum_two(a, b) raises a TypeError for invalid arguments.
+    Tests that sum_two(a, b) raises a TypeError for invalid arguments.
 
     For each test case in the "FAILED" group, verifies that calling sum_two(a, b)
     raises a TypeError as expected.
@@ -0,0 +1,151 @@
+from typing import Dict, List, Optional, Tuple, Union
+
+import pytest
+
+from task1.strict_types_decorator import strict
+from task1.type_checkers import clear_cache, compile_checker, compile_expression
+
+
+@pytest.mark.parametrize(
+    "annotation, value, expected",
+    [
+        (list[int], [1, 2, 3], True),
+        (list[int], [1, "2", 3], False),
+        (list[int], (1, 2, 3), False),
+        (dict[str, float], {"a": 1.0, "b": 2.5}, True),
+        (dict[str, float], {"a": 1}, False),
+        (int | None, None, True),
+        (int | None, 1, True),
+        (int | None, 1.0, False),
+        (tuple[int, ...], (1, 2, 3), True),
+        (tuple[int, ...], (1, 2, None), False),
+        (tuple[int, str], (1, "a"), True),
+        (tuple[int, str], (1, "a", 2), False),
+        (tuple[()], (), True),
+        (tuple[()], (1,), False),
+        (Tuple, (1, "a"), True),
+        (Tuple, (), True),
+        (Tuple, [1], False),
+        (list[list[int] | None], [[1], None, []], True),
+        (list[list[int] | None], [[1], [True]], False),
+        (set[str], {"a", "b"}, True),
+        (frozenset[bool], frozenset({1}), False),
+        (list, ["anything", 1], True),
+    ],
+)
+def test_checker_results(annotation, value, expected):
+    """
+    Tests that compiled checkers accept and reject values according to the annotation.
+    """
+    assert compile_checker(annotation, sample_size=None)(value) is expected
+
+
+def test_checkers_are_shared_between_equivalent_annotations():
+    """
+    Tests that identical and equivalent annotations share one checker object.
+    """
+    assert compile_checker(list[int]) is compile_checker(list[int])
+    assert compile_checker(list[int]) is compile_checker(List[int])
+    assert compile_checker(Dict[str, float]) is compile_checker(dict[str, float])
+    assert compile_checker(Optional[int]) is compile_checker(int | None)
+    assert compile_checker(Union[int, str]) is compile_checker(str | int)
+    assert compile_checker(Tuple[int, ...]) is compile_checker(tuple[int, ...])
+
+
+def test_nested_checks_call_the_container_checker():
+    """
+    Tests that container checkers are not wrapped, so nested checks call them directly.
+    """
+    clear_cache()
+    checker = compile_checker(list[int])
+    expression, namespace = compile_expression(list[int], "value")
+
+    assert expression.endswith("(value)")
+    assert list(namespace.values()) == [checker]
+    assert checker.__source__.startswith("def check(value):\n    if not _strict_type")
+    assert compile_checker(list[int] | None) is not checker
+
+
+def test_large_containers_are_sampled():
+    """
+    Tests that only a bounded sample of a large container is checked.
+    """
+    values = list(range(1_000_000))
+    values[1] = "not checked"
+
+    assert compile_checker(list[int], sample_size=8)(values)
+    assert not compile_checker(list[int], sample_size=None)(values)
+    assert not compile_checker(list[int], sample_size=3)([0] * 7 + ["x"])
+
+
+def test_max_depth_limits_nested_checks():
+    """
+    Tests that containers below `max_depth` are only checked for their own type.
+    """
+    assert compile_checker(list[list[int]], max_depth=1)([["x"]])
+    assert not compile_checker(list[list[int]], max_depth=1)([("x",)])
+    assert not compile_checker(list[list[int]], max_depth=2)([["x"]])
+
+
+def test_unsupported_annotation_is_rejected():
+    """
+    Tests that unsupported annotations raise TypeError when decorating.
+    """
+    with pytest.raises(TypeError):
+
+        @strict
+        def process(data: list[bytes]):
+            return data
+
+
+def test_strict_with_generic_annotations():
+    """
+    Tests the decorator with generic and union annotations, used bare and with options.
+    """
+
+    @strict
+    def scale(values: list[float], factor: float | None) -> list[float]:
+        return [value * (factor or 1.0) for value in values]
+
+    assert scale([1.0, 2.0], None) == [1.0, 2.0]
+    with pytest.raises(TypeError):
+        scale([1.0, 2], 2.0)
+
+    @strict(sample_size=None)
+    def first(values: tuple[int, ...]) -> int:
+        return values[0]
+
+    assert first((1, 2)) == 1
+    with pytest.raises(TypeError):
+        first((1, "2"))
+
+
+def test_parameters_named_like_annotation_classes():
+    """
+    Tests that parameters named like the annotation classes do not shadow them.
+    """
+
+    @strict
+    def pair(int: int, str: str, list: list[int] | None) -> tuple:
+        return int, str, list
+
+    assert pair(1, "a", [2]) == (1, "a", [2])
+    assert pair(int=1, str="a", list=None) == (1, "a", None)
+
+    with pytest.raises(TypeError):
+        pair(1, 2, None)
+
+
+def test_bare_tuple_accepts_any_tuple():
+    """
+    Tests that a bare `Tuple` annotation accepts tuples of any length.
+    """
+
+    @strict
+    def first(values: Tuple) -> int:
+        return values[0]
+
+    assert first((1, 2)) == 1
+
+    with pytest.raises(TypeError):
+        first([1, 2])
@@ -0,0 +1,34 @@
+from typing import Iterator
+
+import pytest
+from loguru import logger
+
+from tests.task2.corpus import SNAPSHOT_DIR, RecordedCorpus
+from tests.task2.pages import CategoryFixture, synthetic_names
+from tests.task2.stand_in_server import StandInServer
+
+
+@pytest.fixture
+def animals_category() -> CategoryFixture:
+    """
+    A category of 1050 synthetic animal names, 50 names per page.
+    """
+    return CategoryFixture(names=synthetic_names(1_050), page_size=50)
+
+
+@pytest.fixture
+def stand_in_server(animals_category: CategoryFixture) -> Iterator[StandInServer]:
+    """
+    Serves `animals_category` on a local port.
+    """
+    logger.remove()
+    with StandInServer(fixtures=[animals_category]) as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def snapshot_corpus() -> RecordedCorpus:
+    """
+    A snapshot of the first three synthetic animals category pages.
+    """
+    return RecordedCorpus.load(SNAPSHOT_DIR / "animals")
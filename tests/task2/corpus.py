@@ -0,0 +1,187 @@
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from urllib.parse import unquote, urlsplit
+
+from loguru import logger
+
+from task2.parser import WikiAnimalParser
+
+CORPUS_FORMAT_VERSION = 1
+SNAPSHOT_DIR = Path(__file__).parent / "snapshots"
+
+
+def corpus_key(url: str) -> str:
+    """
+    Normalizes a page URL into a corpus key: unquoted path and query, no host or fragment.
+
+    Args:
+        url (str): Absolute or relative URL, quoted or not.
+
+    Returns:
+        str: The key, e.g. "w/index.php?title=Категория:Животные_по_алфавиту&pagefrom=Б".
+    """
+    parts = urlsplit(url)
+    key = unquote(parts.path).lstrip("/")
+    if parts.query:
+        key += "?" + unquote(parts.query)
+    return key
+
+
+class RecordedCorpus:
+    """
+    Category pages saved from a crawl, served again by `StandInServer`.
+
+    A corpus is a directory of HTML files and a "manifest.json" that maps the URL of
+    every page to its file, with the names the parser extracted when it was recorded.
+    It has the `owns` / `render_url` interface of `CategoryFixture`.
+
+    "snapshots/animals" is a snapshot of synthetic stand-in pages, not of Wikipedia:
+    it pins what the extractors return for a fixed set of pages. Record real pages
+    with `record` to check the parser against the live markup.
+
+    Usage:
+        corpus = RecordedCorpus.load(SNAPSHOT_DIR / "animals")
+        with StandInServer([corpus]) as server:
+            WikiAnimalParser(server.base_url).parse(corpus.start_path)
+    """
+
+    def __init__(
+        self, start_path: str, pages: Dict[str, str], names: Dict[str, List[str]]
+    ) -> None:
+        """
+        Initializes the corpus.
+
+        Args:
+            start_path (str): Relative URL of the first page.
+            pages (Dict[str, str]): Page HTML by corpus key, in crawl order.
+            names (Dict[str, List[str]]): Recorded animal names by corpus key.
+        """
+        self.start_path = start_path
+        self.pages = pages
+        self.names = names
+
+    @property
+    def pages_count(self) -> int:
+        """Number of recorded pages."""
+        return len(self.pages)
+
+    @property
+    def all_names(self) -> List[str]:
+        """Recorded animal names of all pages, in crawl order."""
+        return [name for key in self.pages for name in self.names[key]]
+
+    def owns(self, url: str) -> bool:
+        """Checks whether a URL points to a recorded page."""
+        return corpus_key(url) in self.pages
+
+    def render_url(self, url: str) -> Optional[str]:
+        """
+        Returns the recorded page a URL points to.
+
+        Args:
+            url (str): Absolute or relative URL, quoted or not.
+
+        Returns:
+            Optional[str]: Page HTML, None if the page was not recorded.
+        """
+        return self.pages.get(corpus_key(url))
+
+    @classmethod
+    def load(cls, corpus_dir: Union[str, Path]) -> "RecordedCorpus":
+        """
+        Reads a corpus written by `record`.
+
+        Args:
+            corpus_dir (Union[str, Path]): Corpus directory.
+
+        Returns:
+            RecordedCorpus: The corpus.
+
+        Raises:
+            ValueError: If the manifest has another format version.
+        """
+        corpus_dir = Path(corpus_dir)
+        manifest = json.loads((corpus_dir / "manifest.json").read_text("utf-8"))
+        if manifest.get("version") != CORPUS_FORMAT_VERSION:
+            raise ValueError(f"{corpus_dir} has an unsupported corpus version")
+
+        pages, names = {}, {}
+        for page in manifest["pages"]:
+            pages[page["key"]] = (corpus_dir / page["file"]).read_text("utf-8")
+            names[page["key"]] = page["names"]
+        return cls(start_path=manifest["start_path"], pages=pages, names=names)
+
+
+def record(
+    base_url: str,
+    start_path: str,
+    corpus_dir: Union[str, Path],
+    max_pages: int = 3,
+    source: Optional[str] = None,
+) -> RecordedCorpus:
+    """
+    Crawls the first pages of a category and saves them as a corpus.
+
+    Args:
+        base_url (str): Base URL of the wiki, e.g. "https://ru.wikipedia.org/".
+        start_path (str): Relative URL of the first category page.
+        corpus_dir (Union[str, Path]): Output directory.
+        max_pages (int): Number of pages to record.
+        source (Optional[str]): Where the pages come from, for the manifest.
+
+    Returns:
+        RecordedCorpus: The recorded corpus.
+    """
+    corpus_dir = Path(corpus_dir)
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    pages, names, entries = {}, {}, []
+
+    with WikiAnimalParser(base_url=base_url) as parser:
+        relative_url = start_path
+        while relative_url and len(pages) < max_pages:
+            download = parser._download_page(relative_url)
+            page = parser._parse_download(
+                download, parser.extractor.extract(download.text)
+            )
+            key = corpus_key(relative_url)
+            file_name = f"page-{len(pages) + 1:03d}.html"
+            (corpus_dir / file_name).write_text(download.text, encoding="utf-8")
+
+            pages[key] = download.text
+            names[key] = page.page_names
+            entries.append({"key": key, "file": file_name, "names": page.page_names})
+            relative_url = page.next_page_relative_url
+
+    manifest = {
+        "version": CORPUS_FORMAT_VERSION,
+        "source": source or base_url,
+        "start_path": start_path,
+        "pages": entries,
+    }
+    (corpus_dir / "manifest.json").write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+    )
+    logger.info(f"Recorded {len(pages)} pages to {corpus_dir}")
+    return RecordedCorpus(start_path=start_path, pages=pages, names=names)
+
+
+def main() -> None:
+    """
+    Records the first pages of a category into a corpus, e.g. from ru.wikipedia.org.
+    """
+    argument_parser = argparse.ArgumentParser(description=main.__doc__)
+    argument_parser.add_argument("corpus_dir", type=Path)
+    argument_parser.add_argument("--base-url", default="https://ru.wikipedia.org/")
+    argument_parser.add_argument(
+        "--start-path", default="wiki/Категория:Животные_по_алфавиту"
+    )
+    argument_parser.add_argument("--pages", type=int, default=3)
+    args = argument_parser.parse_args()
+
+    record(args.base_url, args.start_path, args.corpus_dir, max_pages=args.pages)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+import random
+from html import escape
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+CATEGORY = "Категория:Животные_по_алфавиту"
+NEXT_PAGE_TEXT = "Следующая страница"
+PREVIOUS_PAGE_TEXT = "Предыдущая страница"
+
+_SYLLABLES = (
+    "ба ва га да жа за ка ла ма на па ра са та фа ха ци ше ю я ко ро ли ну ты зу мо пе"
+).split()
+
+
+class CategoryFixture:
+    """
+    Renders MediaWiki-like category listing pages for a sorted set of names.
+
+    Pages mimic the markup of ru.wikipedia.org: navigation chrome around the
+    "mw-pages" block, names grouped by first letter inside
+    "div.mw-category.mw-category-columns", and "Предыдущая/Следующая страница" links
+    with "pagefrom=" keys. Listings also accept "from=" start keys, like MediaWiki does.
+    """
+
+    def __init__(
+        self,
+        names: Iterable[str],
+        page_size: int = 200,
+        category: str = CATEGORY,
+        subcategories: Iterable[str] = (),
+        chrome_links: int = 300,
+    ) -> None:
+        """
+        Initializes the fixture.
+
+        Args:
+            names (Iterable[str]): Page titles listed in the category.
+            page_size (int): Titles per listing page.
+            category (str): Category title, e.g. "Категория:Животные_по_алфавиту".
+            subcategories (Iterable[str]): Subcategory titles, listed on the first page.
+            chrome_links (int): Number of navigation links around the listing.
+        """
+        self.names: List[str] = sorted(set(names))
+        self.page_size = page_size
+        self.category = category
+        self.subcategories: List[str] = sorted(subcategories)
+        self.chrome_links = chrome_links
+
+    @property
+    def start_path(self) -> str:
+        """Relative URL of the first listing page."""
+        return f"wiki/{self.category}"
+
+    @property
+    def pages_count(self) -> int:
+        """Number of listing pages."""
+        return max(1, -(-len(self.names) // self.page_size))
+
+    def page_path(self, start_key: str) -> str:
+        """
+        Returns the relative URL of the listing page starting at `start_key`.
+
+        Args:
+            start_key (str): The first listed title (or a prefix of it).
+
+        Returns:
+            str: The URL, as MediaWiki renders it in pagination links.
+        """
+        return f"/w/index.php?title={quote(self.category)}&pagefrom={quote(start_key)}#mw-pages"
+
+    def owns(self, url: str) -> bool:
+        """Checks whether a URL points to a listing page of this category."""
+        return self._parse_url(url) is not None
+
+    def render_url(self, url: str) -> Optional[str]:
+        """
+        Renders the page a URL points to.
+
+        Args:
+            url (str): Absolute or relative URL, quoted or not.
+
+        Returns:
+            Optional[str]: Page HTML, or None if the URL is not a page of this category.
+        """
+        start_key = self._parse_url(url)
+        if start_key is None:
+            return None
+        return self.render(start_key or None)
+
+    def render(self, start_key: Optional[str] = None) -> str:
+        """
+        Renders the listing page starting at the first title >= `start_key`.
+
+        Args:
+            start_key (Optional[str]): The start key, None for the first page.
+
+        Returns:
+            str: Page HTML.
+        """
+        start = 0
+        if start_key:
+            start = next(
+                (i for i, name in enumerate(self.names) if name >= start_key),
+                len(self.names),
+            )
+        page_names = self.names[start : start + self.page_size]
+        next_name = (
+            self.names[start + self.page_size]
+            if start + self.page_size < len(self.names)
+            else None
+        )
+
+        links = []
+        if start > 0:
+            previous = self.names[max(0, start - self.page_size)]
+            links.append(
+                f'(<a href="{escape(self._until_path(previous))}" '
+                f'title="{escape(self.category)}">{PREVIOUS_PAGE_TEXT}</a>)'
+            )
+        if next_name is not None:
+            links.append(
+                f'(<a href="{escape(self.page_path(next_name))}" '
+                f'title="{escape(self.category)}">{NEXT_PAGE_TEXT}</a>)'
+            )
+        navigation = " ".join(links)
+
+        subcategories = ""
+        if self.subcategories and not start_key:
+            subcategories = (
+                '<div id="mw-subcategories"><h2>Подкатегории</h2>'
+                '<div class="mw-category mw-category-columns">'
+                + _render_groups(self.subcategories)
+                + "</div></div>"
+            )
+
+        return (
+            "<!DOCTYPE html><html><head><title>"
+            f"{escape(self.category)}</title></head><body>"
+            + _render_chrome(self.chrome_links)
+            + '<div id="content"><div id="bodyContent">'
+            + subcategories
+            + '<div id="mw-pages"><h2>Страницы в категории</h2>'
+            + f"<p>Показано {len(page_names)} страниц из {len(self.names)}.</p>"
+            + navigation
+            + '<div lang="ru" dir="ltr" class="mw-content-ltr">'
+            + '<div class="mw-category mw-category-columns">'
+            + _render_groups(page_names)
+            + "</div></div>"
+            + navigation
+            + "</div></div></div>"
+            + _render_chrome(self.chrome_links // 3)
+            + "</body></html>"
+        )
+
+    def _until_path(self, start_key: str) -> str:
+        """Returns the URL of a "previous page" link."""
+        return f"/w/index.php?title={quote(self.category)}&pageuntil={quote(start_key)}#mw-pages"
+
+    def _parse_url(self, url: str) -> Optional[str]:
+        """Returns the start key of a listing URL ("" for the first page), None for other URLs."""
+        parts = urlsplit(url)
+        path = unquote(parts.path).lstrip("/")
+        query = parse_qs(parts.query)
+
+        if path == f"wiki/{self.category}":
+            pass
+        elif path == "w/index.php" and query.get("title", [""])[0] == self.category:
+            pass
+        else:
+            return None
+
+        for key in ("pagefrom", "from"):
+            if key in query:
+                return query[key][0]
+        return ""
+
+
+def synthetic_names(count: int, seed: int = 0) -> List[str]:
+    """
+    Generates distinct animal-like names.
+
+    Args:
+        count (int): Number of names.
+        seed (int): Random seed, so corpora are reproducible.
+
+    Returns:
+        List[str]: Capitalized names.
+    """
+    generator = random.Random(seed)
+    names: Dict[str, None] = {}
+    while len(names) < count:
+        length = generator.randint(2, 5)
+        name = "".join(generator.choice(_SYLLABLES) for _ in range(length))
+        names[name.capitalize()] = None
+    return list(names)
+
+
+def _render_groups(names: List[str]) -> str:
+    """Renders names grouped by first letter, like MediaWiki category columns."""
+    groups: Dict[str, List[str]] = {}
+    for name in names:
+        groups.setdefault(name.split(":")[-1][0].upper(), []).append(name)
+
+    rendered = []
+    for letter, group in groups.items():
+        items = "".join(
+            f'<li><a href="/wiki/{quote(name)}" title="{escape(name)}">{escape(name)}</a></li>'
+            for name in group
+        )
+        rendered.append(
+            f'<div class="mw-category-group"><h3>{escape(letter)}</h3><ul>{items}</ul></div>'
+        )
+    return "".join(rendered)
+
+
+def _render_chrome(links: int) -> str:
+    """Renders navigation links that the parser has to skip."""
+    items = "".join(
+        f'<li id="n-item-{i}"><a href="/wiki/Служебная:Страница_{i}" '
+        f'title="Служебная страница {i}">Страница {i}</a></li>'
+        for i in range(links)
+    )
+    return (
+        f'<div id="mw-navigation"><div class="vector-menu"><ul>{items}</ul></div></div>'
+    )
@@ -0,0 +1,212 @@
+import hashlib
+import random
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from tests.task2.pages import CategoryFixture
+
+LAST_MODIFIED = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+MAIN_PAGE = (
+    "<!DOCTYPE html><html><head><title>Заглавная страница</title></head>"
+    "<body><p>Добро пожаловать</p></body></html>"
+)
+
+
+class StandInServer:
+    """
+    Local HTTP server that serves fixture category pages instead of Wikipedia.
+
+    Speaks HTTP/1.1 with keep-alive, records every requested path and the client
+    connections, can add a fixed latency to every response and answers conditional
+    requests ("If-None-Match" / "If-Modified-Since") with "304 Not Modified".
+
+    Faults can be injected: random error responses at `error_rate`, "429 Too Many
+    Requests" past `max_rate` requests per second, and scripted ones with `fail_next`.
+
+    Usage:
+        with StandInServer([CategoryFixture(names)]) as server:
+            WikiAnimalParser(base_url=server.base_url)
+    """
+
+    def __init__(
+        self,
+        fixtures: Iterable[CategoryFixture],
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        max_rate: Optional[float] = None,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initializes the server (it starts on `start()` or on entering the context).
+
+        Args:
+            fixtures (Iterable[CategoryFixture]): Categories to serve.
+            latency (float): Seconds to wait before every response.
+            error_rate (float): Share of requests answered with `error_status`.
+            error_status (int): Status of random error responses.
+            max_rate (Optional[float]): Requests per second over which the server
+                answers "429 Too Many Requests" with "Retry-After: 1". No limit if None.
+            seed (int): Random seed of the injected errors.
+        """
+        self.fixtures: List[CategoryFixture] = list(fixtures)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.max_rate = max_rate
+        self.status_counts: Counter = Counter()
+        self._random = random.Random(seed)
+        self._recent: Deque[float] = deque()
+        self._scripted_faults: Deque[Tuple[int, Dict[str, str]]] = deque()
+        self.requests: List[str] = []
+        self.connections: Set[Tuple[str, int]] = set()
+        self.not_modified_count: int = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the running server, with a trailing slash."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "StandInServer":
+        """Starts serving on a free local port in a background thread."""
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def render(self, path: str) -> Optional[str]:
+        """
+        Renders the fixture page a request path points to.
+
+        Args:
+            path (str): Request path with query.
+
+        Returns:
+            Optional[str]: Page HTML, None if no fixture owns the path. The root path
+            answers with a main page.
+        """
+        if path == "/":
+            return MAIN_PAGE
+        for fixture in self.fixtures:
+            page = fixture.render_url(path)
+            if page is not None:
+                return page
+        return None
+
+    def _record(self, path: str, client_address: Tuple[str, int]) -> None:
+        """Records a requested path and the connection it came through."""
+        with self._lock:
+            self.requests.append(path)
+            self.connections.add(client_address)
+
+    def _count_not_modified(self) -> None:
+        """Counts a "304 Not Modified" answer."""
+        with self._lock:
+            self.not_modified_count += 1
+
+    def fail_next(
+        self, count: int, status: int = 503, retry_after: Optional[str] = None
+    ) -> None:
+        """
+        Answers the next requests with an error.
+
+        Args:
+            count (int): Number of failing requests.
+            status (int): Error status.
+            retry_after (Optional[str]): "Retry-After" header value, if any.
+        """
+        headers = {"Retry-After": retry_after} if retry_after is not None else {}
+        with self._lock:
+            self._scripted_faults.extend([(status, headers)] * count)
+
+    def _fault(self) -> Optional[Tuple[int, Dict[str, str]]]:
+        """Returns the injected error of the current request, if any."""
+        with self._lock:
+            if self._scripted_faults:
+                return self._scripted_faults.popleft()
+
+            if self.max_rate is not None:
+                now = time.monotonic()
+                while self._recent and self._recent[0] <= now - 1.0:
+                    self._recent.popleft()
+                if len(self._recent) >= self.max_rate:
+                    return 429, {"Retry-After": "1"}
+                self._recent.append(now)
+
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self.error_status, {}
+        return None
+
+    def _count_status(self, status: int) -> None:
+        """Counts a response status."""
+        with self._lock:
+            self.status_counts[status] += 1
+
+    def _handler_class(self) -> type:
+        """Builds the request handler class bound to this server."""
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                stand_in._record(self.path, self.client_address)
+                if stand_in.latency:
+                    time.sleep(stand_in.latency)
+
+                fault = stand_in._fault()
+                if fault is not None:
+                    status, headers = fault
+                    self._send(status, b"Injected fault", headers)
+                    return
+
+                page = stand_in.render(self.path)
+                if page is None:
+                    self._send(404, b"Not found")
+                    return
+
+                body = page.encode("utf-8")
+                etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+                validators = {"ETag": etag, "Last-Modified": LAST_MODIFIED}
+                if self.headers.get("If-None-Match") == etag:
+                    stand_in._count_not_modified()
+                    self._send(304, b"", validators)
+                else:
+                    self._send(200, body, validators)
+
+            def _send(self, status: int, body: bytes, headers=None) -> None:
+                stand_in._count_status(status)
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
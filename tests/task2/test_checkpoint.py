@@ -0,0 +1,127 @@
+import pytest
+import requests
+
+from task2.checkpoint import CrawlCheckpoint
+from task2.parser import WikiAnimalParser
+from tests.task2.pages import CategoryFixture
+from tests.task2.stand_in_server import StandInServer
+
+
+def _failing_after(parser: WikiAnimalParser, pages: int) -> None:
+    """
+    Makes the crawl of a parser fail on the page after `pages` fetched pages.
+    """
+    fetch_page_record = parser._fetch_page_record
+    fetched = []
+
+    def _fetch_page_record(relative_url):
+        if len(fetched) == pages:
+            raise requests.ConnectionError("Network blip")
+        fetched.append(relative_url)
+        return fetch_page_record(relative_url)
+
+    parser._fetch_page_record = _fetch_page_record
+
+
+def test_resume_after_failure(
+    stand_in_server: StandInServer, animals_category: CategoryFixture, tmp_path
+):
+    """
+    Tests that a resumed crawl refetches only the pages after the last checkpoint.
+    """
+    checkpoint = CrawlCheckpoint(tmp_path, every_pages=5)
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        _failing_after(parser, pages=12)
+        with pytest.raises(requests.ConnectionError):
+            parser.parse(
+                relative_url=animals_category.start_path, checkpoint=checkpoint
+            )
+
+    state = checkpoint.load()
+    assert state.parsed_pages_count == 10
+    assert state.extracted_names_count == 10 * animals_category.page_size
+    del stand_in_server.requests[:]
+
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        names = parser.parse(
+            relative_url=animals_category.start_path,
+            checkpoint=CrawlCheckpoint(tmp_path, every_pages=5),
+            resume=True,
+        )
+
+    assert names == animals_category.names
+    assert len(stand_in_server.requests) == animals_category.pages_count - 10
+    assert parser.parsed_pages_count == animals_category.pages_count
+    assert parser.extracted_names_count == len(animals_category.names)
+
+
+def test_resume_completed_crawl(
+    stand_in_server: StandInServer, animals_category: CategoryFixture, tmp_path
+):
+    """
+    Tests that resuming a completed crawl fetches nothing.
+    """
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        parser.parse(
+            relative_url=animals_category.start_path,
+            checkpoint=CrawlCheckpoint(tmp_path),
+        )
+    del stand_in_server.requests[:]
+
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        names = parser.parse(
+            relative_url=animals_category.start_path,
+            checkpoint=CrawlCheckpoint(tmp_path),
+            resume=True,
+        )
+
+    assert names == animals_category.names
+    assert stand_in_server.requests == []
+
+
+def test_without_resume_the_checkpoint_is_reset(
+    stand_in_server: StandInServer, animals_category: CategoryFixture, tmp_path
+):
+    """
+    Tests that a crawl that is not resumed starts at the first page.
+    """
+    checkpoint = CrawlCheckpoint(tmp_path)
+    for resume in (False, False, True):
+        with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+            names = parser.parse(
+                relative_url=animals_category.start_path,
+                checkpoint=checkpoint,
+                resume=resume,
+            )
+        assert names == animals_category.names
+
+    assert len(stand_in_server.requests) == 2 * animals_category.pages_count
+
+
+def test_unsaved_names_are_dropped(tmp_path):
+    """
+    Tests that names recorded after the last state write are not resumed.
+    """
+    checkpoint = CrawlCheckpoint(tmp_path, every_pages=2)
+    checkpoint.start(start_url="wiki/Категория:Животные")
+    checkpoint.record_page(["Аист"], "page-2", 1, 1)
+    checkpoint.record_page(["Бобр"], "page-3", 2, 2)
+    checkpoint.record_page(["Волк"], "page-4", 3, 3)
+    checkpoint.close()
+
+    state = checkpoint.start(start_url="wiki/Категория:Животные", resume=True)
+
+    assert state.next_url == "page-3"
+    assert checkpoint.names() == ["Аист", "Бобр"]
+    assert checkpoint.start(start_url="wiki/Категория:Растения", resume=True) is None
+    assert checkpoint.names() == []
+
+
+def test_sharded_crawls_are_not_checkpointed(tmp_path):
+    with WikiAnimalParser(base_url="http://localhost/") as parser:
+        with pytest.raises(ValueError):
+            parser.parse(
+                relative_url="wiki/Категория:Животные",
+                shard_prefixes=("А",),
+                checkpoint=CrawlCheckpoint(tmp_path),
+            )
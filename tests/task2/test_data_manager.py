@@ -0,0 +1,105 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from task2.bloom_filter import BloomFilter
+from task2.data_manager import DataStructurer, StreamingAggregator
+from task2.parser import WikiAnimalParser
+from tests.json_interaction import load_cases_from_json
+from tests.task2.pages import CategoryFixture, synthetic_names
+from tests.task2.stand_in_server import StandInServer
+
+ANIMALS_DATA_CASES = Path(__file__).parent / "cases" / "animals-data-cases.json"
+
+
+def _pandas_grouping(names) -> list:
+    """The former pandas implementation of `group_animals_by_first_letter`."""
+    unique_names = pd.Series(names).str.capitalize().drop_duplicates()
+    grouped = (
+        pd.DataFrame({"first_letter": unique_names.str[0]})
+        .value_counts()
+        .reset_index(name="count")
+        .sort_values(by="first_letter")
+    )
+    return list(grouped.itertuples(index=False, name=None))
+
+
+def test_aggregator_counts_animals_data_cases():
+    """Tests that the streaming aggregator counts names per first letter."""
+    cases = list(load_cases_from_json(file=ANIMALS_DATA_CASES, case_exp="PASSED"))
+    letters = {name: letter for case in cases for letter, name in case.items()}
+    expected = {}
+    for letter in letters.values():
+        expected[letter] = expected.get(letter, 0) + 1
+
+    aggregator = StreamingAggregator()
+    counted = aggregator.add_many(name for case in cases for name in case.values())
+
+    assert aggregator.snapshot() == dict(sorted(expected.items()))
+    assert counted == aggregator.unique_count == sum(expected.values())
+    assert not aggregator.add("ВОЛК")
+
+
+def test_data_structurer_matches_pandas_grouping():
+    """Tests that the structurer groups names by first letter as pandas does."""
+    names = synthetic_names(2_000, seed=5)
+    names = names + [name.lower() for name in names[:500]] + ["", "ёж", "Ёж"]
+
+    grouped = DataStructurer(data=names).group_animals_by_first_letter()
+
+    assert list(grouped.columns) == ["first_letter", "count"]
+    assert list(grouped.itertuples(index=False, name=None)) == _pandas_grouping(
+        [name for name in names if name]
+    )
+
+
+def test_data_structurer_without_names():
+    """Tests that the structurer handles an empty name list."""
+    grouped = DataStructurer(data=[]).group_animals_by_first_letter()
+
+    assert grouped.empty
+    assert list(grouped.columns) == ["first_letter", "count"]
+
+
+def test_approximate_dedup_is_bounded():
+    """Tests that approximate deduplication keeps memory bounded and counts close."""
+    names = synthetic_names(20_000, seed=11)
+    exact = StreamingAggregator()
+    approximate = StreamingAggregator(approximate_capacity=20_000, error_rate=0.01)
+
+    for aggregator in (exact, approximate):
+        aggregator.add_many(names)
+        aggregator.add_many(names[:5_000])
+
+    assert exact.unique_count == 20_000
+    assert 20_000 * 0.98 <= approximate.unique_count <= 20_000
+    assert approximate._seen.size_bytes < 30_000
+
+
+def test_bloom_filter_has_no_false_negatives():
+    """Tests that the Bloom filter finds every name added to it."""
+    bloom = BloomFilter(capacity=1_000, error_rate=0.01)
+    names = synthetic_names(1_000, seed=2)
+    for name in names:
+        bloom.add(name)
+
+    assert all(name in bloom for name in names)
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=0)
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=10, error_rate=1.0)
+
+
+def test_aggregator_fed_from_crawl(
+    stand_in_server: StandInServer, animals_category: CategoryFixture
+):
+    """Tests that names streamed from a crawl are aggregated as they arrive."""
+    aggregator = StreamingAggregator(capitalize=False)
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        for page_names in parser.iter_pages(animals_category.start_path):
+            aggregator.add_many(page_names)
+
+    assert list(aggregator.to_dataframe().itertuples(index=False, name=None)) == (
+        _pandas_grouping(animals_category.names)
+    )
@@ -0,0 +1,73 @@
+import pytest
+
+from task2.extractors import (
+    EXTRACTORS,
+    ExtractedPage,
+    LxmlExtractor,
+    get_extractor,
+)
+from tests.task2.pages import CategoryFixture, synthetic_names
+
+
+@pytest.fixture
+def category() -> CategoryFixture:
+    """
+    A category with subcategories, 100 names per page.
+    """
+    return CategoryFixture(
+        names=synthetic_names(250),
+        page_size=100,
+        subcategories=["Категория:Птицы", "Категория:Рыбы"],
+    )
+
+
+@pytest.mark.parametrize("name", list(EXTRACTORS))
+def test_extractors_agree_with_fixture(category: CategoryFixture, name: str):
+    """
+    Tests every backend on the first, a middle and the last page.
+    """
+    extractor = get_extractor(name)
+
+    first = extractor.extract(category.render())
+    assert first.titles == category.subcategories + category.names[:100]
+    assert first.next_page_relative_url == category.page_path(category.names[100])
+
+    middle = extractor.extract(category.render(category.names[100]))
+    assert middle.titles == category.names[100:200]
+    assert middle.next_page_relative_url == category.page_path(category.names[200])
+
+    last = extractor.extract(category.render(category.names[200]))
+    assert last == ExtractedPage(
+        titles=category.names[200:], next_page_relative_url=None
+    )
+
+
+@pytest.mark.parametrize("name", list(EXTRACTORS))
+@pytest.mark.parametrize(
+    "html",
+    [
+        "",
+        "<html><body><p>Нет такой категории</p></body></html>",
+        '<div id="mw-pages"><div class="mw-category mw-category-columns">'
+        '<ul><li>Без ссылки</li><li><a href="/wiki/X">Без title</a></li>'
+        '<li><a href="/wiki/Y" title="Як">Як</a></li></ul></div>'
+        "<a>Следующая страница</a></div>",
+    ],
+    ids=[" empty ", " no listing ", " malformed items "],
+)
+def test_extractors_skip_unexpected_markup(name: str, html: str):
+    """
+    Tests that items without links or titles and links without href are skipped.
+    """
+    page = get_extractor(name).extract(html)
+
+    assert page.next_page_relative_url is None
+    assert page.titles == (["Як"] if "Як" in html else [])
+
+
+def test_get_extractor():
+    extractor = LxmlExtractor()
+    assert get_extractor(extractor) is extractor
+    assert isinstance(get_extractor("lxml"), LxmlExtractor)
+    with pytest.raises(ValueError):
+        get_extractor("regex")
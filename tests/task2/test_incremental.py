@@ -0,0 +1,108 @@
+import random
+
+import pandas as pd
+
+from task2.data_manager import DataStructurer
+from task2.incremental import IncrementalAggregate
+from task2.page_cache import content_fingerprint
+from task2.parser import WikiAnimalParser
+from tests.task2.pages import CategoryFixture, synthetic_names
+from tests.task2.stand_in_server import StandInServer
+
+
+def _expected_counts(names) -> list:
+    grouped = DataStructurer(data=list(names)).group_animals_by_first_letter()
+    return list(grouped.itertuples(index=False, name=None))
+
+
+def _counts(aggregate: IncrementalAggregate) -> list:
+    return list(aggregate.to_dataframe().itertuples(index=False, name=None))
+
+
+def _update(aggregate: IncrementalAggregate, pages: dict) -> None:
+    for url, names in pages.items():
+        aggregate.update_page(url, content_fingerprint("|".join(names).encode()), names)
+    aggregate.finish()
+    aggregate.save()
+
+
+def test_diff_updates_match_full_recount(tmp_path):
+    """
+    Tests random page edits, moves and removals against a full recount.
+    """
+    generator = random.Random(7)
+    pool = synthetic_names(300, seed=3)
+    pages = {f"page-{i}": generator.sample(pool, 20) for i in range(10)}
+
+    for _ in range(15):
+        aggregate = IncrementalAggregate(tmp_path / "state.json")
+        _update(aggregate, pages)
+        assert _counts(aggregate) == _expected_counts(
+            name for names in pages.values() for name in names
+        )
+
+        url = generator.choice(sorted(pages))
+        edit = generator.choice(["rename", "duplicate", "drop page", "add page"])
+        if edit == "rename":
+            pages[url] = pages[url][1:] + [generator.choice(pool)]
+        elif edit == "duplicate":
+            pages[url] = pages[url] + pages[generator.choice(sorted(pages))][:3]
+        elif edit == "drop page" and len(pages) > 1:
+            del pages[url]
+        else:
+            pages[f"page-{len(pages) + 100}"] = generator.sample(pool, 5)
+
+
+def test_unchanged_pages_are_skipped(tmp_path):
+    pages = {"page-1": ["Аист", "Бобр"], "page-2": ["Волк", "аист"]}
+    _update(IncrementalAggregate(tmp_path / "state.json"), pages)
+
+    pages["page-2"] = ["Волк", "Выдра"]
+    aggregate = IncrementalAggregate(tmp_path / "state.json")
+    _update(aggregate, pages)
+
+    assert aggregate.changed_pages_count == 1
+    assert aggregate.added_names_count == 1
+    assert aggregate.removed_names_count == 0
+    assert _counts(aggregate) == [("А", 1), ("Б", 1), ("В", 2)]
+
+
+def test_empty_aggregate_exports_an_empty_frame(tmp_path):
+    frame = IncrementalAggregate(tmp_path / "state.json").to_dataframe()
+
+    assert frame.empty
+    assert list(frame.columns) == ["first_letter", "count"]
+
+
+def test_incremental_recrawl(
+    stand_in_server: StandInServer, animals_category: CategoryFixture, tmp_path
+):
+    """
+    Tests that a re-crawl only diffs the changed page and still counts every name.
+    """
+
+    def crawl() -> IncrementalAggregate:
+        aggregate = IncrementalAggregate(tmp_path / "state" / "beasts.json")
+        with WikiAnimalParser(
+            base_url=stand_in_server.base_url, cache_dir=tmp_path / "cache"
+        ) as parser:
+            for page in parser.iter_page_records(animals_category.start_path):
+                aggregate.update_page(page.url, page.fingerprint, page.page_names)
+        aggregate.finish()
+        aggregate.save()
+        return aggregate
+
+    first = crawl()
+    assert first.changed_pages_count == animals_category.pages_count
+    assert _counts(first) == _expected_counts(animals_category.names)
+
+    animals_category.names = animals_category.names[:-1] + ["Яяяя"]
+    second = crawl()
+
+    assert second.changed_pages_count == 1
+    assert second.added_names_count == second.removed_names_count == 1
+    assert _counts(second) == _expected_counts(animals_category.names)
+    pd.testing.assert_frame_equal(
+        second.to_dataframe(),
+        IncrementalAggregate(tmp_path / "state" / "beasts.json").to_dataframe(),
+    )
@@ -0,0 +1,52 @@
+import pytest
+from loguru import logger
+
+from task2.logger_config import LoggerConfigurator
+from task2.parser import WikiAnimalParser
+from tests.task2.pages import CategoryFixture
+from tests.task2.stand_in_server import StandInServer
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """Log file path; the configured sinks are removed after the test."""
+    yield tmp_path / "animal-crossing.log"
+    logger.complete()
+    logger.remove()
+
+
+def test_unknown_profile(log_file):
+    """Tests that an unknown log profile is rejected."""
+    with pytest.raises(ValueError, match="Unknown log profile"):
+        LoggerConfigurator(log_file=log_file, profile="verbose")
+
+
+def test_production_profile_skips_debug_formatting(log_file, capsys):
+    """Tests that the production profile never formats debug messages."""
+    LoggerConfigurator(log_file=log_file, profile="production").setup_logger()
+    formatted = []
+    logger.opt(lazy=True).debug("{}", lambda: formatted.append("debug"))
+    logger.opt(lazy=True).info("{}", lambda: formatted.append("info") or "visible")
+    logger.complete()
+
+    assert formatted == ["info"]
+    assert "visible" in log_file.read_text(encoding="utf-8")
+    assert "visible" in capsys.readouterr().out
+
+
+def test_debug_profile_logs_one_record_per_page(
+    log_file, stand_in_server: StandInServer, animals_category: CategoryFixture
+):
+    """Tests that the debug profile logs one names summary per crawled page."""
+    LoggerConfigurator(log_file=log_file, profile="debug").setup_logger()
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        names = parser.parse(relative_url=animals_category.start_path)
+    logger.complete()
+
+    summaries = [
+        line
+        for line in log_file.read_text(encoding="utf-8").splitlines()
+        if "Extracted 50 animals: " in line
+    ]
+    assert len(summaries) == animals_category.pages_count
+    assert summaries[0].endswith(", ".join(names[:50]))
@@ -0,0 +1,107 @@
+import json
+
+import pandas as pd
+import pytest
+
+from task2.data_manager import DataStructurer
+from task2.metrics import Histogram, PipelineMetrics
+from task2.parser import WikiAnimalParser
+from task2.pipeline import CrawlPipeline
+from task2.report_writer import CSVReportWriter
+from tests.task2.pages import CategoryFixture
+from tests.task2.stand_in_server import StandInServer
+
+
+def test_histogram_buckets_and_percentiles():
+    """Tests that a histogram exports its buckets, totals and percentiles."""
+    histogram = Histogram()
+    for value in [0, 0.3, 0.5, 3, 3, 4, 100]:
+        histogram.observe(value)
+
+    exported = histogram.to_dict()
+    assert exported["count"] == 7
+    assert exported["total"] == pytest.approx(110.8)
+    assert (exported["min"], exported["max"]) == (0, 100)
+    assert exported["buckets"] == [
+        {"le": 0.0, "count": 1},
+        {"le": 0.5, "count": 2},
+        {"le": 4.0, "count": 3},
+        {"le": 128.0, "count": 1},
+    ]
+    assert histogram.percentile(0.1) == 0.0
+    assert histogram.percentile(0.5) == 4.0
+    assert histogram.percentile(0.99) == 100
+    assert Histogram().to_dict() == {"count": 0, "total": 0.0}
+
+
+def test_registry_hook_and_dump(tmp_path):
+    """Tests that the registry calls its hook and dumps what it exports."""
+    observed = []
+    metrics = PipelineMetrics(hook=lambda name, value: observed.append(name))
+    metrics.increment("pages")
+    metrics.increment("pages", 2)
+    with metrics.timer("write_seconds"):
+        pass
+    metrics.set_info("scheduler", {"rate": 1.5})
+    metrics.dump(tmp_path / "metrics" / "run.json")
+
+    dumped = json.loads((tmp_path / "metrics" / "run.json").read_text())
+    assert dumped == metrics.to_dict()
+    assert dumped["counters"] == {"pages": 3}
+    assert dumped["histograms"]["write_seconds"]["count"] == 1
+    assert dumped["info"] == {"scheduler": {"rate": 1.5}}
+    assert observed == ["pages", "pages", "write_seconds"]
+
+
+@pytest.mark.parametrize("pipelined", [False, True], ids=[" sequential ", " pipeline "])
+def test_crawl_metrics(
+    stand_in_server: StandInServer,
+    animals_category: CategoryFixture,
+    tmp_path,
+    pipelined: bool,
+):
+    """Tests that a crawl records page, cache and timing metrics."""
+    pages_count = animals_category.pages_count
+    for run in range(2):
+        with WikiAnimalParser(
+            base_url=stand_in_server.base_url, cache_dir=tmp_path / "cache"
+        ) as parser:
+            if pipelined:
+                list(CrawlPipeline(parser).iter_pages(animals_category.start_path))
+            else:
+                list(parser.iter_pages(animals_category.start_path))
+        metrics = parser.metrics.to_dict()
+        histograms = metrics["histograms"]
+
+        assert histograms["fetch_seconds"]["count"] == pages_count
+        assert histograms["names_per_page"]["total"] == len(animals_category.names)
+        if run == 0:
+            # Every page is downloaded and parsed.
+            assert histograms["page_bytes"]["min"] > 0
+            assert histograms["parse_seconds"]["count"] == pages_count
+            assert "not_modified_pages" not in metrics["counters"]
+        else:
+            # The server answers "304 Not Modified": nothing is downloaded or parsed.
+            assert histograms["page_bytes"]["total"] == 0
+            assert "parse_seconds" not in histograms
+            assert metrics["counters"]["not_modified_pages"] == pages_count
+
+
+def test_aggregation_and_write_metrics(tmp_path):
+    """Tests that aggregation and report writes are timed."""
+    metrics = PipelineMetrics()
+    grouped = DataStructurer(
+        ["Волк", "волк", "Лиса"], metrics=metrics
+    ).group_animals_by_first_letter()
+    writer = CSVReportWriter(tmp_path, "beasts", metrics=metrics)
+    writer.write(grouped)
+    writer.write(pd.DataFrame())
+
+    exported = metrics.to_dict()
+    assert exported["histograms"]["aggregation_seconds"]["count"] == 1
+    assert exported["histograms"]["write_seconds"]["count"] == 1
+    assert (
+        exported["histograms"]["report_bytes"]["total"]
+        == writer.output_file_path.stat().st_size
+    )
+    assert exported["counters"]["report_rows"] == 2
@@ -0,0 +1,106 @@
+import time
+from collections import defaultdict
+
+import pytest
+from loguru import logger
+
+from task2.data_manager import CategoryAggregator
+from task2.parser import WikiAnimalParser
+from tests.task2.pages import CategoryFixture, synthetic_names
+from tests.task2.stand_in_server import StandInServer
+
+NAMES = synthetic_names(600)
+
+
+@pytest.fixture
+def categories() -> list:
+    """
+    Three overlapping categories of 6, 3 and 2 pages; the first lists the others.
+    """
+    logger.remove()
+    return [
+        CategoryFixture(
+            names=NAMES[:300],
+            page_size=50,
+            subcategories=["Категория:Птицы", "Категория:Рыбы"],
+        ),
+        CategoryFixture(
+            names=NAMES[250:400],
+            page_size=50,
+            category="Категория:Птицы",
+            subcategories=["Категория:Животные по алфавиту"],
+        ),
+        CategoryFixture(names=NAMES[380:], page_size=110, category="Категория:Рыбы"),
+    ]
+
+
+def _crawl(parser, start_urls, **kwargs) -> dict:
+    """Crawls categories and groups the fetched pages by their category."""
+    pages = defaultdict(list)
+    for category, page in parser.iter_category_pages(start_urls, **kwargs):
+        pages[category].append(page)
+    return pages
+
+
+def test_categories_share_one_pool(categories):
+    """Tests that pages of several categories are fetched on one worker pool."""
+    with StandInServer(categories, latency=0.05) as server:
+        with WikiAnimalParser(base_url=server.base_url) as parser:
+            started = time.monotonic()
+            pages = _crawl(
+                parser, [fixture.start_path for fixture in categories], max_workers=3
+            )
+            elapsed = time.monotonic() - started
+
+    for fixture in categories:
+        crawled = pages[fixture.start_path]
+        assert len(crawled) == fixture.pages_count
+        assert [name for page in crawled for name in page.page_names] == fixture.names
+    assert set(pages) == {fixture.start_path for fixture in categories}
+    # 11 pages: about 6 latencies for the longest category instead of 11 in a row.
+    assert elapsed < 9 * 0.05
+
+
+def test_subcategories_are_followed_once(categories):
+    """Tests that subcategories are followed to the given depth, each once."""
+    root = categories[0]
+    with StandInServer(categories) as server:
+        with WikiAnimalParser(base_url=server.base_url) as parser:
+            assert set(_crawl(parser, [root.start_path])) == {root.start_path}
+            pages = _crawl(parser, [root.start_path], subcategory_depth=1)
+
+    assert sorted(pages) == sorted(fixture.start_path for fixture in categories)
+    first_page = pages[root.start_path][0]
+    assert first_page.subcategories == ("Категория:Птицы", "Категория:Рыбы")
+    assert not any(name.startswith("Категория:") for name in first_page.page_names)
+    # The subcategory listing the root category back does not crawl it again.
+    assert len(pages[root.start_path]) == root.pages_count
+
+
+def test_names_are_deduplicated_across_categories(categories):
+    """Tests that names are counted once overall and once per category."""
+    with StandInServer(categories) as server:
+        with WikiAnimalParser(base_url=server.base_url) as parser:
+            aggregator = CategoryAggregator(capitalize=False)
+            for category, page in parser.iter_category_pages(
+                [categories[0].start_path], subcategory_depth=1
+            ):
+                aggregator.add_page(category, page.page_names)
+
+    assert aggregator.combined.unique_count == len(NAMES)
+    for fixture in categories:
+        per_category = aggregator.categories[fixture.start_path]
+        assert per_category.unique_count == len(fixture.names)
+    # Names shared by two categories count in both of them.
+    per_category_total = sum(
+        per_category.unique_count for per_category in aggregator.categories.values()
+    )
+    assert per_category_total == len(NAMES) + 50 + 20
+
+
+def test_failed_page_stops_the_crawl(categories):
+    """Tests that a missing category page fails the whole crawl."""
+    with StandInServer(categories[1:]) as server:
+        with WikiAnimalParser(base_url=server.base_url) as parser:
+            with pytest.raises(Exception, match="404"):
+                _crawl(parser, [fixture.start_path for fixture in categories])
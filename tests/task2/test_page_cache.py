@@ -0,0 +1,48 @@
+from task2.page_cache import CachedPage, PageCache
+
+URL = "https://ru.wikipedia.org/wiki/Категория:Животные_по_алфавиту"
+
+
+def _page(etag='"abc"', last_modified=None) -> CachedPage:
+    return CachedPage(
+        url=URL,
+        etag=etag,
+        last_modified=last_modified,
+        fingerprint="0" * 64,
+        page_names=["Аист", "Акула"],
+        next_page_relative_url="/w/index.php?pagefrom=Б",
+    )
+
+
+def test_store_and_load(tmp_path):
+    """Tests that a stored page is loaded back by its URL only."""
+    cache = PageCache(tmp_path)
+    cache.store(_page())
+
+    assert PageCache(tmp_path).load(URL) == _page()
+    assert cache.load(URL + "?from=Б") is None
+
+
+def test_pages_without_validators_are_not_stored(tmp_path):
+    """Tests that pages without an ETag or Last-Modified are not cached."""
+    cache = PageCache(tmp_path)
+    cache.store(_page(etag=None))
+
+    assert cache.load(URL) is None
+
+
+def test_conditional_headers():
+    """Tests that cached validators become conditional request headers."""
+    assert _page().conditional_headers() == {"If-None-Match": '"abc"'}
+    assert _page(
+        etag=None, last_modified="Mon, 01 Jan 2024 00:00:00 GMT"
+    ).conditional_headers() == {"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+
+def test_unreadable_entries_are_ignored(tmp_path):
+    """Tests that a corrupt cache entry is treated as a miss."""
+    cache = PageCache(tmp_path)
+    cache.store(_page())
+    cache._entry_path(URL).write_text("{broken", encoding="utf-8")
+
+    assert cache.load(URL) is None
@@ -1,47 +1,240 @@
+import sys
+import time
+from urllib.parse import urljoin
+
 import pytest
 import requests
-from bs4 import BeautifulSoup
-from loguru import logger
 
+from task2.extractors import EXTRACTORS
 from task2.parser import WikiAnimalParser
+from tests.task2.corpus import RecordedCorpus
+from tests.task2.pages import CategoryFixture
+from tests.task2.stand_in_server import StandInServer
 
 
 @pytest.mark.parametrize(
-    "base_url, url_suffix",
-    [
-        ("https://ru.wikipedia.org/", ""),
-        ("https://ru.wikipedia.org/", "wiki/Категория:Животные_по_алфавиту"),
-    ],
-    ids=[" base URL ", " start page URL "]
+    "url_suffix",
+    ["", "wiki/Категория:Животные_по_алфавиту"],
+    ids=[" base URL ", " start page URL "],
 )
-def test_status_code_200(base_url: str, url_suffix: str):
-    logger.remove()
-    parser = WikiAnimalParser(
-        base_url=base_url,
-        start_page_suffix=url_suffix,
+def test_status_code_200(stand_in_server: StandInServer, url_suffix: str):
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        response = parser._get_response(url=urljoin(parser.base_url, url_suffix))
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("extractor", list(EXTRACTORS))
+def test_snapshot_names(snapshot_corpus: RecordedCorpus, extractor: str):
+    """
+    Tests that every extractor still returns the names stored with the snapshot pages.
+    """
+    with StandInServer([snapshot_corpus]) as server:
+        with WikiAnimalParser(base_url=server.base_url, extractor=extractor) as parser:
+            names = parser.parse(relative_url=snapshot_corpus.start_path)
+
+    assert names == snapshot_corpus.all_names
+    assert parser.parsed_pages_count == snapshot_corpus.pages_count
+
+
+def test_iter_pages_yields_each_page(
+    stand_in_server: StandInServer, animals_category: CategoryFixture
+):
+    """
+    Tests that pages are yielded one by one without accumulating names in the parser.
+    """
+    parser = WikiAnimalParser(base_url=stand_in_server.base_url)
+    pages = parser.iter_pages(relative_url=animals_category.start_path)
+
+    first_page = next(pages)
+    assert first_page == animals_category.names[:50]
+    assert parser.parsed_pages_count == 1
+
+    remaining = list(pages)
+    assert len(remaining) == animals_category.pages_count - 1
+    assert remaining[-1] == animals_category.names[1_000:]
+    assert parser.animal_names == []
+
+
+def test_iter_names_and_parse_agree(
+    stand_in_server: StandInServer, animals_category: CategoryFixture
+):
+    """
+    Tests that streaming and collecting crawls extract the same names, with no recursion.
+    """
+    parser = WikiAnimalParser(base_url=stand_in_server.base_url)
+    streamed = list(parser.iter_names(relative_url=animals_category.start_path))
+
+    parser = WikiAnimalParser(base_url=stand_in_server.base_url)
+    previous_limit = sys.getrecursionlimit()
+    try:
+        sys.setrecursionlimit(100)
+        collected = parser.parse(relative_url=animals_category.start_path)
+    finally:
+        sys.setrecursionlimit(previous_limit)
+
+    assert streamed == collected == animals_category.names
+
+
+@pytest.mark.parametrize("extractor", list(EXTRACTORS))
+def test_extractor_backends_crawl_alike(
+    stand_in_server: StandInServer, animals_category: CategoryFixture, extractor: str
+):
+    """
+    Tests that every extractor backend crawls the same names.
+    """
+    with WikiAnimalParser(
+        base_url=stand_in_server.base_url, extractor=extractor
+    ) as parser:
+        names = parser.parse(relative_url=animals_category.start_path)
+
+    assert names == animals_category.names
+
+
+def test_session_keeps_connections_alive(
+    stand_in_server: StandInServer, animals_category: CategoryFixture
+):
+    """
+    Tests that a sequential crawl reuses one connection for all pages.
+    """
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        parser.parse(relative_url=animals_category.start_path)
+
+    assert len(stand_in_server.requests) == animals_category.pages_count
+    assert len(stand_in_server.connections) == 1
+
+
+def test_cached_crawl_revalidates_pages(
+    stand_in_server: StandInServer, animals_category: CategoryFixture, tmp_path
+):
+    """
+    Tests that a repeated crawl with the same cache gets "304 Not Modified" for every page.
+    """
+    with WikiAnimalParser(
+        base_url=stand_in_server.base_url, cache_dir=tmp_path
+    ) as parser:
+        first = parser.parse(relative_url=animals_category.start_path)
+    assert stand_in_server.not_modified_count == 0
+    assert parser.not_modified_pages_count == 0
+
+    with WikiAnimalParser(
+        base_url=stand_in_server.base_url, cache_dir=tmp_path
+    ) as parser:
+        second = parser.parse(relative_url=animals_category.start_path)
+
+    assert second == first == animals_category.names
+    assert stand_in_server.not_modified_count == animals_category.pages_count
+    assert parser.not_modified_pages_count == animals_category.pages_count
+    assert parser.parsed_pages_count == animals_category.pages_count
+
+
+def test_cached_crawl_sees_changed_pages(
+    stand_in_server: StandInServer, animals_category: CategoryFixture, tmp_path
+):
+    """
+    Tests that changed pages are downloaded again instead of taken from the cache.
+    """
+    with WikiAnimalParser(
+        base_url=stand_in_server.base_url, cache_dir=tmp_path
+    ) as parser:
+        parser.parse(relative_url=animals_category.start_path)
+
+    # Renaming the last title changes the last page only.
+    unchanged_pages_count = animals_category.pages_count - 1
+    animals_category.names = animals_category.names[:-1] + ["Яяяя"]
+    with WikiAnimalParser(
+        base_url=stand_in_server.base_url, cache_dir=tmp_path
+    ) as parser:
+        names = parser.parse(relative_url=animals_category.start_path)
+
+    assert names == animals_category.names
+    assert parser.not_modified_pages_count == unchanged_pages_count
+
+
+def test_http_errors_are_raised(stand_in_server: StandInServer):
+    """
+    Tests that an error status is raised instead of being parsed as an empty page.
+    """
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        with pytest.raises(requests.HTTPError):
+            parser.parse(relative_url="wiki/Категория:Несуществующая")
+
+
+def test_sharded_crawl_matches_sequential_crawl(
+    stand_in_server: StandInServer, animals_category: CategoryFixture
+):
+    """
+    Tests that a sharded crawl extracts every name exactly once.
+    """
+    parser = WikiAnimalParser(base_url=stand_in_server.base_url)
+    pages = list(parser.iter_pages_sharded(relative_url=animals_category.start_path))
+    names = [name for page in pages for name in page]
+
+    assert len(names) == len(set(names))
+    assert sorted(names) == animals_category.names
+    assert any("from=" in path for path in stand_in_server.requests)
+
+
+@pytest.mark.parametrize(
+    "prefixes",
+    [("Ё", "Б", "Щ", "К", "Ж"), ("Ка", "Ко", "Кс"), ()],
+    ids=[" unordered and empty prefixes ", " two-letter prefixes ", " single shard "],
+)
+def test_sharded_crawl_seams(
+    stand_in_server: StandInServer, animals_category: CategoryFixture, prefixes
+):
+    """
+    Tests seam deduplication with prefixes that have no names or are out of order.
+    """
+    parser = WikiAnimalParser(base_url=stand_in_server.base_url)
+    names = parser.parse(
+        relative_url=animals_category.start_path,
+        shard_prefixes=prefixes,
+        max_workers=3,
     )
-    assert requests.get(parser.start_page_url).status_code == 200
-
-
-# @pytest.mark.parametrize(
-#     "start_page_url",
-#     [("https://ru.wikipedia.org/wiki/Категория:Животные_по_алфавиту")],
-#     ids=[" start page animals "]
-# )
-# def test_start_page_li_elements(start_page_url: str):
-#     response = requests.get(url=start_page_url)
-#     soup = BeautifulSoup(response.text, "lxml")
-#     li_elements = soup.select("div.mw-category.mw-category-columns li")
-#     assert len(li_elements) != 0
-#
-#
-# @pytest.mark.parametrize(
-#     "start_page_url",
-#     [("https://ru.wikipedia.org/wiki/Категория:Животные_по_алфавиту")],
-#     ids=[" next page link"]
-# )
-# def test_start_page_a_element(start_page_url):
-#     response = requests.get(url=start_page_url)
-#     soup = BeautifulSoup(response.text, "lxml")
-#     next_page = soup.find("a", string="Следующая страница")
-#     assert next_page is not None
+
+    assert len(names) == len(set(names))
+    assert sorted(names) == animals_category.names
+
+
+def test_sharded_crawl_is_concurrent(
+    stand_in_server: StandInServer, animals_category: CategoryFixture
+):
+    """
+    Tests that shards overlap their network waits.
+    """
+    stand_in_server.latency = 0.05
+
+    parser = WikiAnimalParser(base_url=stand_in_server.base_url)
+    started = time.perf_counter()
+    sequential = parser.parse(relative_url=animals_category.start_path)
+    sequential_time = time.perf_counter() - started
+
+    parser = WikiAnimalParser(base_url=stand_in_server.base_url)
+    started = time.perf_counter()
+    sharded = parser.parse(
+        relative_url=animals_category.start_path,
+        shard_prefixes=("Б", "Г", "Ж", "К", "М", "П", "С", "Ф", "Ц"),
+        max_workers=10,
+    )
+    sharded_time = time.perf_counter() - started
+
+    assert sorted(sharded) == sorted(sequential)
+    assert sharded_time < sequential_time * 0.8
+
+
+def test_sharded_crawl_can_stop_early(
+    stand_in_server: StandInServer, animals_category: CategoryFixture
+):
+    """
+    Tests that closing the generator stops the shard workers.
+    """
+    parser = WikiAnimalParser(base_url=stand_in_server.base_url)
+    pages = parser.iter_pages_sharded(
+        relative_url=animals_category.start_path, max_workers=2
+    )
+
+    assert next(pages)
+    started = time.perf_counter()
+    pages.close()
+
+    assert time.perf_counter() - started < 1.0
@@ -0,0 +1,124 @@
+import time
+
+import pytest
+import requests
+
+from task2.checkpoint import CrawlCheckpoint
+from task2.parser import WikiAnimalParser
+from task2.pipeline import CrawlPipeline
+from tests.task2.pages import CategoryFixture
+from tests.task2.stand_in_server import StandInServer
+
+
+def test_pipeline_matches_sequential_crawl(
+    stand_in_server: StandInServer, animals_category: CategoryFixture
+):
+    """
+    Tests that pages come out complete and in crawl order.
+    """
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        expected = list(parser.iter_page_records(animals_category.start_path))
+
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        pipeline = CrawlPipeline(parser, queue_size=2, extract_workers=3)
+        records = list(pipeline.iter_page_records(animals_category.start_path))
+
+    assert records == expected
+    assert parser.parsed_pages_count == animals_category.pages_count
+    assert parser.extracted_names_count == len(animals_category.names)
+
+
+def test_pipeline_with_process_pool(
+    stand_in_server: StandInServer, animals_category: CategoryFixture
+):
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        pipeline = CrawlPipeline(parser, extract_processes=2)
+        pages = list(pipeline.iter_pages(animals_category.start_path))
+
+    assert [name for page in pages for name in page] == animals_category.names
+
+
+def test_pipeline_without_next_page_hint(
+    stand_in_server: StandInServer, animals_category: CategoryFixture, monkeypatch
+):
+    """
+    Tests the fallback to the extractor when the "Next page" link is not found early.
+    """
+    monkeypatch.setattr("task2.pipeline.find_next_page_link", lambda html: None)
+
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        pages = list(CrawlPipeline(parser).iter_pages(animals_category.start_path))
+
+    assert [name for page in pages for name in page] == animals_category.names
+
+
+def test_pipeline_overlaps_stages(
+    stand_in_server: StandInServer, animals_category: CategoryFixture
+):
+    """
+    Tests that network waits, parsing and a slow consumer overlap.
+    """
+    stand_in_server.latency = 0.03
+
+    def consume(pages) -> float:
+        started = time.perf_counter()
+        for _ in pages:
+            time.sleep(0.03)
+        return time.perf_counter() - started
+
+    with WikiAnimalParser(
+        base_url=stand_in_server.base_url, extractor="soup"
+    ) as parser:
+        sequential_time = consume(parser.iter_pages(animals_category.start_path))
+        pipeline = CrawlPipeline(parser)
+        pipelined_time = consume(pipeline.iter_pages(animals_category.start_path))
+
+    assert pipelined_time < sequential_time * 0.75
+
+
+def test_pipeline_raises_stage_errors(stand_in_server: StandInServer):
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        pipeline = CrawlPipeline(parser)
+        with pytest.raises(requests.HTTPError):
+            list(pipeline.iter_pages("wiki/Категория:Несуществующая"))
+
+
+def test_pipeline_can_stop_early(
+    stand_in_server: StandInServer, animals_category: CategoryFixture
+):
+    stand_in_server.latency = 0.01
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        pages = CrawlPipeline(parser, queue_size=1).iter_pages(
+            animals_category.start_path
+        )
+        assert next(pages)
+        started = time.perf_counter()
+        pages.close()
+
+    assert time.perf_counter() - started < 1.0
+    assert len(stand_in_server.requests) < animals_category.pages_count
+
+
+def test_pipeline_resumes_checkpoints(
+    stand_in_server: StandInServer, animals_category: CategoryFixture, tmp_path
+):
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        pages = CrawlPipeline(parser).iter_pages(
+            animals_category.start_path,
+            checkpoint=CrawlCheckpoint(tmp_path, every_pages=4),
+        )
+        for _ in range(6):
+            next(pages)
+        pages.close()
+
+    with WikiAnimalParser(base_url=stand_in_server.base_url) as parser:
+        checkpoint = CrawlCheckpoint(tmp_path, every_pages=4)
+        resumed = list(
+            CrawlPipeline(parser).iter_pages(
+                animals_category.start_path, checkpoint=checkpoint, resume=True
+            )
+        )
+
+    assert len(resumed) == animals_category.pages_count - 4
+    assert checkpoint.names() == animals_category.names
+    assert parser.parsed_pages_count == animals_category.pages_count
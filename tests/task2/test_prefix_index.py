@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from task2.data_manager import StreamingAggregator
+from task2.prefix_index import PrefixIndex
+from tests.task2.pages import synthetic_names
+
+
+@pytest.fixture
+def names() -> list:
+    """Synthetic names with duplicates, mixed case and shared prefixes."""
+    names = synthetic_names(3_000, seed=13)
+    return names + names[:100] + ["Питон", "питон тигровый", "Пищуха", "Я"]
+
+
+@pytest.fixture
+def index(names: list) -> PrefixIndex:
+    """Index of the names, built from unsorted input."""
+    return PrefixIndex.from_names(reversed(names))
+
+
+def test_queries_match_brute_force(names: list, index: PrefixIndex):
+    """Tests that prefix counts and listings match a linear scan."""
+    unique = sorted({name.capitalize() for name in names})
+    generator = random.Random(1)
+    prefixes = ["", "Пит", "пит", "Я", "Яя", "Щ"] + [
+        generator.choice(unique)[: generator.randint(1, 4)] for _ in range(200)
+    ]
+
+    for prefix in prefixes:
+        expected = [name for name in unique if name.startswith(prefix.capitalize())]
+        assert index.count(prefix) == len(expected), prefix
+        assert index.list(prefix) == expected, prefix
+
+    assert index.list("Пит") == ["Питон", "Питон тигровый"]
+    assert index.list("", limit=3) == unique[:3]
+    assert len(index) == len(unique)
+
+
+def test_prefix_counts(names: list, index: PrefixIndex):
+    """Tests that per-prefix counts agree with the first letter aggregation."""
+    aggregator = StreamingAggregator()
+    aggregator.add_many(names)
+
+    assert index.prefix_counts(1) == aggregator.snapshot()
+    assert sum(index.prefix_counts(3).values()) == len(index)
+    narrowed = index.prefix_counts(3, prefix="Пи")
+    assert narrowed == {
+        prefix: count
+        for prefix, count in index.prefix_counts(3).items()
+        if prefix.startswith("Пи")
+    }
+    assert narrowed["Пит"] == index.count("Пит")
+    with pytest.raises(ValueError):
+        index.prefix_counts(0)
+
+
+def test_save_and_load(index: PrefixIndex, tmp_path):
+    """Tests that a saved index loads back and a bad file is rejected."""
+    path = tmp_path / "state" / "beasts.index"
+    index.save(path)
+
+    loaded = PrefixIndex.load(path)
+    assert loaded.names == index.names
+    assert loaded.count("Пит") == 2
+
+    path.write_text("Аист\nБобр\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        PrefixIndex.load(path)
@@ -0,0 +1,180 @@
+import errno
+import gzip
+import json
+import os
+import re
+import stat
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from task2.report_writer import CSVReportWriter, ReportWriter
+
+ROWS = [("А", 3), ("Б", 1), ("Я", 12)]
+
+
+def report_names(report_dir: Path):
+    """Lists a report directory without the hidden index counters."""
+    return [name for name in os.listdir(report_dir) if not name.startswith(".")]
+
+
+def test_dataframe_csv_matches_pandas(tmp_path):
+    """A DataFrame report is the CSV pandas writes, without header."""
+    df = pd.DataFrame(ROWS, columns=["first_letter", "count"])
+    path = CSVReportWriter(tmp_path, "beasts").write(df)
+
+    assert path == tmp_path / "beasts.csv"
+    assert path.read_text(encoding="utf-8") == df.to_csv(index=False, header=False)
+    assert report_names(tmp_path) == ["beasts.csv"]
+
+
+def test_index_naming_lists_the_directory_once(tmp_path, monkeypatch):
+    """The next index is found with one listing, not one probe per name."""
+    for name in ["beasts.csv", "beasts(7).csv", "beasts(2).csv", "other(9).csv"]:
+        (tmp_path / name).touch()
+    writer = CSVReportWriter(tmp_path, "beasts")
+    monkeypatch.setattr(Path, "exists", lambda self: pytest.fail("probed a name"))
+
+    assert writer.write_rows(ROWS).name == "beasts(8).csv"
+    assert writer.write_rows(ROWS).name == "beasts(9).csv"
+
+
+def test_taken_name_is_skipped(tmp_path, monkeypatch):
+    """A name taken after it was chosen is skipped, never overwritten."""
+    (tmp_path / "beasts.csv").write_text("earlier report", encoding="utf-8")
+    # A concurrent writer publishes "beasts.csv" after the directory was listed.
+    monkeypatch.setattr(os, "listdir", lambda path: [])
+
+    path = CSVReportWriter(tmp_path, "beasts").write_rows(ROWS)
+
+    assert path.name == "beasts(1).csv"
+    assert (tmp_path / "beasts.csv").read_text(encoding="utf-8") == "earlier report"
+
+
+def test_concurrent_writers_get_unique_complete_reports(tmp_path):
+    """Concurrent writers publish complete reports under distinct names."""
+    paths = []
+
+    def write(letter: str) -> None:
+        rows = ((letter, count) for count in range(2_000))
+        paths.append(CSVReportWriter(tmp_path, "beasts").write_rows(rows))
+
+    threads = [threading.Thread(target=write, args=(letter,)) for letter in "АБВГДЕ"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(paths)) == 6
+    assert sorted(report_names(tmp_path)) == sorted(path.name for path in paths)
+    for path in paths:
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2_000 and len({line[0] for line in lines}) == 1
+
+
+def test_timestamp_naming(tmp_path):
+    """Timestamped names are unique, even within one microsecond."""
+    writer = ReportWriter(tmp_path, "beasts", report_format="jsonl", naming="timestamp")
+    first, second = writer.write_rows(ROWS), writer.write_rows(ROWS)
+
+    assert first != second
+    for path in (first, second):
+        assert re.fullmatch(
+            r"beasts-\d{8}T\d{6}\.\d{6}Z(-\d+)?\.jsonl", path.name
+        ), path.name
+
+
+@pytest.mark.parametrize("report_format", ["csv.gz", "jsonl", "jsonl.gz"])
+def test_formats(tmp_path, report_format: str):
+    """Every format writes the rows, gzip-compressed ones included."""
+    rows = (row for row in ROWS)
+    writer = ReportWriter(tmp_path, "beasts", report_format=report_format)
+    path = writer.write_rows(rows, columns=["first_letter", "count"])
+
+    assert path.name == f"beasts.{report_format}"
+    opener = gzip.open if report_format.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as file:
+        content = file.read()
+    if report_format.startswith("csv"):
+        assert content == "А,3\nБ,1\nЯ,12\n"
+    else:
+        assert [json.loads(line) for line in content.splitlines()] == [
+            {"first_letter": letter, "count": count} for letter, count in ROWS
+        ]
+    assert writer.metrics.counters["report_rows"] == len(ROWS)
+
+
+def test_jsonl_without_columns(tmp_path):
+    """JSON Lines rows without column names are written as arrays."""
+    path = ReportWriter(tmp_path, "beasts", report_format="jsonl").write_rows(ROWS)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [list(row) for row in ROWS]
+
+
+def test_nothing_written_without_rows(tmp_path):
+    """Empty DataFrames and row iterables publish no report."""
+    writer = CSVReportWriter(tmp_path, "beasts")
+    assert writer.write(pd.DataFrame()) is None
+    assert writer.write_rows(iter([])) is None
+    assert not tmp_path.exists() or not os.listdir(tmp_path)
+
+
+def test_failed_write_leaves_no_file(tmp_path):
+    """A failing row source leaves neither a report nor a temporary file."""
+
+    def rows():
+        yield from ROWS
+        raise RuntimeError("aggregation failed")
+
+    with pytest.raises(RuntimeError):
+        CSVReportWriter(tmp_path, "beasts").write_rows(rows())
+    assert os.listdir(tmp_path) == []
+
+
+def test_unknown_format(tmp_path):
+    """Unknown formats and naming schemes are rejected."""
+    with pytest.raises(ValueError, match="Unknown report format"):
+        ReportWriter(tmp_path, "beasts", report_format="xlsx")
+    with pytest.raises(ValueError, match="Unknown naming scheme"):
+        ReportWriter(tmp_path, "beasts", naming="random")
+
+
+def test_published_report_has_the_umask_mode(tmp_path):
+    """Reports get the usual 0o666 & ~umask mode, not an owner-only one."""
+    previous_umask = os.umask(0o027)
+    try:
+        path = CSVReportWriter(tmp_path, "beasts").write_rows(ROWS)
+    finally:
+        os.umask(previous_umask)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+
+def test_index_counter_replaces_the_listing(tmp_path, monkeypatch):
+    """Once a report is published, the next index comes from the counter file."""
+    writer = CSVReportWriter(tmp_path, "beasts")
+    assert writer.write_rows(ROWS).name == "beasts.csv"
+    assert (tmp_path / ".beasts.csv.last").read_text(encoding="utf-8") == "0"
+
+    monkeypatch.setattr(os, "listdir", lambda path: pytest.fail("listed reports"))
+    assert writer.write_rows(ROWS).name == "beasts(1).csv"
+    assert CSVReportWriter(tmp_path, "beasts").write_rows(ROWS).name == "beasts(2).csv"
+
+
+def test_copy_without_hard_links(tmp_path, monkeypatch):
+    """Without hard links, reports are copied to exclusively created names."""
+
+    def no_link(source, target):
+        raise OSError(errno.EPERM, "Operation not permitted")
+
+    monkeypatch.setattr(os, "link", no_link)
+    (tmp_path / "beasts.csv").write_text("earlier report", encoding="utf-8")
+    monkeypatch.setattr(os, "listdir", lambda path: [])
+
+    path = CSVReportWriter(tmp_path, "beasts").write_rows(ROWS)
+
+    assert path.name == "beasts(1).csv"
+    assert path.read_text(encoding="utf-8") == "А,3\nБ,1\nЯ,12\n"
+    assert (tmp_path / "beasts.csv").read_text(encoding="utf-8") == "earlier report"
+    assert not list(tmp_path.glob("*.tmp"))
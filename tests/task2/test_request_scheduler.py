@@ -0,0 +1,166 @@
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+
+from task2.parser import WikiAnimalParser
+from task2.request_scheduler import RequestScheduler
+from tests.task2.pages import CategoryFixture
+from tests.task2.stand_in_server import StandInServer
+
+
+def _response(status: int, **headers) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers)
+    response.url = "http://stand-in/"
+    return response
+
+
+def _script(*outcomes):
+    """Sends a request that answers with the next scripted status or exception."""
+    outcomes = list(outcomes)
+
+    def send():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return send
+
+
+def test_retries_until_success():
+    """Tests that failed requests are retried and slow the scheduler down once."""
+    scheduler = RequestScheduler(backoff_base=0.01, seed=1)
+    response = scheduler.request(
+        _script(_response(503), requests.ConnectionError(), _response(200))
+    )
+
+    stats = scheduler.stats()
+    assert response.status_code == 200
+    assert stats.retries_count == 2
+    assert stats.errors_count == 2
+    assert stats.throttled_count == 1
+    # Both failures fall within one cooldown: a single decrease.
+    assert stats.rate == 25.0 + scheduler.rate_increase
+    assert stats.concurrency_limit == 5
+
+
+def test_gives_up_after_max_retries():
+    """Tests that the last response or error is surfaced after the retries run out."""
+    scheduler = RequestScheduler(max_retries=2, backoff_base=0.01)
+    response = scheduler.request(_script(*[_response(502)] * 3))
+    assert response.status_code == 502
+
+    with pytest.raises(requests.Timeout):
+        scheduler.request(_script(*[requests.Timeout()] * 3))
+    assert scheduler.stats().retries_count == 4
+    assert scheduler.stats().in_flight == 0
+
+
+def test_not_retryable_statuses_are_returned():
+    """Tests that client errors are returned without retries."""
+    scheduler = RequestScheduler()
+    assert scheduler.request(_script(_response(404))).status_code == 404
+    assert scheduler.stats().retries_count == 0
+
+
+@pytest.mark.parametrize("http_date", [False, True], ids=[" seconds ", " HTTP date "])
+def test_retry_after_pauses_requests(http_date: bool):
+    """Tests that a Retry-After header delays the next attempt."""
+    retry_after = formatdate(time.time() + 1.3, usegmt=True) if http_date else "0.3"
+    scheduler = RequestScheduler(backoff_base=10.0)
+    started = time.monotonic()
+    scheduler.request(
+        _script(_response(429, **{"Retry-After": retry_after}), _response(200))
+    )
+
+    # HTTP dates have a one second resolution.
+    assert 0.25 <= time.monotonic() - started < 2.0
+
+
+def test_additive_increase():
+    """Tests that successes raise the rate and concurrency back up additively."""
+    scheduler = RequestScheduler(
+        initial_rate=10.0, rate_increase=1.0, max_concurrency=4, concurrency_window=5
+    )
+    scheduler.request(_script(_response(503), _response(200)))
+    assert scheduler.stats().concurrency_limit == 2
+
+    for _ in range(10):
+        scheduler.request(_script(_response(200)))
+
+    stats = scheduler.stats()
+    assert stats.rate == 5.0 + 11
+    assert stats.concurrency_limit == 4
+
+
+def test_rate_is_paced():
+    """Tests that requests are paced to the configured rate after a burst."""
+    scheduler = RequestScheduler(initial_rate=20.0, max_rate=20.0)
+    started = time.monotonic()
+    for _ in range(40):
+        scheduler.request(_script(_response(200)))
+
+    # A one second burst, then 20 requests per second.
+    assert 0.9 <= time.monotonic() - started < 1.5
+
+
+def test_concurrency_limit():
+    """Tests that no more requests than the concurrency limit are in flight."""
+    scheduler = RequestScheduler(max_concurrency=3)
+    in_flight, peak = [0], [0]
+    lock = threading.Lock()
+
+    def send():
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.02)
+        with lock:
+            in_flight[0] -= 1
+        return _response(200)
+
+    threads = [
+        threading.Thread(target=scheduler.request, args=(send,)) for _ in range(12)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 3
+
+
+def test_crawl_survives_random_errors(animals_category: CategoryFixture):
+    """Tests that a crawl completes through random server errors."""
+    scheduler = RequestScheduler(backoff_base=0.01, decrease_cooldown=0.0, seed=3)
+    with StandInServer([animals_category], error_rate=0.2, seed=5) as server:
+        with WikiAnimalParser(base_url=server.base_url, scheduler=scheduler) as parser:
+            names = parser.parse(relative_url=animals_category.start_path)
+
+    assert names == animals_category.names
+    assert server.status_counts[503] > 0
+    assert scheduler.stats().retries_count == server.status_counts[503]
+
+
+def test_sharded_crawl_adapts_to_server_limit(animals_category: CategoryFixture):
+    """
+    Tests that a throttling server slows the crawl down instead of failing it.
+    """
+    scheduler = RequestScheduler(initial_rate=100.0, max_rate=100.0, seed=7)
+    with StandInServer([animals_category], latency=0.01, max_rate=15) as server:
+        with WikiAnimalParser(base_url=server.base_url, scheduler=scheduler) as parser:
+            names = parser.parse(
+                relative_url=animals_category.start_path,
+                shard_prefixes=("Б", "Г", "Ж", "К", "М", "П", "С", "Ф", "Ц"),
+                max_workers=10,
+            )
+
+    stats = scheduler.stats()
+    assert sorted(names) == animals_category.names
+    assert stats.throttled_count == server.status_counts[429] > 0
+    assert stats.rate < 100.0
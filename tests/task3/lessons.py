@@ -0,0 +1,64 @@
+import random
+from typing import Dict, List
+
+
+def random_lesson(
+    rng: random.Random,
+    reconnects: int,
+    lesson_start: int = 1_000,
+    lesson_end: int = 5_000,
+) -> Dict[str, List[int]]:
+    """
+    Generates a lesson with flaky connections: overlapping, repeated and out-of-lesson
+    intervals for both roles.
+
+    Args:
+        rng (random.Random): Random generator.
+        reconnects (int): Intervals per role.
+        lesson_start (int): Start timestamp of the lesson.
+        lesson_end (int): End timestamp of the lesson.
+
+    Returns:
+        Dict[str, List[int]]: Lesson, pupil and tutor timestamps, as in
+        `task3/test_data.json`.
+    """
+
+    def role_timestamps() -> List[int]:
+        timestamps = []
+        for _ in range(reconnects):
+            login = rng.randint(lesson_start - 500, lesson_end + 500)
+            timestamps += [login, login + rng.randint(0, 400)]
+        return timestamps
+
+    return {
+        "lesson": [lesson_start, lesson_end],
+        "pupil": role_timestamps(),
+        "tutor": role_timestamps(),
+    }
+
+
+def random_lessons(
+    count: int, max_reconnects: int = 30, seed: int = 0
+) -> List[Dict[str, List[int]]]:
+    """
+    Generates lessons of one hour at increasing timestamps with flaky connections.
+
+    Args:
+        count (int): Number of lessons.
+        max_reconnects (int): Most intervals per role of a lesson.
+        seed (int): Random seed.
+
+    Returns:
+        List[Dict[str, List[int]]]: Lessons, as in `task3/test_data.json`.
+    """
+    rng = random.Random(seed)
+    lesson_start = 1_594_663_200
+    return [
+        random_lesson(
+            rng,
+            reconnects=rng.randint(1, max_reconnects),
+            lesson_start=lesson_start + index * 3_600,
+            lesson_end=lesson_start + (index + 1) * 3_600,
+        )
+        for index in range(count)
+    ]
@@ -0,0 +1,58 @@
+import random
+from typing import Dict, List
+
+import pytest
+
+from task3 import json_interaction
+from task3.solution import ENGINES, appearance
+from tests.task3.lessons import random_lesson
+
+TEST_DATA = json_interaction.TestDataManager()
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+@pytest.mark.parametrize(
+    "lesson_data, answer",
+    list(zip(TEST_DATA.lessons_data, TEST_DATA.test_answers)),
+)
+def test_appearance_matches_test_data(
+    lesson_data: Dict[str, List[int]], answer: int, engine: str
+):
+    """Every engine computes the expected durations of `task3/test_data.json`."""
+    assert appearance(lesson_data, engine=engine) == answer
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_sweep_matches_pairwise_engine(seed: int):
+    """The sweep engine agrees with the reference engine on random flaky lessons."""
+    rng = random.Random(seed)
+    lesson_data = random_lesson(rng, reconnects=rng.randint(1, 60))
+    assert appearance(lesson_data, engine="sweep") == appearance(
+        lesson_data, engine="pairwise"
+    )
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+@pytest.mark.parametrize(
+    "pupil, tutor, answer",
+    [
+        ([0, 50], [50, 100], 0),
+        ([0, 200], [150, 300], 0),
+        ([], [0, 100], 0),
+        ([0, 100], [10, 20, 20, 30], 20),
+        ([0, 100, 0, 100], [90, 150], 10),
+    ],
+    ids=["touching", "outside-lesson", "no-pupil", "adjacent-reconnects", "repeated"],
+)
+def test_appearance_edge_cases(
+    pupil: List[int], tutor: List[int], answer: int, engine: str
+):
+    """Empty overlaps count as zero; intervals are clipped to the lesson."""
+    lesson_data = {"lesson": [0, 100], "pupil": pupil, "tutor": tutor}
+    assert appearance(lesson_data, engine=engine) == answer
+
+
+def test_unknown_engine():
+    """An unknown engine name is rejected."""
+    with pytest.raises(ValueError, match="Unknown engine"):
+        appearance(TEST_DATA.lessons_data[0], engine="quadratic")
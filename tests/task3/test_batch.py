@@ -0,0 +1,74 @@
+import random
+
+import numpy as np
+import pytest
+
+from task3 import json_interaction
+from task3.batch import LessonBatch, batch_appearance
+from task3.solution import appearance
+from tests.task3.lessons import random_lesson, random_lessons
+
+TEST_DATA = json_interaction.TestDataManager()
+
+
+def test_batch_appearance_matches_test_data():
+    """The batch durations of `task3/test_data.json` are the expected answers."""
+    durations = batch_appearance(LessonBatch.from_lessons(TEST_DATA.lessons_data))
+    assert durations.dtype == np.int64
+    assert durations.tolist() == TEST_DATA.test_answers
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_appearance_matches_appearance(seed: int):
+    """A batch of random lessons gets the durations of per-lesson `appearance` calls."""
+    rng = random.Random(seed)
+    lessons_data = []
+    for _ in range(200):
+        lesson_start = rng.randint(0, 10**9)
+        lesson_data = random_lesson(
+            rng,
+            reconnects=rng.randint(0, 40),
+            lesson_start=lesson_start,
+            lesson_end=lesson_start + rng.randint(0, 4_000),
+        )
+        lessons_data.append(lesson_data)
+
+    durations = batch_appearance(LessonBatch.from_lessons(lessons_data))
+    assert durations.tolist() == [appearance(lesson) for lesson in lessons_data]
+
+
+def test_batch_appearance_empty_lessons():
+    """Empty batches and lessons without connections are handled."""
+    assert batch_appearance(LessonBatch.from_lessons([])).tolist() == []
+
+    lessons_data = [
+        {"lesson": [0, 100], "pupil": [], "tutor": [0, 100]},
+        {"lesson": [0, 100], "pupil": [0, 50, 60], "tutor": [40, 200]},
+    ]
+    batch = LessonBatch.from_lessons(lessons_data)
+    assert batch.pupil_offsets.tolist() == [0, 0, 2]
+    assert batch_appearance(batch).tolist() == [0, 10]
+
+
+def test_batch_appearance_rejects_unpaired_timestamps():
+    """Every lesson of a hand-built batch must have login and logout pairs."""
+    batch = LessonBatch(
+        lessons=np.array([[0, 100]], dtype=np.int64),
+        pupil=np.array([0, 50, 60], dtype=np.int64),
+        pupil_offsets=np.array([0, 3], dtype=np.int64),
+        tutor=np.array([0, 100], dtype=np.int64),
+        tutor_offsets=np.array([0, 2], dtype=np.int64),
+    )
+    with pytest.raises(ValueError, match="pairs"):
+        batch_appearance(batch)
+
+
+def test_batch_chunk_and_lesson():
+    """Chunks are batches of their own; single lessons unpack to the input format."""
+    lessons_data = random_lessons(10, seed=3)
+    batch = LessonBatch.from_lessons(lessons_data)
+
+    chunk = batch.chunk(3, 7)
+    assert chunk.lessons_count == 4
+    assert [chunk.lesson(index) for index in range(4)] == lessons_data[3:7]
+    assert batch_appearance(chunk).tolist() == batch_appearance(batch)[3:7].tolist()
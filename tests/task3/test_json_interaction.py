@@ -0,0 +1,84 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from task3.json_interaction import LessonRecord, TestDataManager
+from tests.task3.lessons import random_lessons
+
+RECORD = '{"intervals": {}, "answer": 0}'
+
+
+@pytest.fixture
+def test_cases():
+    """Test cases in the `task3/test_data.json` format."""
+    return [
+        {"intervals": lesson, "answer": index}
+        for index, lesson in enumerate(random_lessons(25, max_reconnects=5))
+    ]
+
+
+@pytest.fixture
+def array_file(tmp_path: Path, test_cases) -> Path:
+    """The test cases as an indented JSON array."""
+    path = tmp_path / "lessons.json"
+    path.write_text(json.dumps(test_cases, indent=4), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def lines_file(tmp_path: Path, test_cases) -> Path:
+    """The test cases as JSON Lines, with a blank line."""
+    path = tmp_path / "lessons.jsonl"
+    lines = [json.dumps(test_case) for test_case in test_cases]
+    path.write_text("\n".join(lines[:3] + [""] + lines[3:]) + "\n", encoding="utf-8")
+    return path
+
+
+def expected_records(test_cases):
+    return [LessonRecord(case["intervals"], case["answer"]) for case in test_cases]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_iter_records_streams_json_array(array_file: Path, test_cases, chunk_size: int):
+    """Items cut at any chunk boundary are decoded whole, in file order."""
+    manager = TestDataManager(json_file=array_file, chunk_size=chunk_size)
+    assert list(manager.iter_records()) == expected_records(test_cases)
+
+
+def test_iter_records_streams_json_lines(lines_file: Path, test_cases):
+    """JSON Lines files are read one line at a time; blank lines are skipped."""
+    manager = TestDataManager(json_file=lines_file)
+    assert list(manager.iter_records()) == expected_records(test_cases)
+    assert manager.test_answers == [case["answer"] for case in test_cases]
+
+
+def test_iter_batches(array_file: Path, test_cases):
+    """Batches pack the streamed lessons; the last batch holds the rest."""
+    batches = list(TestDataManager(json_file=array_file).iter_batches(10))
+    assert [batch.lessons_count for batch, _ in batches] == [10, 10, 5]
+    assert [answer for _, answers in batches for answer in answers] == list(range(25))
+    assert batches[2][0].lesson(0) == test_cases[20]["intervals"]
+
+
+def test_default_test_data_is_loaded_lazily():
+    """The bundled test data is only read on first access, and streams the same."""
+    manager = TestDataManager()
+    assert "test_data" not in vars(manager)
+    assert [record.answer for record in manager.iter_records()] == manager.test_answers
+    assert [record.intervals for record in manager.iter_records()] == (
+        manager.lessons_data
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    [RECORD, f"[{RECORD} {RECORD}]", f"[{RECORD}]x", f"[{RECORD},]", f"[{RECORD}"],
+    ids=["not-array", "no-separator", "trailing-data", "trailing-comma", "truncated"],
+)
+def test_iter_records_rejects_malformed_arrays(tmp_path: Path, text: str):
+    """Anything but one JSON array is rejected."""
+    path = tmp_path / "broken.json"
+    path.write_text(text, encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(TestDataManager(json_file=path, chunk_size=2).iter_records())
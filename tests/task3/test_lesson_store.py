@@ -0,0 +1,104 @@
+import json
+import os
+import stat
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from task3.batch import batch_appearance
+from task3.lesson_store import LessonStore, convert_json
+from task3.solution import appearance
+from tests.task3.lessons import random_lessons
+
+
+@pytest.fixture
+def test_cases():
+    """Test cases with their computed durations as answers."""
+    return [
+        {"intervals": lesson, "answer": appearance(lesson)}
+        for lesson in random_lessons(30, max_reconnects=8, seed=5)
+    ]
+
+
+@pytest.fixture
+def store(tmp_path: Path, test_cases) -> LessonStore:
+    """The test cases converted in several batches."""
+    json_file = tmp_path / "lessons.json"
+    json_file.write_text(json.dumps(test_cases), encoding="utf-8")
+    return LessonStore(convert_json(json_file, tmp_path / "lessons.lessons", 7))
+
+
+def test_store_round_trip(store: LessonStore, test_cases):
+    """Every lesson and answer reads back as converted."""
+    assert len(store) == len(test_cases)
+    for record, test_case in zip(store.iter_records(), test_cases):
+        assert {role: values.tolist() for role, values in record.intervals.items()} == (
+            test_case["intervals"]
+        )
+        assert record.answer == test_case["answer"]
+
+
+def test_store_views_are_memory_mapped(store: LessonStore):
+    """Lessons are views into the mapped file, not copies."""
+    assert isinstance(store.batch.pupil, np.memmap)
+    assert np.shares_memory(store.lesson(3)["pupil"], store.batch.pupil)
+    chunk, _ = next(store.iter_batches(10))
+    assert np.shares_memory(chunk.tutor, store.batch.tutor)
+
+
+def test_store_feeds_scorers(store: LessonStore):
+    """`appearance` takes lesson views; batch scorers take the whole store or chunks."""
+    answers = store.answers.tolist()
+    assert [appearance(record.intervals) for record in store.iter_records()] == answers
+    assert batch_appearance(store.batch).tolist() == answers
+
+    batches = list(store.iter_batches(8))
+    assert [chunk.lessons_count for chunk, _ in batches] == [8, 8, 8, 6]
+    for chunk, chunk_answers in batches:
+        assert batch_appearance(chunk).tolist() == chunk_answers.tolist()
+
+
+def test_convert_json_lines_and_empty_data(tmp_path: Path):
+    """JSON Lines convert as arrays do; an empty dataset makes an empty store."""
+    lines_file = tmp_path / "lessons.jsonl"
+    lines_file.write_text(
+        '{"intervals": {"lesson": [0, 10], "pupil": [0, 5], "tutor": [2, 9]}, "answer": 3}\n',
+        encoding="utf-8",
+    )
+    store = LessonStore(convert_json(lines_file, tmp_path / "lines.lessons"))
+    assert batch_appearance(store.batch).tolist() == store.answers.tolist() == [3]
+
+    empty_file = tmp_path / "empty.json"
+    empty_file.write_text("[]", encoding="utf-8")
+    empty = LessonStore(convert_json(empty_file, tmp_path / "empty.lessons"))
+    assert len(empty) == 0
+    assert batch_appearance(empty.batch).tolist() == []
+
+
+def test_store_has_the_umask_mode(tmp_path: Path, test_cases):
+    """Stores get the usual 0o666 & ~umask mode, so other users can map them."""
+    json_file = tmp_path / "lessons.json"
+    json_file.write_text(json.dumps(test_cases), encoding="utf-8")
+    previous_umask = os.umask(0o027)
+    try:
+        store_path = convert_json(json_file, tmp_path / "lessons.lessons")
+    finally:
+        os.umask(previous_umask)
+    assert stat.S_IMODE(store_path.stat().st_mode) == 0o640
+
+
+@pytest.mark.parametrize("damage", ["magic", "version", "truncated"])
+def test_store_rejects_damaged_files(store: LessonStore, damage: str):
+    """Other files, other format versions and truncated stores are rejected."""
+    data = bytearray(store.path.read_bytes())
+    if damage == "magic":
+        data[:8] = b"NOTSTORE"
+    elif damage == "version":
+        data[8] = 99
+    else:
+        data = data[:-8]
+    store.path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError):
+        LessonStore(store.path)
@@ -0,0 +1,64 @@
+import pytest
+
+from task3 import json_interaction
+from task3.batch import LessonBatch
+from task3.parallel import PARALLEL_ENGINES, ParallelScorer
+from task3.solution import appearance
+from tests.task3.lessons import random_lessons
+
+TEST_DATA = json_interaction.TestDataManager()
+
+
+@pytest.fixture(scope="module")
+def lessons_data():
+    """Random lessons, more than one chunk of them."""
+    return random_lessons(250, max_reconnects=20, seed=7)
+
+
+@pytest.mark.parametrize("engine", PARALLEL_ENGINES)
+def test_parallel_scores_in_input_order(lessons_data, engine: str):
+    """A pool of workers returns the per-lesson durations, in input order."""
+    scorer = ParallelScorer(workers=2, chunk_size=30, engine=engine)
+    assert scorer.score(lessons_data) == [appearance(lesson) for lesson in lessons_data]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_matches_test_data(workers: int):
+    """Both the in-process and the pool path give the expected answers."""
+    scorer = ParallelScorer(workers=workers, chunk_size=1)
+    assert scorer.score(TEST_DATA.lessons_data) == TEST_DATA.test_answers
+
+
+def test_parallel_score_batch(lessons_data):
+    """Packed batches are scored without unpacking them first."""
+    batch = LessonBatch.from_lessons(lessons_data)
+    durations = ParallelScorer(workers=2, chunk_size=100).score_batch(batch)
+    assert durations.tolist() == [appearance(lesson) for lesson in lessons_data]
+
+
+def test_parallel_scorer_reuses_its_pool(lessons_data):
+    """A context-managed scorer scores a stream of batches on one pool."""
+    expected = [appearance(lesson) for lesson in lessons_data]
+    with ParallelScorer(workers=2, chunk_size=30) as scorer:
+        executor = scorer._executor
+        for start, stop in [(0, 100), (100, 110), (110, 250)]:
+            batch = LessonBatch.from_lessons(lessons_data[start:stop])
+            assert scorer.score_batch(batch).tolist() == expected[start:stop]
+        assert scorer._executor is executor is not None
+    assert scorer._executor is None
+
+
+def test_parallel_empty_dataset():
+    """An empty dataset starts no pool and scores nothing."""
+    assert ParallelScorer(workers=2).score([]) == []
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"engine": "quadratic"}, {"workers": 0}, {"chunk_size": 0}],
+    ids=["engine", "workers", "chunk-size"],
+)
+def test_parallel_rejects_invalid_options(options):
+    """Unknown engines and non-positive sizes are rejected."""
+    with pytest.raises(ValueError):
+        ParallelScorer(**options)
@@ -0,0 +1,36 @@
+from benchmarks.timing import find_regressions
+
+
+def test_find_regressions_gates_on_tolerance():
+    """
+    Tests that only cases degraded past the tolerance are reported.
+    """
+    baseline = {"fast": {"ratio": 2.0}, "slow": {"ratio": 2.0}}
+    current = {"fast": {"ratio": 2.4}, "slow": {"ratio": 2.8}, "new": {"ratio": 9.0}}
+
+    regressions = find_regressions(current, baseline, metric="ratio", tolerance=0.3)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("slow:")
+
+
+def test_find_regressions_for_throughput_metrics():
+    """
+    Tests that throughput-like metrics regress when they drop.
+    """
+    baseline = {"crawl": {"pages_per_second": 100.0}}
+
+    assert find_regressions(
+        {"crawl": {"pages_per_second": 60.0}},
+        baseline,
+        metric="pages_per_second",
+        tolerance=0.3,
+        higher_is_better=True,
+    )
+    assert not find_regressions(
+        {"crawl": {"pages_per_second": 90.0}},
+        baseline,
+        metric="pages_per_second",
+        tolerance=0.3,
+        higher_is_better=True,
+    )